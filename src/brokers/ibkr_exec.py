@@ -2,6 +2,7 @@
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
 from ib_insync import LimitOrder, MarketOrder, Stock
 
 from src.core.config import AppConfig
@@ -27,6 +28,18 @@ class IBKRExecutor:
         self.config = config
         self.compliance = ComplianceChecker(config)
 
+        # ib_insync fills contracts in place (e.g. conId on qualification), so they
+        # are cached per executor and dropped whenever the client (re)connects
+        self._contracts: dict[str, Stock] = {}
+        ibkr_client.ib.connectedEvent += self._contracts.clear
+
+    def _contract_for(self, symbol: str) -> Stock:
+        """SMART-routed USD stock contract for a symbol, reused across this executor's orders."""
+        contract = self._contracts.get(symbol)
+        if contract is None:
+            contract = self._contracts[symbol] = Stock(symbol, "SMART", "USD")
+        return contract
+
     def calculate_target_notional(
         self,
         weights: dict[str, float],
@@ -42,9 +55,8 @@ class IBKRExecutor:
         Returns:
             Target notional value
         """
-        total_weight = sum(weights.values())
-        target_notional = equity * total_weight
-        return target_notional
+        weight_values = np.fromiter(weights.values(), dtype=np.float64, count=len(weights))
+        return float(equity * weight_values.sum())
 
     def weights_to_orders(
         self,
@@ -70,57 +82,48 @@ class IBKRExecutor:
         if current_positions is None:
             current_positions = {}
 
-        orders = []
-
-        for symbol, target_weight in weights.items():
-            try:
-                # Calculate target notional
-                target_notional = equity * target_weight
-
-                # Get current position quantity
-                current_qty = current_positions.get(symbol, 0.0)
-
-                # Calculate target quantity (fractional)
-                # In real implementation, would fetch current price from IBKR
-                # For now, use placeholder price
-                current_price = 100.0  # Placeholder
-                target_qty = target_notional / current_price
-
-                # Calculate order quantity (difference)
-                order_qty = target_qty - current_qty
-
-                if abs(order_qty) < 0.01:  # Minimum order size
-                    continue
-
-                # Determine action
-                action = "BUY" if order_qty > 0 else "SELL"
-                order_qty_abs = abs(order_qty)
+        if not weights:
+            return []
 
-                # Create order dict
-                order_dict: OrderDict = {
-                    "symbol": symbol,
-                    "action": action,
-                    "quantity": order_qty_abs,
-                    "order_type": self.config.execution.order_type,
-                    "limit_price": None,
+        # Work on parallel arrays and only build dicts for orders that survive
+        symbols = list(weights)
+        target_weights = np.fromiter(weights.values(), dtype=np.float64, count=len(symbols))
+        current_qty = np.fromiter(
+            (current_positions.get(symbol, 0.0) for symbol in symbols), dtype=np.float64, count=len(symbols)
+        )
+
+        # In real implementation, would fetch current prices from IBKR
+        # For now, use placeholder price
+        current_price = np.full(len(symbols), 100.0)  # Placeholder
+
+        # Target quantity (fractional) minus current position
+        target_qty = equity * target_weights / current_price
+        order_qty = target_qty - current_qty
+
+        # Minimum order size and minimum traded notional, checked for all symbols at once
+        min_notional = self.config.execution.min_trade_notional
+        keep = np.flatnonzero((np.abs(order_qty) >= 0.01) & (np.abs(order_qty * current_price) >= min_notional))
+        is_buy = order_qty > 0
+
+        order_type = self.config.execution.order_type
+        limit_price = np.full(len(symbols), np.nan)
+        if order_type == "LMT":
+            # Limit price = mid ± offset_bps
+            offset_pct = self.config.execution.limit_offset_bps / 10000.0
+            limit_price = np.where(is_buy, current_price * (1 - offset_pct), current_price * (1 + offset_pct))
+
+        orders: list[OrderDict] = []
+        for i in keep.tolist():
+            orders.append(
+                {
+                    "symbol": symbols[i],
+                    "action": "BUY" if is_buy[i] else "SELL",
+                    "quantity": float(abs(order_qty[i])),
+                    "order_type": order_type,
+                    "limit_price": float(limit_price[i]) if order_type == "LMT" else None,
                     "account": account,
                 }
-
-                # Calculate limit price if LMT order
-                if self.config.execution.order_type == "LMT":
-                    # Limit price = mid ± offset_bps
-                    offset_pct = self.config.execution.limit_offset_bps / 10000.0
-                    if action == "BUY":
-                        limit_price = current_price * (1 - offset_pct)
-                    else:
-                        limit_price = current_price * (1 + offset_pct)
-                    order_dict["limit_price"] = limit_price
-
-                orders.append(order_dict)
-
-            except Exception as e:
-                logger.error(f"Error creating order for {symbol}: {e}")
-                continue
+            )
 
         return orders
 
@@ -146,65 +149,73 @@ class IBKRExecutor:
             logger.info("No orders to place")
             return []
 
-        results = []
-
-        for order_dict in orders:
-            try:
-                # Check compliance
-                if not dry_run:
-                    # In real implementation, would check settlement, PDT, etc.
-                    pass
-
-                if dry_run:
-                    logger.info(
-                        f"DRY-RUN: {order_dict['action']} {order_dict['quantity']:.4f} "
-                        f"{order_dict['symbol']} @ {order_dict.get('limit_price', 'MKT')}"
-                    )
-                    results.append({"order": order_dict, "status": "dry_run", "order_id": None})
-                    continue
-
-                # Create contract
-                contract = Stock(order_dict["symbol"], "SMART", "USD")
-
-                # Create order
-                if order_dict["order_type"] == "MKT":
-                    order = MarketOrder(order_dict["action"], order_dict["quantity"])
-                else:  # LMT
-                    if order_dict.get("limit_price") is None:
-                        logger.warning(f"No limit price for LMT order {order_dict['symbol']}")
-                        continue
-                    order = LimitOrder(
-                        order_dict["action"],
-                        order_dict["quantity"],
-                        order_dict["limit_price"],
-                    )
-
-                # Set order properties
-                order.totalQuantity = order_dict["quantity"]
-                order.account = order_dict["account"]
-                order.outsideRth = False  # Regular hours only
-
-                # Place order
-                trade = self.client.ib.placeOrder(contract, order)
-                logger.info(f"Placed order {trade.order.orderId} for {order_dict['symbol']}")
-
-                results.append(
-                    {
-                        "order": order_dict,
-                        "status": "placed",
-                        "order_id": trade.order.orderId,
-                        "trade": trade,
-                    }
+        # ib.placeOrder only queues the order and returns a Trade, so placing
+        # them one by one does not wait on the broker; skipped orders are dropped
+        results = (self._place_one(order_dict, dry_run) for order_dict in orders)
+        return [result for result in results if result is not None]
+
+    def _place_one(self, order_dict: OrderDict, dry_run: bool) -> Optional[dict]:
+        """
+        Place a single order.
+
+        Args:
+            order_dict: Order dictionary
+            dry_run: If True, only log the order
+
+        Returns:
+            Order result, or None if the order was skipped
+        """
+        try:
+            # Check compliance
+            if not dry_run:
+                # In real implementation, would check settlement, PDT, etc.
+                pass
+
+            if dry_run:
+                logger.info(
+                    f"DRY-RUN: {order_dict['action']} {order_dict['quantity']:.4f} "
+                    f"{order_dict['symbol']} @ {order_dict.get('limit_price', 'MKT')}"
+                )
+                return {"order": order_dict, "status": "dry_run", "order_id": None}
+
+            # Create contract
+            contract = self._contract_for(order_dict["symbol"])
+
+            # Create order
+            if order_dict["order_type"] == "MKT":
+                order = MarketOrder(order_dict["action"], order_dict["quantity"])
+            else:  # LMT
+                if order_dict.get("limit_price") is None:
+                    logger.warning(f"No limit price for LMT order {order_dict['symbol']}")
+                    return None
+                order = LimitOrder(
+                    order_dict["action"],
+                    order_dict["quantity"],
+                    order_dict["limit_price"],
                 )
 
-                # Record order for compliance
-                self.compliance.record_order()
+            # Set order properties
+            order.totalQuantity = order_dict["quantity"]
+            order.account = order_dict["account"]
+            order.outsideRth = False  # Regular hours only
 
-            except Exception as e:
-                logger.error(f"Error placing order for {order_dict['symbol']}: {e}")
-                results.append({"order": order_dict, "status": "error", "error": str(e)})
+            # Place order
+            trade = self.client.ib.placeOrder(contract, order)
+            logger.info(f"Placed order {trade.order.orderId} for {order_dict['symbol']}")
 
-        return results
+            # Record order for compliance
+            self.compliance.record_order()
+
+            return {
+                "order": order_dict,
+                "status": "placed",
+                "order_id": trade.order.orderId,
+                "trade": trade,
+            }
+
+        except Exception as e:
+            logger.error(f"Error placing order for {order_dict['symbol']}: {e}")
+            return {"order": order_dict, "status": "error", "error": str(e)}
 
     async def execute_rebalance(
         self,
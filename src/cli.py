@@ -159,7 +159,8 @@ def backtest(start: Optional[str], end: Optional[str]) -> None:
 
 
 @main.command()
-def walkforward() -> None:
+@click.option("--output-dir", default=None, help="Stream per-window OOS results to this directory")
+def walkforward(output_dir: Optional[str]) -> None:
     """Run walk-forward test with rolling train/OOS."""
     from pathlib import Path
 
@@ -189,7 +190,7 @@ def walkforward() -> None:
 
     # Run walk-forward
     click.echo("Running walk-forward analysis...")
-    results = run_walkforward(data, returns, config)
+    results = run_walkforward(data, returns, config, output_dir=Path(output_dir) if output_dir else None)
 
     if not results:
         click.echo("Error: Walk-forward returned no results", err=True)
@@ -1,4 +1,5 @@
 """Discord alerting system for portfolio events."""
+import asyncio
 import os
 from datetime import datetime
 from typing import Optional
@@ -80,6 +81,30 @@ class DiscordAlerter:
             logger.error(f"Failed to send Discord alert: {e}")
             return False
 
+    async def send_message_async(
+        self,
+        title: str,
+        description: str,
+        color: int = 0x3498DB,  # Blue
+        fields: Optional[list[dict]] = None
+    ) -> bool:
+        """
+        Send rich embed message to Discord without blocking the event loop.
+
+        The blocking webhook POST runs in a worker thread, so callers can
+        schedule it with ``asyncio.create_task`` and keep going.
+
+        Args:
+            title: Embed title
+            description: Embed description
+            color: Embed color (hex)
+            fields: List of {"name": "Field", "value": "Value", "inline": False}
+
+        Returns:
+            True if sent successfully
+        """
+        return await asyncio.to_thread(self.send_message, title, description, color, fields)
+
 
 def send_rebalance_success_alert(
     orders_placed: int,
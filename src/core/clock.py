@@ -1,5 +1,6 @@
 """US market calendar and timezone handling."""
 from datetime import datetime, time
+from functools import lru_cache
 from typing import Optional
 
 import pandas as pd
@@ -11,10 +12,14 @@ ET = pytz.timezone("America/New_York")
 UTC = pytz.UTC
 
 
+@lru_cache(maxsize=1)
 def get_market_calendar() -> pd.DataFrame:
     """
     Get US market calendar (XNYS).
 
+    The schedule covers a fixed range, so it is built once and the same
+    DataFrame is returned on every call; callers must not modify it.
+
     Returns:
         DataFrame with market calendar dates
     """
@@ -1,4 +1,6 @@
 """Core configuration management."""
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -87,6 +89,9 @@ class ReoptimizeConfig(BaseModel):
     ema_slow: list[int] = Field(default_factory=lambda: [40, 50, 80])
     top_n: list[int] = Field(default_factory=lambda: [1, 2, 3])
     corr_cap: list[float] = Field(default_factory=lambda: [0.6, 0.7, 0.8])
+    search_mode: str = "grid"  # grid | random | sobol
+    n_trials: int = 64  # Sampled candidates per window for random/sobol
+    successive_halving: bool = False  # Rank on first half of train, finish only the top half
 
 
 class WalkforwardConfig(BaseModel):
@@ -95,6 +100,8 @@ class WalkforwardConfig(BaseModel):
     train_years: int = 3
     oos_months: int = 3
     reoptimize: ReoptimizeConfig = Field(default_factory=ReoptimizeConfig)
+    n_jobs: int = 1  # Grid-search worker processes (-1 = all cores)
+    window_jobs: int = 1  # Walk-forward windows run in parallel (-1 = all cores)
 
 
 class PermutationConfig(BaseModel):
@@ -102,6 +109,11 @@ class PermutationConfig(BaseModel):
 
     runs: int = 200
     objective: str = "Calmar"
+    partial_k: Optional[int] = None  # Permute only k dates per run (None = full shuffle)
+    adaptive_stopping: bool = False  # Stop early once the p-value is clearly above/below alpha
+    alpha: float = 0.05
+    n_jobs: int = 1  # Parallel permutation runs (-1 = all cores)
+    backend: str = "thread"  # thread | process
 
 
 class ExecutionConfig(BaseModel):
@@ -111,6 +123,7 @@ class ExecutionConfig(BaseModel):
     order_type: str = "MKT"  # MKT | LMT
     limit_offset_bps: int = 2
     max_orders_per_day: int = 5
+    min_trade_notional: float = 10.0  # Skip rebalance orders smaller than this ($)
 
 
 class AppConfig(BaseModel):
@@ -141,12 +154,20 @@ class EnvSettings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
 
+# Environment variables that override the config; part of the cache key
+_ENV_VARS = ("IB_HOST", "IB_PORT", "IB_CLIENT_ID", "IB_ACCOUNT_PAPER", "IB_ACCOUNT_LIVE")
+
+
 def load_config(config_path: Optional[Path] = None, local_config_path: Optional[Path] = None) -> AppConfig:
     """
     Load and merge configuration files.
 
     Priority: env vars > config.local.yaml > config.yaml > defaults
 
+    Files are parsed once per (paths, IB_* environment) and cached; each call
+    returns a deep copy, so callers may mutate their config freely. Use
+    ``reload_config`` to pick up edits to the files or the .env file.
+
     Args:
         config_path: Path to default config.yaml
         local_config_path: Path to local config.local.yaml override
@@ -160,6 +181,28 @@ def load_config(config_path: Optional[Path] = None, local_config_path: Optional[
     if local_config_path is None:
         local_config_path = Path(__file__).parent.parent.parent / "config" / "config.local.yaml"
 
+    env_key = tuple(os.environ.get(name) for name in _ENV_VARS)
+    return _load_config_cached(Path(config_path), Path(local_config_path), env_key).model_copy(deep=True)
+
+
+def reload_config(config_path: Optional[Path] = None, local_config_path: Optional[Path] = None) -> AppConfig:
+    """
+    Drop cached configurations and load the files again.
+
+    Args:
+        config_path: Path to default config.yaml
+        local_config_path: Path to local config.local.yaml override
+
+    Returns:
+        Freshly parsed AppConfig instance
+    """
+    _load_config_cached.cache_clear()
+    return load_config(config_path, local_config_path)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: Path, local_config_path: Path, env_key: tuple) -> AppConfig:
+    """Parse and merge the config files (cached; env_key only keys the cache)."""
     # Load default config
     with open(config_path) as f:
         default_config = yaml.safe_load(f) or {}
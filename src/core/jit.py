@@ -0,0 +1,38 @@
+"""Optional Numba JIT compilation with a pure-Python fallback."""
+from typing import Any, Callable
+
+try:
+    from numba import njit as _numba_njit
+    from numba import prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """
+    Compile a function with numba.njit when Numba is installed.
+
+    Falls back to returning the function unchanged, so kernels written against
+    NumPy arrays run (slower) without Numba. Supports both ``@njit`` and
+    ``@njit(cache=True, ...)`` forms.
+
+    Args:
+        *args: Function to decorate, or nothing when called with options
+        **kwargs: Options forwarded to numba.njit
+
+    Returns:
+        Compiled function, or a decorator when called with options
+    """
+    if NUMBA_AVAILABLE:
+        return _numba_njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable) -> Callable:
+        return func
+
+    return decorator
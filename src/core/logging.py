@@ -45,10 +45,6 @@ def setup_logging(
         enable_console: Enable console output
         enable_file: Enable JSONL file output
     """
-    if log_dir is None:
-        log_dir = Path("artifacts/logs")
-    log_dir.mkdir(parents=True, exist_ok=True)
-
     # Root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
@@ -67,8 +63,11 @@ def setup_logging(
         console_handler.setFormatter(console_formatter)
         root_logger.addHandler(console_handler)
 
-    # File handler (JSONL for audit)
+    # File handler (JSONL for audit); the directory is only created when used
     if enable_file:
+        if log_dir is None:
+            log_dir = Path("artifacts/logs")
+        log_dir.mkdir(parents=True, exist_ok=True)
         log_file = log_dir / f"audit_{datetime.now().strftime('%Y%m%d')}.jsonl"
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)  # File gets all levels
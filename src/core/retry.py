@@ -1,6 +1,7 @@
 """Retry logic with exponential backoff for transient failures."""
 import asyncio
 import functools
+import random
 import time
 from collections.abc import Callable
 from typing import Any, TypeVar
@@ -18,6 +19,8 @@ def retry_with_backoff(
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
     exceptions: tuple[type[Exception], ...] = (ConnectionError, TimeoutError),
+    jitter: bool = False,
+    rng: random.Random | None = None,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Retry decorator with exponential backoff for sync functions.
@@ -28,6 +31,9 @@ def retry_with_backoff(
         max_delay: Maximum delay in seconds
         exponential_base: Base for exponential backoff
         exceptions: Tuple of exception types to catch and retry
+        jitter: Sleep a uniform random time in [0, delay] ("full jitter") so
+            many clients retrying together don't hit the server in lockstep
+        rng: Random generator used for jitter (default: a fresh random.Random)
 
     Returns:
         Decorated function
@@ -38,6 +44,8 @@ def retry_with_backoff(
             # ... code that may fail transiently
             pass
     """
+    jitter_rng = rng if rng is not None else random.Random()
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
@@ -56,11 +64,12 @@ def retry_with_backoff(
                         )
                         raise
 
+                    sleep_for = jitter_rng.uniform(0, delay) if jitter else delay
                     logger.warning(
                         f"{func_name} attempt {attempt}/{max_attempts} failed: {e}. "
-                        f"Retrying in {delay:.1f}s..."
+                        f"Retrying in {sleep_for:.1f}s..."
                     )
-                    time.sleep(delay)
+                    time.sleep(sleep_for)
                     delay = min(delay * exponential_base, max_delay)
                 except Exception as e:
                     # Don't retry on unexpected exceptions
@@ -83,6 +92,8 @@ def async_retry_with_backoff(
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
     exceptions: tuple[type[Exception], ...] = (ConnectionError, TimeoutError),
+    jitter: bool = False,
+    rng: random.Random | None = None,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Retry decorator with exponential backoff for async functions.
@@ -93,6 +104,9 @@ def async_retry_with_backoff(
         max_delay: Maximum delay in seconds
         exponential_base: Base for exponential backoff
         exceptions: Tuple of exception types to catch and retry
+        jitter: Sleep a uniform random time in [0, delay] ("full jitter") so
+            many clients retrying together don't hit the server in lockstep
+        rng: Random generator used for jitter (default: a fresh random.Random)
 
     Returns:
         Decorated async function
@@ -103,6 +117,8 @@ def async_retry_with_backoff(
             # ... async code that may fail transiently
             pass
     """
+    jitter_rng = rng if rng is not None else random.Random()
+
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -121,11 +137,12 @@ def async_retry_with_backoff(
                         )
                         raise
 
+                    sleep_for = jitter_rng.uniform(0, delay) if jitter else delay
                     logger.warning(
                         f"{func_name} attempt {attempt}/{max_attempts} failed: {e}. "
-                        f"Retrying in {delay:.1f}s..."
+                        f"Retrying in {sleep_for:.1f}s..."
                     )
-                    await asyncio.sleep(delay)
+                    await asyncio.sleep(sleep_for)
                     delay = min(delay * exponential_base, max_delay)
                 except Exception as e:
                     # Don't retry on unexpected exceptions
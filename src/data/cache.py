@@ -1,27 +1,53 @@
 """Parquet cache system with idempotent append."""
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.fs as pafs
 
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# On-disk formats and their file suffixes. Arrow IPC (Feather v2) skips
+# Parquet's encoding and row-group metadata, which dominate small files.
+CACHE_FORMATS = {"parquet": ".parquet", "arrow_ipc": ".arrow"}
+
+# Environment variable selecting the default cache format
+CACHE_FORMAT_ENV = "IBKR_CACHE_FORMAT"
+
 
 class ParquetCache:
     """Parquet-based cache for OHLCV data with idempotent append."""
 
-    def __init__(self, cache_dir: Path) -> None:
+    def __init__(
+        self,
+        cache_dir: Path,
+        filesystem: Optional[pafs.FileSystem] = None,
+        file_format: Optional[str] = None,
+    ) -> None:
         """
         Initialize Parquet cache.
 
         Args:
             cache_dir: Directory for cache files
+            filesystem: pyarrow filesystem holding cache_dir (default: local disk)
+            file_format: "parquet" or "arrow_ipc" (default: $IBKR_CACHE_FORMAT, else parquet)
         """
+        file_format = file_format or os.environ.get(CACHE_FORMAT_ENV, "parquet")
+        if file_format not in CACHE_FORMATS:
+            raise ValueError(f"Unknown cache format {file_format!r}, expected one of {list(CACHE_FORMATS)}")
+
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.filesystem = filesystem
+        self.file_format = file_format
+        if filesystem is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        else:
+            filesystem.create_dir(self.cache_dir.as_posix(), recursive=True)
 
     def get_cache_path(self, symbol: str) -> Path:
         """
@@ -33,7 +59,13 @@ class ParquetCache:
         Returns:
             Path to cache file
         """
-        return self.cache_dir / f"{symbol}.parquet"
+        return self.cache_dir / f"{symbol}{CACHE_FORMATS[self.file_format]}"
+
+    def _exists(self, path: Path) -> bool:
+        """Check whether a cache file exists on the cache's filesystem."""
+        if self.filesystem is None:
+            return path.exists()
+        return self.filesystem.get_file_info(path.as_posix()).type != pafs.FileType.NotFound
 
     def read(self, symbol: str) -> pd.DataFrame:
         """
@@ -46,12 +78,15 @@ class ParquetCache:
             DataFrame with OHLCV data, empty if not found
         """
         cache_path = self.get_cache_path(symbol)
-        if not cache_path.exists():
+        if not self._exists(cache_path):
             logger.debug(f"No cache found for {symbol}")
             return pd.DataFrame()
 
         try:
-            df = pd.read_parquet(cache_path)
+            if self.file_format == "arrow_ipc":
+                df = self._read_ipc(cache_path)
+            else:
+                df = pd.read_parquet(cache_path.as_posix(), filesystem=self.filesystem)
             if not df.empty and df.index.name != "timestamp":
                 if "timestamp" in df.columns:
                     df = df.set_index("timestamp")
@@ -98,12 +133,36 @@ class ParquetCache:
         df = df[~df.index.duplicated(keep="first")]
 
         try:
-            df.to_parquet(cache_path, engine="pyarrow", index=True)
+            if self.file_format == "arrow_ipc":
+                self._write_ipc(cache_path, df)
+            else:
+                df.to_parquet(
+                    cache_path.as_posix(), engine="pyarrow", index=True, filesystem=self.filesystem
+                )
             logger.info(f"Wrote {len(df)} bars to cache for {symbol}")
         except Exception as e:
             logger.error(f"Failed to write cache for {symbol}: {e}")
             raise
 
+    def _read_ipc(self, path: Path) -> pd.DataFrame:
+        """Read an Arrow IPC cache file (memory-mapped on local disk)."""
+        if self.filesystem is None:
+            source = pa.memory_map(str(path), "r")
+        else:
+            source = self.filesystem.open_input_file(path.as_posix())
+        with source, pa.ipc.open_file(source) as reader:
+            return reader.read_all().to_pandas()
+
+    def _write_ipc(self, path: Path, df: pd.DataFrame) -> None:
+        """Write a DataFrame (index included) as an Arrow IPC file."""
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        if self.filesystem is None:
+            sink = pa.OSFile(str(path), "wb")
+        else:
+            sink = self.filesystem.open_output_stream(path.as_posix())
+        with sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
     def append(self, symbol: str, new_df: pd.DataFrame) -> None:
         """
         Append new data to cache (idempotent - only appends missing dates).
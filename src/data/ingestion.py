@@ -17,19 +17,25 @@ logger = get_logger(__name__)
 class DataIngestion:
     """Orchestrates data fetching and caching."""
 
-    def __init__(self, config: Optional[AppConfig] = None, cache_dir: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        config: Optional[AppConfig] = None,
+        cache_dir: Optional[Path] = None,
+        client: Optional[IBKRClient] = None,
+    ) -> None:
         """
         Initialize data ingestion.
 
         Args:
             config: Application configuration (loads default if not provided)
             cache_dir: Cache directory (default: data/parquet)
+            client: IBKR client to fetch through (default: a new client for config.ibkr)
         """
         self.config = config or load_config()
         self.cache_dir = cache_dir or Path("data/parquet")
         self.cache = ParquetCache(self.cache_dir)
         self.universe_manager = UniverseManager(self.config)
-        self.client = IBKRClient(self.config.ibkr)
+        self.client = client if client is not None else IBKRClient(self.config.ibkr)
 
     async def fetch_and_cache_symbol(
         self,
@@ -1,4 +1,5 @@
 """Data quality validation for OHLCV bars."""
+from typing import Optional
 
 import pandas as pd
 
@@ -12,7 +13,12 @@ class DataValidationError(Exception):
     pass
 
 
-def validate_bars(df: pd.DataFrame, symbol: str, max_staleness_days: int = 2) -> bool:
+def validate_bars(
+    df: pd.DataFrame,
+    symbol: str,
+    max_staleness_days: int = 2,
+    now: Optional[pd.Timestamp] = None,
+) -> bool:
     """
     Validate OHLCV bar data quality.
 
@@ -20,6 +26,7 @@ def validate_bars(df: pd.DataFrame, symbol: str, max_staleness_days: int = 2) ->
         df: DataFrame with OHLCV data (columns: open, high, low, close, volume)
         symbol: Symbol being validated (for logging)
         max_staleness_days: Maximum age of most recent bar in days
+        now: Reference time for the staleness check (default: current time)
 
     Returns:
         True if validation passes
@@ -91,7 +98,9 @@ def validate_bars(df: pd.DataFrame, symbol: str, max_staleness_days: int = 2) ->
     # Check for stale data (most recent bar should be within max_staleness_days)
     if isinstance(df.index, pd.DatetimeIndex):
         most_recent = df.index.max()
-        cutoff = pd.Timestamp.now() - pd.Timedelta(days=max_staleness_days)
+        if now is None:
+            now = pd.Timestamp.now()
+        cutoff = now - pd.Timedelta(days=max_staleness_days)
         if most_recent < cutoff:
             raise DataValidationError(
                 f"{symbol}: Stale data - most recent bar is {most_recent}, "
@@ -102,7 +111,12 @@ def validate_bars(df: pd.DataFrame, symbol: str, max_staleness_days: int = 2) ->
     return True
 
 
-def validate_bars_safe(df: pd.DataFrame, symbol: str, max_staleness_days: int = 2) -> tuple[bool, str]:
+def validate_bars_safe(
+    df: pd.DataFrame,
+    symbol: str,
+    max_staleness_days: int = 2,
+    now: Optional[pd.Timestamp] = None,
+) -> tuple[bool, str]:
     """
     Safe wrapper for validate_bars that catches exceptions.
 
@@ -110,12 +124,13 @@ def validate_bars_safe(df: pd.DataFrame, symbol: str, max_staleness_days: int =
         df: DataFrame with OHLCV data
         symbol: Symbol being validated
         max_staleness_days: Maximum age of most recent bar in days
+        now: Reference time for the staleness check (default: current time)
 
     Returns:
         (is_valid, error_message) tuple
     """
     try:
-        validate_bars(df, symbol, max_staleness_days)
+        validate_bars(df, symbol, max_staleness_days, now)
         return (True, "")
     except DataValidationError as e:
         return (False, str(e))
@@ -125,7 +140,8 @@ def validate_bars_safe(df: pd.DataFrame, symbol: str, max_staleness_days: int =
 
 def check_data_quality_batch(
     data: dict[str, pd.DataFrame],
-    max_staleness_days: int = 2
+    max_staleness_days: int = 2,
+    now: Optional[pd.Timestamp] = None,
 ) -> dict[str, str]:
     """
     Validate multiple symbols and return any failures.
@@ -133,14 +149,19 @@ def check_data_quality_batch(
     Args:
         data: Dict mapping symbol -> DataFrame
         max_staleness_days: Maximum age of most recent bar in days
+        now: Reference time for the staleness check (default: current time,
+            read once so every symbol is checked against the same cutoff)
 
     Returns:
         Dict mapping symbol -> error message (only failed symbols)
     """
+    if now is None:
+        now = pd.Timestamp.now()
+
     failures = {}
 
     for symbol, df in data.items():
-        is_valid, error = validate_bars_safe(df, symbol, max_staleness_days)
+        is_valid, error = validate_bars_safe(df, symbol, max_staleness_days, now)
         if not is_valid:
             failures[symbol] = error
             logger.error(f"Data validation failed for {symbol}: {error}")
@@ -1,12 +1,52 @@
 """Rolling correlation matrix with greedy selection cap."""
+import logging
+import threading
+import weakref
+from collections import OrderedDict
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    from scipy.linalg.blas import dsyrk
+
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Correlation matrices memoized per (returns frame, date, window, columns). Entries
+# hold a weak reference to the frame so a recycled id() can never produce a hit.
+# Sized to hold every rebalance date of a multi-year training window.
+CORR_CACHE_SIZE = 2048
+_corr_cache: "OrderedDict[tuple, tuple[weakref.ref, pd.DataFrame]]" = OrderedDict()
+_corr_cache_lock = threading.Lock()
+
+# Rolling sufficient statistics memoized per (returns frame, window, columns), so
+# every date queried on one frame is answered from a single pass over it. The
+# pairwise sums take (dates x symbols^2) memory, so frames above the cell limit
+# skip them and each date is computed from its own window instead.
+ROLLING_STATS_CACHE_SIZE = 8
+ROLLING_STATS_MAX_CELLS = 10_000_000
+_stats_cache: "OrderedDict[tuple, tuple[weakref.ref, dict[str, np.ndarray]]]" = OrderedDict()
+
+# Per-thread Fortran-ordered window buffers keyed by shape. Consecutive dates use
+# the same (window x symbols) shape, so the window is copied into warm memory that
+# SYRK can read directly instead of a fresh array per call.
+WINDOW_BUFFERS_MAX = 8
+_window_buffers = threading.local()
+
+
+def clear_correlation_cache() -> None:
+    """Drop all memoized correlation matrices and rolling statistics."""
+    with _corr_cache_lock:
+        _corr_cache.clear()
+        _stats_cache.clear()
+
 
 def calculate_rolling_correlation_matrix(
     returns: pd.DataFrame,
@@ -45,6 +85,137 @@ def calculate_rolling_correlation_matrix(
     return last_corr
 
 
+def pearson_corr(values: np.ndarray) -> np.ndarray:
+    """
+    Pearson correlation between the columns of a NaN-free matrix.
+
+    Uses the post-hoc covariance C = (X'X - N * mu mu') / (N - 1), so the
+    (observations x variables) input is never copied to center it; all
+    intermediates are (variables x variables). X'X is a symmetric rank-k update
+    via BLAS SYRK when SciPy is available, a matrix multiply otherwise.
+    Zero-variance columns yield NaN, as in pandas.
+
+    Args:
+        values: (observations x variables) array with at least 2 rows
+
+    Returns:
+        (variables x variables) correlation matrix
+    """
+    n = values.shape[0]
+    mu = values.mean(axis=0)
+
+    if SCIPY_AVAILABLE:
+        # SYRK only fills the upper triangle; mirror it
+        upper = dsyrk(alpha=1.0, a=np.asfortranarray(values), trans=1, lower=0)
+        corr = np.triu(upper)
+        corr += np.triu(upper, 1).T
+    else:
+        # A plain GEMM: einsum("ti,tj->ij") was 1.5-15x slower for 5-200 symbols,
+        # with or without optimize, since contraction planning costs more than it saves
+        corr = values.T @ values
+
+    corr -= np.outer(n * mu, mu)
+    corr /= n - 1
+
+    # Scale by 1/std in place. Constant columns are detected exactly (the
+    # subtraction can leave rounding noise on their diagonal) and become NaN.
+    with np.errstate(invalid="ignore", divide="ignore"):
+        inv_std = 1.0 / np.sqrt(np.diag(corr))
+    inv_std[values.max(axis=0) == values.min(axis=0)] = np.nan
+    corr *= inv_std
+    corr *= inv_std[:, None]
+
+    return np.clip(corr, -1.0, 1.0, out=corr)
+
+
+def precompute_rolling_stats(returns: pd.DataFrame, window: int) -> dict[str, np.ndarray]:
+    """
+    Rolling sufficient statistics for the correlation of every window.
+
+    Row t of each array describes the window of ``window`` rows ending at row t
+    (rows before the first full window are NaN). Sums use pandas' compensated
+    rolling sum, so they stay accurate over long histories.
+
+    Args:
+        returns: DataFrame with returns (columns = symbols, index = dates)
+        window: Rolling window period
+
+    Returns:
+        Dictionary with ``sum_x`` (dates x symbols), ``sum_xx`` (dates x
+        symbols), ``sum_xy`` (dates x symbols x symbols), ``nan_count``
+        (dates,) and ``constant`` (dates x symbols, True where a column holds a
+        single value over the window)
+    """
+    values = returns.to_numpy(dtype=np.float64)
+    n_rows, n_cols = values.shape
+
+    products = (values[:, :, None] * values[:, None, :]).reshape(n_rows, n_cols * n_cols)
+    sum_xy = pd.DataFrame(products).rolling(window).sum().to_numpy().reshape(n_rows, n_cols, n_cols)
+
+    frame = pd.DataFrame(values)
+    rolling = frame.rolling(window)
+    nan_count = frame.isna().sum(axis=1).rolling(window).sum().to_numpy()
+
+    return {
+        "sum_x": rolling.sum().to_numpy(),
+        "sum_xx": sum_xy.diagonal(axis1=1, axis2=2).copy(),
+        "sum_xy": sum_xy,
+        "nan_count": nan_count,
+        "constant": (rolling.max() == rolling.min()).to_numpy(),
+    }
+
+
+def _get_rolling_stats(returns: pd.DataFrame, window: int) -> Optional[dict[str, np.ndarray]]:
+    """Memoized precompute_rolling_stats, or None when the frame is too large."""
+    n_rows, n_cols = returns.shape
+    if n_rows * n_cols * n_cols > ROLLING_STATS_MAX_CELLS:
+        return None
+
+    key = (id(returns), window, tuple(returns.columns))
+    with _corr_cache_lock:
+        entry = _stats_cache.get(key)
+        if entry is not None and entry[0]() is returns:
+            _stats_cache.move_to_end(key)
+            return entry[1]
+
+    stats = precompute_rolling_stats(returns, window)
+    with _corr_cache_lock:
+        _stats_cache[key] = (weakref.ref(returns), stats)
+        if len(_stats_cache) > ROLLING_STATS_CACHE_SIZE:
+            _stats_cache.popitem(last=False)
+    return stats
+
+
+def _corr_from_stats(stats: dict[str, np.ndarray], row: int, window: int) -> np.ndarray:
+    """Pearson correlation of the window ending at row from its rolling sums."""
+    sum_x = stats["sum_x"][row]
+    corr = stats["sum_xy"][row] - np.outer(sum_x, sum_x) / window
+    corr /= window - 1
+
+    # Constant columns are detected exactly and become NaN, as in pandas
+    with np.errstate(invalid="ignore", divide="ignore"):
+        inv_std = 1.0 / np.sqrt(np.diag(corr))
+    inv_std[stats["constant"][row]] = np.nan
+    corr *= inv_std
+    corr *= inv_std[:, None]
+
+    return np.clip(corr, -1.0, 1.0, out=corr)
+
+
+def _get_buf(shape: tuple[int, int]) -> np.ndarray:
+    """Reusable float64 buffer of the given shape for the calling thread."""
+    buffers = getattr(_window_buffers, "by_shape", None)
+    if buffers is None:
+        buffers = _window_buffers.by_shape = {}
+
+    buf = buffers.get(shape)
+    if buf is None:
+        if len(buffers) >= WINDOW_BUFFERS_MAX:
+            buffers.clear()
+        buf = buffers[shape] = np.empty(shape, dtype=np.float64, order="F")
+    return buf
+
+
 def get_correlation_matrix(
     returns: pd.DataFrame,
     window: int = 90,
@@ -53,6 +224,10 @@ def get_correlation_matrix(
     """
     Get correlation matrix for a specific date or most recent.
 
+    Results are memoized for the same returns object, so the frame must not be
+    modified in place after it has been queried; the returned matrix is shared
+    between callers and must be treated as read-only.
+
     Args:
         returns: DataFrame with returns (columns = symbols, index = dates)
         window: Rolling window period
@@ -64,26 +239,74 @@ def get_correlation_matrix(
     if returns.empty:
         return pd.DataFrame()
 
-    if date is not None:
-        # Filter returns up to and including date
-        returns_subset = returns[returns.index <= date]
-        if len(returns_subset) < window:
-            logger.warning(f"Insufficient data for correlation at {date}")
+    if returns.shape[1] == 1:
+        # A lone symbol is only ever compared with itself
+        return pd.DataFrame([[1.0]], index=returns.columns, columns=returns.columns)
+
+    date_key = None if date is None else pd.Timestamp(date).value
+    key = (id(returns), date_key, window, tuple(returns.columns))
+    with _corr_cache_lock:
+        entry = _corr_cache.get(key)
+        if entry is not None and entry[0]() is returns:
+            _corr_cache.move_to_end(key)
+            return entry[1]
+
+    corr_matrix = _compute_correlation_matrix(returns, window, date)
+    if not corr_matrix.empty:
+        with _corr_cache_lock:
+            _corr_cache[key] = (weakref.ref(returns), corr_matrix)
+            if len(_corr_cache) > CORR_CACHE_SIZE:
+                _corr_cache.popitem(last=False)
+    return corr_matrix
+
+
+def _compute_correlation_matrix(
+    returns: pd.DataFrame,
+    window: int,
+    date: Optional[pd.Timestamp],
+) -> pd.DataFrame:
+    """Compute the correlation matrix for get_correlation_matrix (uncached)."""
+    if returns.index.is_monotonic_increasing:
+        # The window is a contiguous row range ending at the date's position,
+        # found with one binary search instead of boolean masks over the index
+        end = len(returns) if date is None else int(returns.index.searchsorted(date, side="right"))
+        if end < window:
+            if date is not None:
+                logger.warning("Insufficient data for correlation at %s", date)
+            else:
+                logger.warning("Insufficient data for %d-day correlation", window)
             return pd.DataFrame()
-        returns = returns_subset
 
-    # Calculate correlation for the window ending at the specified date
-    if date is not None:
-        window_returns = returns[returns.index <= date].tail(window)
+        if window >= 2:
+            # Read the precomputed rolling sums when the window has no NaNs
+            stats = _get_rolling_stats(returns, window)
+            if stats is not None and stats["nan_count"][end - 1] == 0:
+                columns = returns.columns
+                return pd.DataFrame(_corr_from_stats(stats, end - 1, window), index=columns, columns=columns)
+
+        window_returns = returns.iloc[end - window : end]
     else:
+        if date is not None:
+            # Filter returns up to and including date
+            returns = returns[returns.index <= date]
+            if len(returns) < window:
+                logger.warning("Insufficient data for correlation at %s", date)
+                return pd.DataFrame()
+
         window_returns = returns.tail(window)
+        if len(window_returns) < window:
+            logger.warning("Insufficient data for %d-day correlation", window)
+            return pd.DataFrame()
 
-    if len(window_returns) < window:
-        logger.warning(f"Insufficient data for {window}-day correlation")
-        return pd.DataFrame()
+    values = window_returns.to_numpy(dtype=np.float64, copy=False)
+    if len(values) < 2 or np.isnan(values).any():
+        # pandas handles pairwise-complete observations when data is missing
+        return window_returns.corr()
 
-    corr_matrix = window_returns.corr()
-    return corr_matrix
+    buf = _get_buf(values.shape)
+    np.copyto(buf, values)
+    columns = window_returns.columns
+    return pd.DataFrame(pearson_corr(buf), index=columns, columns=columns)
 
 
 def apply_correlation_cap(
@@ -111,34 +334,40 @@ def apply_correlation_cap(
         logger.warning("Empty correlation matrix, returning top symbol")
         return [symbols[0]] if symbols else []
 
+    # Candidate x candidate |correlations| by position, without building a
+    # reindexed DataFrame; symbols missing from the matrix get NaN, which never
+    # exceeds the cap (treated as uncorrelated)
+    rows = corr_matrix.index.get_indexer(symbols)
+    cols = corr_matrix.columns.get_indexer(symbols)
+    corr = np.abs(corr_matrix.to_numpy(dtype=np.float64)[np.ix_(np.maximum(rows, 0), np.maximum(cols, 0))])
+    corr[rows < 0, :] = np.nan
+    corr[:, cols < 0] = np.nan
+
+    chosen = _apply_correlation_cap_np(corr, corr_cap)
+    selected = [symbols[i] for i in chosen]
+
+    if logger.isEnabledFor(logging.DEBUG):
+        for symbol in symbols:
+            if symbol in selected:
+                logger.debug("Selected %s (score: %.3f)", symbol, scores.get(symbol, 0))
+            else:
+                logger.debug("Rejecting %s due to correlation above cap %s", symbol, corr_cap)
+
+    return selected
+
+
+def _apply_correlation_cap_np(corr: np.ndarray, corr_cap: float) -> list[int]:
+    """Greedy cap over candidates in priority order; returns the kept positions."""
+    blocked = np.zeros(len(corr), dtype=bool)
     selected = []
 
-    for symbol in symbols:
-        # Check correlation with already selected symbols
-        can_add = True
+    for i in range(len(corr)):
+        if blocked[i]:
+            continue
 
-        for selected_symbol in selected:
-            # Get correlation (handle both directions)
-            if symbol in corr_matrix.index and selected_symbol in corr_matrix.columns:
-                corr = corr_matrix.loc[symbol, selected_symbol]
-            elif symbol in corr_matrix.columns and selected_symbol in corr_matrix.index:
-                corr = corr_matrix.loc[selected_symbol, symbol]
-            else:
-                # Symbol not in matrix, assume low correlation
-                corr = 0.0
-
-            # Check if correlation exceeds cap
-            if abs(corr) > corr_cap:
-                can_add = False
-                logger.debug(
-                    f"Rejecting {symbol} due to correlation {corr:.3f} "
-                    f"with {selected_symbol} (cap: {corr_cap})"
-                )
-                break
-
-        if can_add:
-            selected.append(symbol)
-            logger.debug(f"Selected {symbol} (score: {scores.get(symbol, 0):.3f})")
+        selected.append(i)
+        # Block every remaining candidate too correlated with this one
+        blocked |= corr[i] > corr_cap
 
     return selected
 
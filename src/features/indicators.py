@@ -1,12 +1,26 @@
 """Technical indicators implemented from scratch."""
+import math
+from typing import Optional
+
 import numpy as np
 import pandas as pd
 
+from src.core.jit import NUMBA_AVAILABLE, njit
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@njit(cache=True)
+def _ema_kernel(values: np.ndarray, alpha: float) -> np.ndarray:
+    """One-pass EMA recursion seeded with the first value."""
+    out = np.empty_like(values)
+    out[0] = values[0]
+    for i in range(1, len(values)):
+        out[i] = alpha * values[i] + (1 - alpha) * out[i - 1]
+    return out
+
+
 def ema(series: pd.Series, window: int) -> pd.Series:
     """
     Calculate Exponential Moving Average (EMA).
@@ -30,17 +44,38 @@ def ema(series: pd.Series, window: int) -> pd.Series:
     # Calculate smoothing factor
     alpha = 2.0 / (window + 1.0)
 
-    # Initialize result
-    ema_values = np.zeros(len(series))
-    ema_values[0] = series.iloc[0]
-
-    # Recursive calculation
-    for i in range(1, len(series)):
-        ema_values[i] = alpha * series.iloc[i] + (1 - alpha) * ema_values[i - 1]
+    ema_values = _ema_kernel(series.to_numpy(dtype=np.float64), alpha)
 
     return pd.Series(ema_values, index=series.index, name=f"EMA{window}")
 
 
+@njit(cache=True)
+def _atr_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray, window: int) -> np.ndarray:
+    """One pass of true range plus Wilder's smoothing; the first bar uses its own close."""
+    n = len(high)
+    out = np.empty(n)
+    prev_close = close[0]
+
+    for i in range(n):
+        # Same comparison order as Python's max() so NaN handling is unchanged
+        tr = high[i] - low[i]
+        up = abs(high[i] - prev_close)
+        if up > tr:
+            tr = up
+        down = abs(low[i] - prev_close)
+        if down > tr:
+            tr = down
+        prev_close = close[i]
+
+        # Wilder's smoothing (special case of EMA with α = 1/window)
+        if i == 0:
+            out[i] = tr
+        else:
+            out[i] = (out[i - 1] * (window - 1) + tr) / window
+
+    return out
+
+
 def atr(high: pd.Series, low: pd.Series, close: pd.Series, window: int) -> pd.Series:
     """
     Calculate Average True Range (ATR) using Wilder's smoothing method.
@@ -63,37 +98,66 @@ def atr(high: pd.Series, low: pd.Series, close: pd.Series, window: int) -> pd.Se
     if len(high) == 0 or len(low) == 0 or len(close) == 0:
         return pd.Series(dtype=float, index=close.index)
 
-    # Calculate True Range
-    tr_values = []
-    prev_close = close.iloc[0]
-
-    for i in range(len(high)):
-        h = high.iloc[i]
-        lo = low.iloc[i]
-        c = close.iloc[i]
+    atr_values = _atr_kernel(
+        high.to_numpy(dtype=np.float64),
+        low.to_numpy(dtype=np.float64),
+        close.to_numpy(dtype=np.float64),
+        window,
+    )
 
-        tr = max(h - lo, abs(h - prev_close), abs(lo - prev_close))
-        tr_values.append(tr)
-        prev_close = c
-
-    tr_series = pd.Series(tr_values, index=close.index)
+    return pd.Series(atr_values, index=close.index, name=f"ATR{window}")
 
-    # Wilder's smoothing (special case of EMA with α = 1/window)
-    # ATR_t = (ATR_{t-1} * (window - 1) + TR_t) / window
-    atr_values = np.zeros(len(tr_series))
-    atr_values[0] = tr_series.iloc[0]
 
-    for i in range(1, len(tr_series)):
-        atr_values[i] = (atr_values[i - 1] * (window - 1) + tr_series.iloc[i]) / window
-
-    return pd.Series(atr_values, index=close.index, name=f"ATR{window}")
+@njit(cache=True)
+def _stdev_kernel(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sample std via Welford's add/remove updates, skipping NaNs."""
+    n = len(values)
+    out = np.empty(n)
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    # Length of the trailing run of identical values, so constant windows are exactly 0
+    same_run = 0
+    prev = np.nan
+
+    for i in range(n):
+        x = values[i]
+        if not np.isnan(x):
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+            same_run = same_run + 1 if x == prev else 1
+            prev = x
+
+        if i >= window:
+            old = values[i - window]
+            if not np.isnan(old):
+                count -= 1
+                if count == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    delta = old - mean
+                    mean -= delta / count
+                    m2 -= delta * (old - mean)
+
+        if count < 2:
+            out[i] = np.nan
+        elif same_run >= count:
+            out[i] = 0.0
+        else:
+            out[i] = math.sqrt(max(m2, 0.0) / (count - 1))
+
+    return out
 
 
 def stdev(series: pd.Series, window: int) -> pd.Series:
     """
     Calculate rolling standard deviation.
 
-    Uses sample standard deviation (ddof=1).
+    Uses sample standard deviation (ddof=1) over the non-NaN values of each
+    window, computed in one pass with Welford's online updates.
 
     Args:
         series: Price series (typically returns)
@@ -108,7 +172,155 @@ def stdev(series: pd.Series, window: int) -> pd.Series:
     if len(series) == 0:
         return pd.Series(dtype=float, index=series.index)
 
-    return series.rolling(window=window, min_periods=1).std(ddof=1)
+    values = _stdev_kernel(series.to_numpy(dtype=np.float64), window)
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+@njit(cache=True)
+def _tail_std_kernel(values: np.ndarray, window: int) -> np.ndarray:
+    """Two-pass NaN-skipping sample std of the last window rows of each column."""
+    n_rows, n_cols = values.shape
+    start = max(n_rows - window, 0)
+    out = np.full(n_cols, np.nan)
+
+    for j in range(n_cols):
+        count = 0
+        total = 0.0
+        for i in range(start, n_rows):
+            v = values[i, j]
+            if not np.isnan(v):
+                count += 1
+                total += v
+
+        if count < 2:
+            continue
+
+        mean = total / count
+        sq = 0.0
+        for i in range(start, n_rows):
+            v = values[i, j]
+            if not np.isnan(v):
+                sq += (v - mean) * (v - mean)
+        out[j] = math.sqrt(sq / (count - 1))
+
+    return out
+
+
+def tail_std(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Calculate the standard deviation over only the last window rows.
+
+    Equivalent to the final row of ``stdev`` (sample std, ddof=1) but costs
+    O(window) per column instead of a full rolling pass. NaNs are skipped;
+    columns with fewer than two observations return NaN.
+
+    Args:
+        values: 1D series values or 2D (dates x symbols) array
+        window: Trailing window length
+
+    Returns:
+        Array with one standard deviation per column (shape (1,) for 1D input)
+    """
+    if window <= 0:
+        raise ValueError(f"STDEV window must be positive, got {window}")
+
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values.reshape(-1, 1)
+
+    return _tail_std_kernel(np.ascontiguousarray(values), window)
+
+
+@njit(cache=True)
+def _ema2d_kernel(values: np.ndarray, alpha: float) -> np.ndarray:
+    """Per-column EMA recursion matching pandas ewm(adjust=False, ignore_na=True)."""
+    n_rows, n_cols = values.shape
+    out = np.empty_like(values)
+    old_wt_factor = 1.0 - alpha
+
+    # Serial on purpose: selection runs inside permutation/walk-forward thread
+    # pools, and Numba's parallel workqueue layer cannot be entered from several threads
+    for j in range(n_cols):
+        weighted = values[0, j]
+        out[0, j] = weighted
+        for i in range(1, n_rows):
+            cur = values[i, j]
+            if not np.isnan(weighted):
+                # Same operation order as pandas so results are bit-identical
+                if not np.isnan(cur) and weighted != cur:
+                    weighted = (old_wt_factor * weighted + alpha * cur) / (old_wt_factor + alpha)
+            elif not np.isnan(cur):
+                weighted = cur
+            out[i, j] = weighted
+
+    return out
+
+
+def ema2d(values: np.ndarray, span: Optional[float] = None, alpha: Optional[float] = None) -> np.ndarray:
+    """
+    Calculate EMAs for every column of a (dates x symbols) array in one call.
+
+    Matches ``DataFrame.ewm(span=..., adjust=False, ignore_na=True).mean()``
+    (or ``alpha=...``) exactly: each column's EMA runs over its own non-NaN
+    values and carries the last value across gaps. With Numba installed the
+    columns are processed by a JIT kernel; otherwise pandas is used.
+
+    Args:
+        values: 2D array (dates x symbols), NaN where a symbol has no value
+        span: EMA span (alpha = 2 / (span + 1))
+        alpha: Smoothing factor in (0, 1], used when span is not given
+
+    Returns:
+        Array of EMA values with the same shape as values
+    """
+    # Center of mass, derived the same way pandas does so results are identical
+    if span is not None:
+        if span < 1:
+            raise ValueError(f"EMA span must be >= 1, got {span}")
+        com = (span - 1) / 2.0
+    elif alpha is not None:
+        if not 0 < alpha <= 1:
+            raise ValueError(f"EMA alpha must be in (0, 1], got {alpha}")
+        com = (1 - alpha) / alpha
+    else:
+        raise ValueError("Either span or alpha must be provided")
+
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if values.shape[0] == 0:
+        return values.copy()
+
+    if not NUMBA_AVAILABLE:
+        return pd.DataFrame(values).ewm(com=com, adjust=False, ignore_na=True).mean().to_numpy()
+
+    return _ema2d_kernel(values, 1.0 / (1.0 + com))
+
+
+@njit(cache=True)
+def _macd_kernel(
+    values: np.ndarray, alpha_fast: float, alpha_slow: float, alpha_signal: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fused MACD pass: fast/slow/signal EMA states updated together per step."""
+    n = len(values)
+    macd_line = np.empty(n)
+    signal_line = np.empty(n)
+    histogram = np.empty(n)
+
+    ema_fast = values[0]
+    ema_slow = values[0]
+    signal_ema = ema_fast - ema_slow
+    for i in range(n):
+        if i > 0:
+            x = values[i]
+            ema_fast = alpha_fast * x + (1 - alpha_fast) * ema_fast
+            ema_slow = alpha_slow * x + (1 - alpha_slow) * ema_slow
+        m = ema_fast - ema_slow
+        if i > 0:
+            signal_ema = alpha_signal * m + (1 - alpha_signal) * signal_ema
+        macd_line[i] = m
+        signal_line[i] = signal_ema
+        histogram[i] = m - signal_ema
+
+    return macd_line, signal_line, histogram
 
 
 def macd(
@@ -143,17 +355,15 @@ def macd(
         empty = pd.Series(dtype=float, index=close.index)
         return (empty, empty, empty)
 
-    # Calculate EMAs
-    ema_fast = ema(close, fast)
-    ema_slow = ema(close, slow)
-
-    # MACD line
-    macd_line = ema_fast - ema_slow
-
-    # Signal line (EMA of MACD line)
-    signal_line = ema(macd_line, signal)
-
-    # Histogram
-    histogram = macd_line - signal_line
-
-    return (macd_line, signal_line, histogram)
+    macd_line, signal_line, histogram = _macd_kernel(
+        close.to_numpy(dtype=np.float64),
+        2.0 / (fast + 1.0),
+        2.0 / (slow + 1.0),
+        2.0 / (signal + 1.0),
+    )
+
+    return (
+        pd.Series(macd_line, index=close.index),
+        pd.Series(signal_line, index=close.index),
+        pd.Series(histogram, index=close.index),
+    )
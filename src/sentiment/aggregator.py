@@ -1,6 +1,6 @@
 """Sentiment aggregator - combines multiple sources to calculate YOLO scores."""
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from src.sentiment.reddit_scraper import RedditSentimentScraper
 from src.sentiment.stocktwits_scraper import StockTwitsScraper
@@ -30,6 +30,9 @@ class SentimentAggregator:
         )
         self.stocktwits = StockTwitsScraper()
         
+        # Every score computed by the latest get_top_yolo_picks call
+        self.last_scores: Dict[str, Tuple[float, Dict[str, float]]] = {}
+        
         logger.info("Sentiment aggregator initialized")
     
     def calculate_yolo_score(self, ticker: str) -> Tuple[float, Dict[str, float]]:
@@ -93,29 +96,37 @@ class SentimentAggregator:
     def get_top_yolo_picks(
         self,
         universe: List[str],
-        top_n: int = 1
+        top_n: int = 1,
+        always_include: Optional[List[str]] = None
     ) -> List[Tuple[str, float, Dict[str, float]]]:
         """
         Get top N tickers by YOLO score from the universe.
         
+        Tickers in ``always_include`` (e.g. a held position outside the
+        universe) are scored in the same pass, so callers can read their
+        score from ``last_scores`` instead of scoring them again.
+        
         Args:
             universe: List of tickers to analyze
             top_n: Number of top picks to return
+            always_include: Extra tickers to score but not rank
             
         Returns:
             List of (ticker, yolo_score, breakdown) tuples, sorted by score
         """
         logger.info(f"Scanning {len(universe)} tickers for YOLO opportunities...")
         
-        scores = []
+        batch = list(dict.fromkeys(list(universe) + list(always_include or [])))
+        self.last_scores = {}
         
-        for ticker in universe:
+        for ticker in batch:
             try:
-                score, breakdown = self.calculate_yolo_score(ticker)
-                scores.append((ticker, score, breakdown))
+                self.last_scores[ticker] = self.calculate_yolo_score(ticker)
             except Exception as e:
                 logger.error(f"Error processing ${ticker}: {e}")
-                scores.append((ticker, 0.0, {}))
+                self.last_scores[ticker] = (0.0, {})
+        
+        scores = [(ticker, *self.last_scores[ticker]) for ticker in dict.fromkeys(universe)]
         
         # Sort by score descending
         scores.sort(key=lambda x: x[1], reverse=True)
@@ -1,12 +1,14 @@
 """Backtesting engine with lagged positions and cost modeling."""
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 from src.core.config import AppConfig
 from src.core.logging import get_logger
-from src.strategy.selector import select_assets
+from src.strategy.selector import compute_signal_matrices, select_from_signals
 from src.strategy.weighting import calculate_weights
 
 logger = get_logger(__name__)
@@ -48,6 +50,46 @@ def calculate_returns(df: pd.DataFrame) -> pd.DataFrame:
     return returns
 
 
+def slice_by_date(
+    df: pd.DataFrame,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    inclusive_end: bool = False,
+) -> pd.DataFrame:
+    """
+    Slice a date-indexed DataFrame to [start, end) with binary search.
+
+    Equivalent to ``df[(df.index >= start) & (df.index < end)]`` (or ``<= end``
+    when ``inclusive_end``) but O(log T) on a sorted index instead of an O(T)
+    boolean mask. Falls back to the mask if the index is not sorted.
+
+    Args:
+        df: DataFrame indexed by date
+        start: Inclusive start date (None = from the beginning)
+        end: End date (None = to the end)
+        inclusive_end: Whether rows dated exactly ``end`` are kept
+
+    Returns:
+        Sliced DataFrame (a view where pandas allows it)
+    """
+    if df.empty:
+        return df
+
+    if not df.index.is_monotonic_increasing:
+        mask = pd.Series(True, index=df.index)
+        if start is not None:
+            mask &= df.index >= start
+        if end is not None:
+            mask &= (df.index <= end) if inclusive_end else (df.index < end)
+        return df[mask.to_numpy()]
+
+    lo = 0 if start is None else df.index.searchsorted(pd.Timestamp(start), side="left")
+    hi = len(df)
+    if end is not None:
+        hi = df.index.searchsorted(pd.Timestamp(end), side="right" if inclusive_end else "left")
+    return df.iloc[lo:hi]
+
+
 def calculate_costs(
     turnover: pd.Series,
     commission_per_share: float = 0.0035,
@@ -77,6 +119,81 @@ def calculate_costs(
     return total_costs
 
 
+@dataclass(frozen=True)
+class BacktestArrays:
+    """Dense (dates x symbols) arrays for a backtest universe."""
+
+    dates: pd.DatetimeIndex  # Sorted union of all symbols' dates
+    symbols: list[str]
+    close: np.ndarray  # NaN where a symbol has no bar
+    high: np.ndarray
+    low: np.ndarray
+    returns: np.ndarray  # Per-symbol close-to-close returns over its own bars
+    selectable: np.ndarray  # Symbols with all OHLCV columns (eligible for selection)
+    _returns_frames: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def returns_frame(self, lo: int, hi: int) -> pd.DataFrame:
+        """
+        Aligned returns for rows [lo, hi) with NaN filled as 0.
+
+        Built once per row range and shared by every backtest over that range
+        (e.g. all grid candidates of a window), so it must not be modified.
+        The shared object also lets correlation matrices be memoized per date.
+
+        Args:
+            lo: First row
+            hi: One past the last row
+
+        Returns:
+            (dates x symbols) returns DataFrame
+        """
+        frame = self._returns_frames.get((lo, hi))
+        if frame is None:
+            frame = pd.DataFrame(self.returns[lo:hi], index=self.dates[lo:hi], columns=self.symbols)
+            frame = frame.fillna(0.0)
+            self._returns_frames[(lo, hi)] = frame
+        return frame
+
+
+def build_backtest_arrays(data: dict[str, pd.DataFrame]) -> Optional[BacktestArrays]:
+    """
+    Extract a backtest universe into dense arrays once.
+
+    Callers that backtest the same data many times (e.g. a grid search)
+    build the arrays once and pass them to ``run_backtest_arrays``.
+
+    Args:
+        data: Dictionary mapping symbols to OHLCV DataFrames
+
+    Returns:
+        BacktestArrays, or None if every DataFrame is empty
+    """
+    frames = {symbol: df for symbol, df in data.items() if not df.empty}
+    if not frames:
+        return None
+
+    fields = ["close", "high", "low"]
+    panel = pd.concat({symbol: df.reindex(columns=fields) for symbol, df in frames.items()}, axis=1).sort_index()
+    symbols = list(frames)
+    tensor = panel.to_numpy(dtype=np.float64).reshape(len(panel), len(symbols), len(fields))
+
+    returns = pd.DataFrame({symbol: df["close"].pct_change() for symbol, df in frames.items()})
+    returns = returns.reindex(panel.index)
+
+    required_cols = ["open", "high", "low", "close", "volume"]
+    selectable = np.array([all(col in df.columns for col in required_cols) for df in frames.values()])
+
+    return BacktestArrays(
+        dates=pd.DatetimeIndex(panel.index),
+        symbols=symbols,
+        close=tensor[:, :, 0],
+        high=tensor[:, :, 1],
+        low=tensor[:, :, 2],
+        returns=returns.to_numpy(dtype=np.float64),
+        selectable=selectable,
+    )
+
+
 def run_backtest(
     data: dict[str, pd.DataFrame],
     config: AppConfig,
@@ -99,131 +216,191 @@ def run_backtest(
         logger.warning("No data provided for backtest")
         return {}
 
-    # Align all dataframes by date
-    all_dates = set()
-    for df in data.values():
-        if not df.empty:
-            all_dates.update(df.index)
-
-    if not all_dates:
+    arrays = build_backtest_arrays(data)
+    if arrays is None:
         logger.warning("No dates found in data")
         return {}
 
-    all_dates = sorted(all_dates)
+    return run_backtest_arrays(arrays, config, start_date, end_date)
 
-    # Filter by date range
-    if start_date:
-        all_dates = [d for d in all_dates if d >= start_date]
-    if end_date:
-        all_dates = [d for d in all_dates if d <= end_date]
 
-    if not all_dates:
-        logger.warning("No dates in specified range")
-        return {}
+def run_backtest_arrays(
+    arrays: BacktestArrays,
+    config: AppConfig,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+) -> dict:
+    """
+    Run backtest with lagged positions on pre-extracted arrays.
 
-    # Create aligned returns DataFrame
-    returns_dict = {}
-    for symbol, df in data.items():
-        if df.empty:
-            continue
-        symbol_returns = df["close"].pct_change()
-        returns_dict[symbol] = symbol_returns
+    Indicators are causal, so scores and gates are computed once over the
+    full history and each rebalance date only reads its own row, instead of
+    recomputing every indicator on the history up to each date.
 
-    if not returns_dict:
-        logger.warning("No returns calculated")
-        return {}
+    Args:
+        arrays: Backtest universe from ``build_backtest_arrays``
+        config: Application configuration
+        start_date: Start date for backtest
+        end_date: End date for backtest
 
-    returns = pd.DataFrame(returns_dict)
-    returns = returns.loc[all_dates]
-    returns = returns.fillna(0.0)
+    Returns:
+        Dictionary with backtest results
+    """
+    results: dict = {}
+    for results in iter_backtest_arrays(arrays, config, start_date, end_date):
+        pass
+    return results
 
-    # Initialize positions (lagged by +1 bar)
-    positions = pd.DataFrame(0.0, index=returns.index, columns=returns.columns)
-    weights_history = []
 
-    # Rebalance dates (daily for now)
-    rebalance_dates = all_dates
+def iter_backtest_arrays(
+    arrays: BacktestArrays,
+    config: AppConfig,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    checkpoints: Sequence[datetime] = (),
+) -> Iterator[dict]:
+    """
+    Run a backtest in stages, yielding partial results at each checkpoint.
 
-    for i, date in enumerate(rebalance_dates):
-        if i == 0:
-            # First date: no positions yet (lagged)
-            weights_history.append({date: {}})
-            continue
+    Each checkpoint yields the results for the dates up to and including it
+    (the leading rows of the full backtest); the last item is the full result.
+    Callers can stop iterating to abandon a run or resume it later, so
+    candidates can be ranked on a prefix before paying for the rest.
+
+    Args:
+        arrays: Backtest universe from ``build_backtest_arrays``
+        config: Application configuration
+        start_date: Start date for backtest
+        end_date: End date for backtest
+        checkpoints: Sorted dates at which to yield partial results
+
+    Yields:
+        Partial results per checkpoint, then the full backtest results
+        (empty dictionaries if there are no dates in range)
+    """
+    dates = arrays.dates
+    lo = 0 if not start_date else dates.searchsorted(pd.Timestamp(start_date), side="left")
+    hi = len(dates) if not end_date else dates.searchsorted(pd.Timestamp(end_date), side="right")
+
+    if lo >= hi:
+        logger.warning("No dates in specified range")
+        for _ in range(len(checkpoints) + 1):
+            yield {}
+        return
+
+    symbols = arrays.symbols
+    returns = arrays.returns_frame(lo, hi)
+    all_dates = list(returns.index)
+
+    # Signals for the selectable symbols over the full history
+    selectable_idx = np.flatnonzero(arrays.selectable)
+    selectable_symbols = [symbols[j] for j in selectable_idx]
+    close = arrays.close[:, selectable_idx]
+    signals = None
+    if len(selectable_idx):
+        try:
+            signals = compute_signal_matrices(
+                close, arrays.high[:, selectable_idx], arrays.low[:, selectable_idx], config
+            )
+        except Exception as e:
+            logger.error(f"Error computing backtest signals: {e}")
+
+    # Row of each symbol's last bar on or before each date (-1 = no bar yet)
+    rows = np.where(~np.isnan(close), np.arange(len(dates))[:, None], -1)
+    last_row = np.maximum.accumulate(rows, axis=0) if len(rows) else rows
+    cols = np.arange(len(selectable_idx))
+
+    # Weights matrix (dates x symbols); row i holds the weights chosen on date i
+    symbol_pos = {symbol: j for j, symbol in enumerate(symbols)}
+    weights_matrix = np.zeros((len(returns.index), len(symbols)))
 
-        # Get data up to current date (for selection/weighting)
-        date_data = {}
-        for symbol, df in data.items():
-            if not df.empty:
-                date_df = df[df.index <= date]
-                if not date_df.empty:
-                    date_data[symbol] = date_df
+    # Number of leading rows covered by each checkpoint
+    checkpoint_rows = [int(returns.index.searchsorted(pd.Timestamp(cp), side="right")) for cp in checkpoints]
+    next_checkpoint = 0
 
-        if not date_data:
-            weights_history.append({date: {}})
+    # Rebalance daily; the first date has no positions yet (lagged)
+    for i in range(1, hi - lo):
+        while next_checkpoint < len(checkpoint_rows) and checkpoint_rows[next_checkpoint] <= i:
+            k = checkpoint_rows[next_checkpoint]
+            yield _assemble_results(weights_matrix[:k], returns.iloc[:k], config, all_dates[:k])
+            next_checkpoint += 1
+
+        if signals is None:
             continue
 
+        score_matrix, long_ok_matrix = signals
+        date = all_dates[i]
+        row = last_row[lo + i]
+        has_bar = row >= 0
+        safe_row = np.maximum(row, 0)
+
         try:
-            # Select assets
-            selected = select_assets(date_data, returns, config, date=date)
+            score_vec = np.where(has_bar, score_matrix[safe_row, cols], np.nan)
+            long_ok_vec = has_bar & long_ok_matrix[safe_row, cols]
+            selected = select_from_signals(selectable_symbols, score_vec, long_ok_vec, returns, config, date)
 
             if not selected:
-                weights_history.append({date: {}})
                 # Positions remain 0 (from previous)
                 continue
 
             # Calculate weights
             asset_weights = calculate_weights(selected, returns, config)
 
-            if not asset_weights:
-                weights_history.append({date: {}})
-                continue
-
             # Store weights for this date
-            weights_history.append({date: asset_weights})
-
-            # Apply positions with +1 bar lag
-            # Positions at date i are based on weights calculated at date i-1
-            if i < len(returns.index):
-                next_date_idx = returns.index.get_loc(date)
-                if next_date_idx < len(returns.index) - 1:
-                    # Set positions for NEXT bar (lagged)
-                    next_date = returns.index[next_date_idx + 1]
-                    for symbol, weight in asset_weights.items():
-                        if symbol in positions.columns:
-                            positions.loc[next_date, symbol] = weight
+            for symbol, weight in asset_weights.items():
+                if symbol in symbol_pos:
+                    weights_matrix[i, symbol_pos[symbol]] = weight
 
         except Exception as e:
-            logger.error(f"Error in backtest at {date}: {e}")
-            weights_history.append({date: {}})
+            logger.error("Error in backtest at %s: %s", date, e)
+            weights_matrix[i] = 0.0
+
+    results = _assemble_results(weights_matrix, returns, config, all_dates)
+    for _ in range(next_checkpoint, len(checkpoint_rows)):
+        yield results
+    yield results
+
+
+def _assemble_results(
+    weights_matrix: np.ndarray,
+    returns: pd.DataFrame,
+    config: AppConfig,
+    all_dates: list,
+) -> dict:
+    """
+    Turn per-date target weights into lagged positions, costs and equity.
+
+    Args:
+        weights_matrix: (dates x symbols) weights chosen on each date
+        returns: Aligned returns (NaN filled with 0)
+        config: Application configuration
+        all_dates: Backtest dates
+
+    Returns:
+        Dictionary with backtest results
+    """
+    symbols = list(returns.columns)
+
+    # Apply positions with +1 bar lag
+    # Positions at date i are based on weights calculated at date i-1
+    position_matrix = np.zeros_like(weights_matrix)
+    position_matrix[1:] = weights_matrix[:-1]
+    positions = pd.DataFrame(position_matrix, index=returns.index, columns=symbols)
 
     # Calculate portfolio returns (lagged positions)
     # Position at t-1 * return at t
-    portfolio_returns = pd.Series(0.0, index=returns.index)
-
-    for i in range(1, len(returns.index)):
-        date = returns.index[i]
-        prev_date = returns.index[i - 1]
-
-        # Get positions from previous bar
-        prev_positions = positions.loc[prev_date]
-
-        # Calculate portfolio return
-        date_returns = returns.loc[date]
-        portfolio_return = (prev_positions * date_returns).sum()
-        portfolio_returns.loc[date] = portfolio_return
-
-    # Calculate turnover
-    turnover = pd.Series(0.0, index=returns.index)
-    for i in range(1, len(weights_history)):
-        if i < len(returns.index):
-            date = returns.index[i]
-            prev_weights = weights_history[i - 1].get(list(weights_history[i - 1].keys())[0], {})
-            curr_weights = weights_history[i].get(list(weights_history[i].keys())[0], {})
-
-            # Calculate absolute change
-            all_symbols = set(prev_weights.keys()) | set(curr_weights.keys())
-            total_turnover = sum(abs(curr_weights.get(s, 0) - prev_weights.get(s, 0)) for s in all_symbols)
-            turnover.loc[date] = total_turnover
+    returns_matrix = returns.to_numpy()
+    portfolio_values = np.zeros(len(returns.index))
+    portfolio_values[1:] = (position_matrix[:-1] * returns_matrix[1:]).sum(axis=1)
+    portfolio_returns = pd.Series(portfolio_values, index=returns.index)
+
+    # Calculate turnover (absolute change in weights between consecutive dates)
+    turnover_values = np.zeros(len(returns.index))
+    turnover_values[1:] = np.abs(np.diff(weights_matrix, axis=0)).sum(axis=1)
+    turnover = pd.Series(turnover_values, index=returns.index)
+
+    # Weights history stored as a compact float32 (dates x symbols) frame
+    weights_history = pd.DataFrame(weights_matrix.astype(np.float32), index=returns.index, columns=symbols)
 
     # Calculate costs
     costs = calculate_costs(
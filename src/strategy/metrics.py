@@ -75,14 +75,19 @@ def calculate_max_drawdown(equity: pd.Series) -> float:
     if len(equity) < 2:
         return 0.0
 
-    # Calculate running maximum
-    running_max = equity.expanding().max()
+    return _max_drawdown(equity.to_numpy(dtype=np.float64))
 
-    # Calculate drawdown
-    drawdown = (equity - running_max) / running_max
 
-    max_dd = drawdown.min()
-    return max_dd
+def _max_drawdown(values: np.ndarray) -> float:
+    """Maximum drawdown of an equity array with at least two values."""
+    # Running maximum in one ufunc pass; fmax skips NaNs like expanding().max()
+    running_max = np.fmax.accumulate(values)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown = (values - running_max) / running_max
+
+    # fmin skips NaNs like Series.min() (NaN only if every drawdown is NaN)
+    return float(np.fmin.reduce(drawdown))
 
 
 def calculate_calmar(cagr: float, max_drawdown: float) -> float:
@@ -163,11 +168,28 @@ def calculate_all_metrics(
     Returns:
         Dictionary with all metrics
     """
-    cagr_val = calculate_cagr(equity, periods_per_year)
-    sharpe_val = calculate_sharpe(returns, periods_per_year=periods_per_year)
-    max_dd = calculate_max_drawdown(equity)
+    equity_values = equity.to_numpy(dtype=np.float64)
+    mean, std, max_dd, gains, losses = _fused_stats(returns.to_numpy(dtype=np.float64), equity_values)
+
+    # Same formulas and edge cases as the individual calculate_* functions
+    cagr_val = 0.0
+    years = (len(equity) - 1) / periods_per_year
+    if len(equity) >= 2 and equity_values[0] != 0 and years > 0:
+        cagr_val = float((equity_values[-1] / equity_values[0]) ** (1.0 / years) - 1.0)
+
+    sharpe_val = 0.0
+    if len(returns) >= 2 and std != 0 and not np.isnan(std):
+        sharpe_val = float(mean / std * np.sqrt(periods_per_year))
+
     calmar_val = calculate_calmar(cagr_val, max_dd)
-    pf = calculate_profit_factor(returns)
+
+    if len(returns) == 0:
+        pf = 0.0
+    elif losses == 0:
+        pf = float("inf") if gains > 0 else 0.0
+    else:
+        pf = gains / losses
+
     turnover_ann = calculate_turnover_annualized(turnover, periods_per_year)
 
     metrics = {
@@ -180,3 +202,36 @@ def calculate_all_metrics(
     }
 
     return metrics
+
+
+def _fused_stats(returns: np.ndarray, equity: np.ndarray) -> tuple[float, float, float, float, float]:
+    """
+    Compute the return and equity statistics behind calculate_all_metrics.
+
+    Each input is converted and masked once and every statistic is derived
+    from those buffers. Reductions mirror pandas' skipna mean/std (ddof=1) and
+    boolean-filtered sums, so results match the individual metric functions.
+
+    Args:
+        returns: Return values (NaN = missing)
+        equity: Equity curve values
+
+    Returns:
+        Tuple of (mean return, return std, max drawdown, gross gains, gross losses)
+    """
+    mask = np.isnan(returns)
+    count = len(returns) - int(mask.sum())
+    filled = np.where(mask, 0.0, returns) if count < len(returns) else returns
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = filled.sum() / count if count > 0 else np.nan
+        sq_dev = (mean - filled) ** 2
+        if count < len(returns):
+            sq_dev[mask] = 0.0
+        std = np.sqrt(sq_dev.sum() / (count - 1)) if count > 1 else np.nan
+
+    gains = float(returns[returns > 0].sum())
+    losses = abs(float(returns[returns < 0].sum()))
+    max_dd = _max_drawdown(equity) if len(equity) >= 2 else 0.0
+
+    return float(mean), float(std), max_dd, gains, losses
@@ -1,17 +1,23 @@
 """Permutation testing (IMCPT-lite) with joint permutations."""
-import random
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 import pandas as pd
 
 from src.core.config import AppConfig
+from src.core.jit import NUMBA_AVAILABLE, njit
 from src.core.logging import get_logger
+from src.strategy.backtest import slice_by_date
 from src.strategy.walkforward import generate_walkforward_windows, grid_search
 
 logger = get_logger(__name__)
 
+# Minimum valid runs before adaptive stopping may end a permutation test
+ADAPTIVE_MIN_RUNS = 20
+
 
 def permute_returns_joint(returns: pd.DataFrame, seed: Optional[int] = None) -> pd.DataFrame:
     """
@@ -27,24 +33,197 @@ def permute_returns_joint(returns: pd.DataFrame, seed: Optional[int] = None) ->
     if returns.empty:
         return returns
 
-    if seed is not None:
-        np.random.seed(seed)
-        random.seed(seed)
+    # Local generator (same stream as np.random.seed) so concurrent runs don't share state
+    rng = np.random.RandomState(seed)
+
+    # Permute the dates while keeping columns together. This preserves
+    # cross-asset correlations within each time period. One row gather on the
+    # values; the original index order is kept.
+    indices = rng.permutation(len(returns))
+    values = returns.to_numpy()
+    if NUMBA_AVAILABLE and values.dtype == np.float64:
+        permuted = np.empty(values.shape)
+        _permute_rows_kernel(np.ascontiguousarray(values), indices, permuted)
+    else:
+        permuted = values[indices]
+    return pd.DataFrame(permuted, index=returns.index, columns=returns.columns, copy=False)
+
+
+@njit(cache=True)
+def _permute_rows_kernel(values: np.ndarray, indices: np.ndarray, out: np.ndarray) -> None:
+    """Gather rows of values into out (out[i] = values[indices[i]])."""
+    # Serial on purpose: permutation runs already execute on a thread pool, and
+    # Numba's parallel workqueue layer cannot be entered from several threads
+    for i in range(values.shape[0]):
+        src = indices[i]
+        for j in range(values.shape[1]):
+            out[i, j] = values[src, j]
+
+
+def partial_shuffle(T: int, k: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draw the first k entries of a uniform random permutation of range(T).
+
+    Runs a sparse Fisher-Yates shuffle that only touches k positions, so the
+    cost is O(k) rather than O(T). Swap offsets are decoded in batches from a
+    single random integer via repeated divmod (mixed-radix digits), keeping
+    each batch's range product below 2**63 so every digit stays unbiased.
+
+    Args:
+        T: Length of the sequence being shuffled
+        k: Number of positions to sample (0 <= k <= T)
+        rng: NumPy random generator
+
+    Returns:
+        Array of k distinct indices in [0, T), in random order
+    """
+    if not 0 <= k <= T:
+        raise ValueError(f"k must be between 0 and T ({T}), got {k}")
+
+    swapped: dict[int, int] = {}
+    result = np.empty(k, dtype=np.int64)
+    i = 0
+    while i < k:
+        # Pack as many ranges as fit into one 63-bit draw
+        bound = T - i
+        end = i + 1
+        while end < k and bound * (T - end) < 2**63:
+            bound *= T - end
+            end += 1
+        r = int(rng.integers(0, bound))
+
+        for pos in range(i, end):
+            r, offset = divmod(r, T - pos)
+            j = pos + offset
+            result[pos] = swapped.get(j, j)
+            swapped[j] = swapped.get(pos, pos)
+        i = end
+
+    return result
+
+
+def permute_returns_joint_partial(returns: pd.DataFrame, k: int, seed: Optional[int] = None) -> pd.DataFrame:
+    """
+    Jointly permute only k randomly chosen dates of the returns.
 
-    # Create copy
-    permuted = returns.copy()
+    The k sampled rows are shuffled among their own positions while all other
+    rows stay in place. Cross-asset structure is preserved within each date.
 
-    # Permute the index (dates) while keeping columns together
-    # This preserves cross-asset correlations within each time period
-    permuted_index = returns.index.copy()
-    indices = np.arange(len(permuted_index))
-    np.random.shuffle(indices)
-    permuted = permuted.iloc[indices].copy()
-    permuted.index = returns.index  # Restore original index order
+    Args:
+        returns: DataFrame with returns (columns = symbols, index = dates)
+        k: Number of dates to permute
+        seed: Random seed for reproducibility
+
+    Returns:
+        Partially permuted returns DataFrame
+    """
+    if returns.empty:
+        return returns
+
+    n = len(returns)
+    if k >= n:
+        return permute_returns_joint(returns, seed=seed)
+
+    rng = np.random.default_rng(seed)
+    sampled = partial_shuffle(n, k, rng)
+
+    indices = np.arange(n)
+    indices[np.sort(sampled)] = sampled
+    permuted = returns.iloc[indices].copy()
+    permuted.index = returns.index
 
     return permuted
 
 
+def wilson_interval(hits: int, n: int, z: float = 1.96) -> tuple[float, float]:
+    """
+    Wilson score confidence interval for a binomial proportion.
+
+    Args:
+        hits: Number of successes
+        n: Number of trials
+        z: Normal quantile (1.96 = 95% two-sided)
+
+    Returns:
+        Tuple of (lower, upper) bounds
+    """
+    if n == 0:
+        return 0.0, 1.0
+
+    p_hat = hits / n
+    denom = 1 + z**2 / n
+    center = (p_hat + z**2 / (2 * n)) / denom
+    half_width = z * np.sqrt(p_hat * (1 - p_hat) / n + z**2 / (4 * n**2)) / denom
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+def _run_permutation(
+    train_data: dict[str, pd.DataFrame],
+    train_returns: pd.DataFrame,
+    config: AppConfig,
+    train_start: datetime,
+    train_end: datetime,
+    seed: int,
+) -> Optional[float]:
+    """
+    Run a single permutation: permute returns and re-run the grid search.
+
+    Args:
+        train_data: Training-window OHLCV data per symbol
+        train_returns: Training-window returns
+        config: Application configuration
+        train_start: Training start date
+        train_end: Training end date
+        seed: Random seed for this run
+
+    Returns:
+        Best grid-search score on the permuted data, or None if no valid parameters
+    """
+    if config.permutation.partial_k is not None:
+        permuted_returns = permute_returns_joint_partial(train_returns, config.permutation.partial_k, seed=seed)
+    else:
+        permuted_returns = permute_returns_joint(train_returns, seed=seed)
+
+    permuted_grid_result = grid_search(train_data, permuted_returns, config, train_start, train_end)
+
+    if permuted_grid_result["params"] is None:
+        return None
+    return permuted_grid_result["score"]
+
+
+# Per-process state for permutation workers, set once by _init_permutation_worker
+_permutation_worker_state: dict = {}
+
+
+def _init_permutation_worker(
+    train_data: dict[str, pd.DataFrame],
+    train_returns: pd.DataFrame,
+    config: AppConfig,
+    train_start: datetime,
+    train_end: datetime,
+) -> None:
+    """Store the training window in a permutation worker process."""
+    _permutation_worker_state.update(
+        train_data=train_data,
+        train_returns=train_returns,
+        config=config,
+        train_start=train_start,
+        train_end=train_end,
+    )
+
+
+def _evaluate_permutation(seed: int) -> Optional[float]:
+    """Run one permutation inside a worker process."""
+    return _run_permutation(
+        _permutation_worker_state["train_data"],
+        _permutation_worker_state["train_returns"],
+        _permutation_worker_state["config"],
+        _permutation_worker_state["train_start"],
+        _permutation_worker_state["train_end"],
+        seed,
+    )
+
+
 def run_permutation_test(
     data: dict[str, pd.DataFrame],
     returns: pd.DataFrame,
@@ -72,11 +251,11 @@ def run_permutation_test(
     # Filter data to training period
     train_data = {}
     for symbol, df in data.items():
-        train_df = df[(df.index >= train_start) & (df.index < train_end)]
+        train_df = slice_by_date(df, train_start, train_end)
         if not train_df.empty:
             train_data[symbol] = train_df
 
-    train_returns = returns[(returns.index >= train_start) & (returns.index < train_end)]
+    train_returns = slice_by_date(returns, train_start, train_end)
 
     if not train_data or train_returns.empty:
         logger.warning(f"Insufficient data for permutation test {train_start} to {train_end}")
@@ -93,31 +272,71 @@ def run_permutation_test(
     real_score = real_grid_result["score"]
     logger.info(f"Real best score: {real_score:.4f}")
 
-    # Run permutations
+    # Run permutations in batches of n_jobs. Worker threads share train_data and
+    # train_returns in memory; worker processes receive them once via the
+    # initializer, so nothing is pickled or copied per run.
     permuted_scores = []
-    np.random.seed(seed)
-    random.seed(seed)
-
-    for run in range(runs):
-        if (run + 1) % 50 == 0:
-            logger.info(f"Permutation run {run+1}/{runs}")
-
-        # Permute returns
-        permuted_returns = permute_returns_joint(train_returns, seed=seed + run)
-
-        # Run grid search on permuted data
-        permuted_grid_result = grid_search(train_data, permuted_returns, config, train_start, train_end)
-
-        if permuted_grid_result["params"] is not None:
-            permuted_score = permuted_grid_result["score"]
-            permuted_scores.append(permuted_score)
+    hits = 0
+    stopped_early = False
+    n_jobs = config.permutation.n_jobs
+    n_jobs = max(1, (os.cpu_count() or 1) if n_jobs == -1 else n_jobs)
+
+    def score_run(run_seed: int) -> Optional[float]:
+        return _run_permutation(train_data, train_returns, config, train_start, train_end, run_seed)
+
+    executor: Optional[Executor] = None
+    worker_fn: Callable[[int], Optional[float]] = score_run
+    if n_jobs > 1 and config.permutation.backend == "process":
+        # Each worker process runs a serial grid search so the two levels of
+        # parallelism don't oversubscribe the cores
+        worker_config = config.model_copy(
+            update={"walkforward": config.walkforward.model_copy(update={"n_jobs": 1})}
+        )
+        executor = ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_init_permutation_worker,
+            initargs=(train_data, train_returns, worker_config, train_start, train_end),
+        )
+        worker_fn = _evaluate_permutation
+    elif n_jobs > 1:
+        executor = ThreadPoolExecutor(max_workers=n_jobs)
+
+    try:
+        for batch_start in range(0, runs, n_jobs):
+            batch = range(batch_start, min(batch_start + n_jobs, runs))
+            for run in batch:
+                if (run + 1) % 50 == 0:
+                    logger.info(f"Permutation run {run+1}/{runs}")
+
+            seeds = [seed + run for run in batch]
+            batch_scores = list(executor.map(worker_fn, seeds)) if executor else [score_run(s) for s in seeds]
+
+            for permuted_score in batch_scores:
+                if permuted_score is not None:
+                    permuted_scores.append(permuted_score)
+                    if permuted_score >= real_score:
+                        hits += 1
+
+            # Stop once the p-value CI lies entirely on one side of alpha
+            if config.permutation.adaptive_stopping and len(permuted_scores) >= ADAPTIVE_MIN_RUNS:
+                lower, upper = wilson_interval(hits, len(permuted_scores))
+                if upper < config.permutation.alpha or lower > config.permutation.alpha:
+                    logger.info(
+                        f"Adaptive stopping after {batch[-1]+1}/{runs} runs "
+                        f"(p-value CI [{lower:.4f}, {upper:.4f}])"
+                    )
+                    stopped_early = True
+                    break
+    finally:
+        if executor:
+            executor.shutdown()
 
     if not permuted_scores:
         logger.warning("No valid permuted scores generated")
         return {"p_value": None, "real_score": real_score, "permuted_scores": []}
 
     # Calculate p-value: fraction of permuted scores >= real score
-    p_value = sum(1 for score in permuted_scores if score >= real_score) / len(permuted_scores)
+    p_value = hits / len(permuted_scores)
 
     logger.info(f"Permutation test complete: p-value = {p_value:.4f} (real score: {real_score:.4f})")
 
@@ -127,6 +346,7 @@ def run_permutation_test(
         "permuted_scores": permuted_scores,
         "runs": runs,
         "valid_runs": len(permuted_scores),
+        "stopped_early": stopped_early,
     }
 
 
@@ -152,17 +372,14 @@ def run_permutation_tests_on_windows(
     """
     # Determine date range
     if start_date is None or end_date is None:
-        all_dates = set()
-        for df in data.values():
-            if not df.empty:
-                all_dates.update(df.index)
-        if not all_dates:
+        # Only the global bounds are needed, not the union of all dates
+        frames = [df for df in data.values() if not df.empty]
+        if not frames:
             return []
-        all_dates = sorted(all_dates)
         if start_date is None:
-            start_date = all_dates[0]
+            start_date = min(df.index.min() for df in frames)
         if end_date is None:
-            end_date = all_dates[-1]
+            end_date = max(df.index.max() for df in frames)
 
     # Generate windows
     windows = generate_walkforward_windows(
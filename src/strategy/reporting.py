@@ -1,32 +1,92 @@
 """Backtest plotting and reporting."""
+import importlib.util
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING, ContextManager, Optional
 
 import pandas as pd
 
 from src.core.logging import get_logger
 from src.strategy.metrics import calculate_all_metrics
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
 logger = get_logger(__name__)
 
-try:
+# matplotlib is only imported when the first figure is created (see
+# _prepare_figure), so importing this module (and the CLI) stays cheap
+PLOTTING_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
+if not PLOTTING_AVAILABLE:
+    logger.warning("Matplotlib not available, plotting disabled")
+
+# Maximum number of points drawn per line; longer series are stride-downsampled
+MAX_PLOT_POINTS = 2000
+
+# rcParams applied only while a report plot is built and rendered
+_PLOT_RC = {"path.simplify_threshold": 1.0}
+
+
+def _downsample(series: pd.Series, max_points: int = MAX_PLOT_POINTS) -> pd.Series:
+    """
+    Downsample a series by stride slicing for plotting.
+
+    Args:
+        series: Series to downsample
+        max_points: Approximate maximum number of points to keep
+
+    Returns:
+        Downsampled series (always keeps the last point)
+    """
+    if len(series) <= max_points:
+        return series
+
+    step = -(-len(series) // max_points)  # Ceiling division
+    downsampled = series.iloc[::step]
+    if downsampled.index[-1] != series.index[-1]:
+        downsampled = pd.concat([downsampled, series.iloc[-1:]])
+    return downsampled
+
+
+def _plot_rc_context() -> ContextManager[None]:
+    """Return a context applying _PLOT_RC without changing the global rcParams."""
     import matplotlib
-    import matplotlib.pyplot as plt
 
-    matplotlib.use("Agg")  # Non-interactive backend
-    PLOTTING_AVAILABLE = True
-except ImportError:
-    PLOTTING_AVAILABLE = False
-    logger.warning("Matplotlib not available, plotting disabled")
+    return matplotlib.rc_context(_PLOT_RC)
+
+
+def _prepare_figure(fig: Optional["Figure"], figsize: tuple[float, float]) -> "Figure":
+    """
+    Return a cleared Agg-backed figure, creating one if needed.
+
+    Args:
+        fig: Figure to reuse (None = create a new one)
+        figsize: Figure size in inches
+
+    Returns:
+        Figure with an attached FigureCanvasAgg and no axes
+    """
+    if fig is None:
+        # Figure + FigureCanvasAgg directly: no pyplot, no GUI backend discovery
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=figsize, layout="constrained")
+        FigureCanvasAgg(fig)
+    else:
+        fig.clf()
+        fig.set_size_inches(figsize)
+    return fig
 
 
-def plot_equity_curve(equity: pd.Series, output_path: Path) -> None:
+def plot_equity_curve(equity: pd.Series, output_path: Path, fig: Optional["Figure"] = None) -> None:
     """
     Plot equity curve.
 
     Args:
         equity: Equity curve series
         output_path: Output file path
+        fig: Figure to draw on and reuse (default: a new figure)
     """
     if not PLOTTING_AVAILABLE:
         logger.warning("Plotting not available, skipping equity curve")
@@ -36,25 +96,28 @@ def plot_equity_curve(equity: pd.Series, output_path: Path) -> None:
         logger.warning("Empty equity series, skipping plot")
         return
 
-    plt.figure(figsize=(12, 6))
-    plt.plot(equity.index, equity.values)
-    plt.title("Equity Curve")
-    plt.xlabel("Date")
-    plt.ylabel("Equity")
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(output_path)
-    plt.close()
+    equity_ds = _downsample(equity)
+
+    with _plot_rc_context():
+        fig = _prepare_figure(fig, (12, 6))
+        ax = fig.add_subplot(111)
+        ax.plot(equity_ds.index, equity_ds.values, rasterized=True, linewidth=0.8)
+        ax.set_title("Equity Curve")
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Equity")
+        ax.grid(True)
+        fig.canvas.print_png(output_path)
     logger.info(f"Saved equity curve to {output_path}")
 
 
-def plot_drawdown(equity: pd.Series, output_path: Path) -> None:
+def plot_drawdown(equity: pd.Series, output_path: Path, fig: Optional["Figure"] = None) -> None:
     """
     Plot drawdown chart.
 
     Args:
         equity: Equity curve series
         output_path: Output file path
+        fig: Figure to draw on and reuse (default: a new figure)
     """
     if not PLOTTING_AVAILABLE:
         logger.warning("Plotting not available, skipping drawdown")
@@ -66,28 +129,33 @@ def plot_drawdown(equity: pd.Series, output_path: Path) -> None:
 
     # Calculate drawdown
     running_max = equity.expanding().max()
-    drawdown = (equity - running_max) / running_max
-
-    plt.figure(figsize=(12, 6))
-    plt.fill_between(drawdown.index, drawdown.values, 0, alpha=0.3, color="red")
-    plt.plot(drawdown.index, drawdown.values, color="red")
-    plt.title("Drawdown")
-    plt.xlabel("Date")
-    plt.ylabel("Drawdown")
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(output_path)
-    plt.close()
+    drawdown = _downsample((equity - running_max) / running_max)
+
+    with _plot_rc_context():
+        fig = _prepare_figure(fig, (12, 6))
+        ax = fig.add_subplot(111)
+        ax.fill_between(drawdown.index, drawdown.values, 0, alpha=0.3, color="red", rasterized=True)
+        ax.plot(drawdown.index, drawdown.values, color="red", rasterized=True, linewidth=0.8)
+        ax.set_title("Drawdown")
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Drawdown")
+        ax.grid(True)
+        fig.canvas.print_png(output_path)
     logger.info(f"Saved drawdown chart to {output_path}")
 
 
-def plot_monthly_returns_heatmap(returns: pd.Series, output_path: Path) -> None:
+def plot_monthly_returns_heatmap(
+    returns: pd.Series,
+    output_path: Path,
+    fig: Optional["Figure"] = None,
+) -> None:
     """
     Plot monthly returns heatmap.
 
     Args:
         returns: Return series
         output_path: Output file path
+        fig: Figure to draw on and reuse (default: a new figure)
     """
     if not PLOTTING_AVAILABLE:
         logger.warning("Plotting not available, skipping heatmap")
@@ -110,16 +178,19 @@ def plot_monthly_returns_heatmap(returns: pd.Series, output_path: Path) -> None:
 
     pivot = monthly_returns.pivot(index="year", columns="month", values=monthly_returns.columns[0])
 
-    plt.figure(figsize=(12, 8))
-    plt.imshow(pivot.values, aspect="auto", cmap="RdYlGn", vmin=-0.1, vmax=0.1)
-    plt.colorbar(label="Monthly Return")
-    plt.title("Monthly Returns Heatmap")
-    plt.xlabel("Month")
-    plt.ylabel("Year")
-    plt.xticks(range(12), ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"])
-    plt.tight_layout()
-    plt.savefig(output_path)
-    plt.close()
+    with _plot_rc_context():
+        fig = _prepare_figure(fig, (12, 8))
+        ax = fig.add_subplot(111)
+        image = ax.imshow(pivot.values, aspect="auto", cmap="RdYlGn", vmin=-0.1, vmax=0.1)
+        fig.colorbar(image, ax=ax, label="Monthly Return")
+        ax.set_title("Monthly Returns Heatmap")
+        ax.set_xlabel("Month")
+        ax.set_ylabel("Year")
+        ax.set_xticks(
+            range(12),
+            ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"],
+        )
+        fig.canvas.print_png(output_path)
     logger.info(f"Saved monthly returns heatmap to {output_path}")
 
 
@@ -150,26 +221,21 @@ def save_metrics_json(metrics: dict[str, float], output_path: Path) -> None:
     logger.info(f"Saved metrics to {output_path}")
 
 
-def save_weights_csv(weights_history: list[dict], output_path: Path) -> None:
+def save_weights_csv(weights_history: pd.DataFrame, output_path: Path) -> None:
     """
     Save weights history to CSV.
 
     Args:
-        weights_history: List of weight dictionaries
+        weights_history: Weights matrix (index = dates, columns = symbols)
         output_path: Output file path
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    rows = []
-    for weight_dict in weights_history:
-        if not weight_dict:
-            continue
-        for date, weights in weight_dict.items():
-            for symbol, weight in weights.items():
-                rows.append({"date": date, "symbol": symbol, "weight": weight})
+    # Melt the (dates x symbols) matrix into long date/symbol/weight rows
+    df = weights_history.stack().rename_axis(["date", "symbol"]).reset_index(name="weight")
+    df = df[df["weight"] != 0]
 
-    if rows:
-        df = pd.DataFrame(rows)
+    if not df.empty:
         df.to_csv(output_path, index=False)
         logger.info(f"Saved weights to {output_path}")
     else:
@@ -198,7 +264,7 @@ def generate_backtest_report(
     returns = backtest_results.get("returns", pd.Series())
     equity = backtest_results.get("equity", pd.Series())
     turnover = backtest_results.get("turnover", pd.Series())
-    weights_history = backtest_results.get("weights_history", [])
+    weights_history = backtest_results.get("weights_history", pd.DataFrame())
 
     if returns.empty or equity.empty:
         logger.warning("Empty backtest results, cannot generate report")
@@ -213,9 +279,10 @@ def generate_backtest_report(
     # Save weights CSV
     save_weights_csv(weights_history, output_dir / "weights.csv")
 
-    # Generate plots
-    plot_equity_curve(equity, output_dir / "equity.png")
-    plot_drawdown(equity, output_dir / "drawdown.png")
-    plot_monthly_returns_heatmap(returns, output_dir / "heatmap.png")
+    # Generate plots, reusing one Agg figure across all three
+    fig = _prepare_figure(None, (12, 6)) if PLOTTING_AVAILABLE else None
+    plot_equity_curve(equity, output_dir / "equity.png", fig=fig)
+    plot_drawdown(equity, output_dir / "drawdown.png", fig=fig)
+    plot_monthly_returns_heatmap(returns, output_dir / "heatmap.png", fig=fig)
 
     return metrics
@@ -1,4 +1,5 @@
 """Risk management: position limits and sanity checks."""
+import numpy as np
 
 from src.core.logging import get_logger
 
@@ -26,12 +27,13 @@ def check_position_limits(
     if len(weights) > max_positions:
         violations.append(f"Too many positions: {len(weights)} > {max_positions}")
 
-    for symbol, weight in weights.items():
-        if weight > max_weight_per_asset:
-            violations.append(f"{symbol}: weight {weight:.4f} > {max_weight_per_asset}")
+    symbols = list(weights)
+    w = np.fromiter(weights.values(), dtype=np.float64, count=len(weights))
 
-        if weight < 0:
-            violations.append(f"{symbol}: negative weight {weight:.4f}")
+    over = np.flatnonzero(w > max_weight_per_asset)
+    negative = np.flatnonzero(w < 0)
+    violations.extend(f"{symbols[i]}: weight {w[i]:.4f} > {max_weight_per_asset}" for i in over)
+    violations.extend(f"{symbols[i]}: negative weight {w[i]:.4f}" for i in negative)
 
     return (len(violations) == 0, violations)
 
@@ -52,7 +54,7 @@ def check_weight_sum(
     Returns:
         Tuple of (is_valid, error_message)
     """
-    actual_sum = sum(weights.values())
+    actual_sum = float(np.fromiter(weights.values(), dtype=np.float64, count=len(weights)).sum())
     diff = abs(actual_sum - expected_sum)
 
     if diff > tolerance:
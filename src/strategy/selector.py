@@ -1,13 +1,13 @@
 """Asset selection with ranking and correlation cap."""
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from src.core.config import AppConfig
 from src.core.logging import get_logger
 from src.features.correlation import select_with_correlation_cap
-from src.features.scoring import calculate_scores_for_dataframe
-from src.strategy.signals import calculate_signals
+from src.features.indicators import ema2d
 
 logger = get_logger(__name__)
 
@@ -33,51 +33,130 @@ def select_assets(
     if not data:
         return []
 
-    # Calculate scores for all symbols
-    scores = {}
-    long_ok_signals = {}
+    required_cols = ["open", "high", "low", "close", "volume"]
 
+    frames = {}
     for symbol, df in data.items():
         if df.empty:
             continue
 
-        # Filter to date if specified
-        if date is not None:
-            df_filtered = df[df.index <= date]
-            if df_filtered.empty:
-                continue
-            df = df_filtered
+        missing_cols = [col for col in required_cols if col not in df.columns]
+        if missing_cols:
+            logger.warning(f"Skipping {symbol}: missing required columns {missing_cols}")
+            continue
 
-        try:
-            # Calculate score
-            symbol_scores = calculate_scores_for_dataframe(
-                df,
-                ema_fast_window=config.features.ema_fast,
-                atr_window=config.features.atr_window,
-            )
+        frames[symbol] = df
 
-            if symbol_scores.empty:
-                continue
+    if not frames:
+        return []
 
-            # Get latest score
-            latest_score = symbol_scores.iloc[-1]
+    # Stack close/high/low into one dense (dates x symbols x fields) tensor so
+    # every indicator is computed once for all symbols instead of per symbol
+    fields = ["close", "high", "low"]
+    panel = pd.concat({symbol: df[fields] for symbol, df in frames.items()}, axis=1).sort_index()
 
-            # Check if score meets minimum
-            if latest_score < config.selection.min_score:
-                continue
+    # Filter to date if specified
+    if date is not None:
+        panel = panel.loc[:date]
 
-            scores[symbol] = latest_score
+    if panel.empty:
+        return []
 
-            # Calculate signals to check long_ok
-            signals = calculate_signals(df, config)
-            long_ok_signals[symbol] = signals.get(symbol, False)
+    symbols = list(frames)
+    tensor = panel.to_numpy(dtype=np.float64).reshape(len(panel), len(symbols), len(fields))
+    close = tensor[:, :, 0]
 
-        except Exception as e:
-            logger.error(f"Error calculating score for {symbol}: {e}")
-            continue
+    # Last bar on or before the date for each symbol (symbols may have gaps)
+    has_bar = ~np.isnan(close)
+    last_row = len(panel) - 1 - np.argmax(has_bar[::-1], axis=0)
+    cols = np.arange(len(symbols))
+
+    score_matrix, long_ok_matrix = compute_signal_matrices(close, tensor[:, :, 1], tensor[:, :, 2], config)
+    score_vec = score_matrix[last_row, cols]
+    long_ok_vec = has_bar.any(axis=0) & long_ok_matrix[last_row, cols]
+
+    return select_from_signals(symbols, score_vec, long_ok_vec, returns, config, date)
+
+
+def compute_signal_matrices(
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    config: AppConfig,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute scores and long_ok gates for every (date, symbol) cell at once.
+
+    All indicators are causal, so row t only depends on rows <= t and the
+    matrices can be computed once over a full history and read per date.
+
+    Args:
+        close: (dates x symbols) close prices, NaN where a symbol has no bar
+        high: (dates x symbols) high prices
+        low: (dates x symbols) low prices
+        config: Application configuration
+
+    Returns:
+        Tuple of (score matrix, long_ok matrix); only rows where a symbol has
+        a bar are meaningful
+    """
+    # EMAs per symbol over its own bars (gaps carry the last value), all symbols
+    # in one call. Cached by span so MACD reuses the trend EMAs when the periods
+    # coincide.
+    ema_cache: dict[int, np.ndarray] = {}
+
+    def ema_matrix(span: int) -> np.ndarray:
+        if span not in ema_cache:
+            ema_cache[span] = ema2d(close, span=span)
+        return ema_cache[span]
+
+    ema_fast = ema_matrix(config.features.ema_fast)
+    ema_slow = ema_matrix(config.features.ema_slow)
+
+    # True range against each symbol's previous close (first bar uses its own close)
+    prev_close = pd.DataFrame(close).ffill().shift(1).to_numpy()
+    prev_close = np.where(np.isnan(prev_close), close, prev_close)
+    true_range = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+    atr_values = ema2d(true_range, alpha=1.0 / config.features.atr_window)
+
+    # Score = ((Close / EMA20) - 1) / max(ATR%, eps)
+    score = (close / ema_fast - 1.0) / np.maximum(atr_values / close, 1e-6)
+    long_ok = ema_fast > ema_slow
+
+    # Optional MACD gate: MACD line = EMA(fast) - EMA(slow) > 0
+    if config.features.macd.enabled:
+        macd_cfg = config.features.macd
+        if macd_cfg.fast <= 0 or macd_cfg.slow <= 0 or macd_cfg.fast >= macd_cfg.slow:
+            raise ValueError(f"Invalid MACD periods: fast={macd_cfg.fast}, slow={macd_cfg.slow}")
+        long_ok &= ema_matrix(macd_cfg.fast) - ema_matrix(macd_cfg.slow) > 0
+
+    return score, long_ok
+
+
+def select_from_signals(
+    symbols: list[str],
+    score_vec: np.ndarray,
+    long_ok_vec: np.ndarray,
+    returns: pd.DataFrame,
+    config: AppConfig,
+    date: Optional[pd.Timestamp] = None,
+) -> list[str]:
+    """
+    Apply the min-score gate and correlation cap to per-symbol signals.
 
-    # Filter to only long_ok symbols
-    long_ok_scores = {s: score for s, score in scores.items() if long_ok_signals.get(s, False)}
+    Args:
+        symbols: Symbols matching the signal vectors
+        score_vec: Latest score per symbol
+        long_ok_vec: Latest long_ok gate per symbol
+        returns: DataFrame with returns (columns = symbols, index = dates)
+        config: Application configuration
+        date: Date for selection (default: most recent)
+
+    Returns:
+        List of selected symbols
+    """
+    candidates = long_ok_vec & (score_vec >= config.selection.min_score)
+    long_ok_scores = {symbols[j]: float(score_vec[j]) for j in np.flatnonzero(candidates)}
 
     if not long_ok_scores:
         logger.info("No assets pass long_ok gates")
@@ -93,5 +172,5 @@ def select_assets(
         date=date,
     )
 
-    logger.info(f"Selected {len(selected)} assets: {selected}")
+    logger.info("Selected %d assets: %s", len(selected), selected)
     return selected
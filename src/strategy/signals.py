@@ -107,53 +107,40 @@ def calculate_signals(
         # Single symbol case - assume symbol name from columns or index name
         symbols = ["UNKNOWN"]
 
+    required_cols = ["open", "high", "low", "close", "volume"]
+
     for symbol in symbols:
-        try:
-            if isinstance(df.index, pd.MultiIndex):
-                symbol_df = df.loc[symbol]
-            else:
-                symbol_df = df
-
-            if symbol_df.empty:
-                signals[symbol] = False
-                continue
-
-            required_cols = ["open", "high", "low", "close", "volume"]
-            if not all(col in symbol_df.columns for col in required_cols):
-                signals[symbol] = False
-                continue
-
-            close = symbol_df["close"]
-            # high = symbol_df["high"]  # Reserved for future use (stop losses, etc.)
-            # low = symbol_df["low"]    # Reserved for future use (stop losses, etc.)
-
-            # Calculate EMAs
-            ema_fast = ema(close, config.features.ema_fast)
-            ema_slow = ema(close, config.features.ema_slow)
-
-            # Calculate MACD if enabled
-            macd_line = None
-            if config.features.macd.enabled:
-                macd_line, _, _ = macd(
-                    close,
-                    fast=config.features.macd.fast,
-                    slow=config.features.macd.slow,
-                    signal=config.features.macd.signal,
-                )
-
-            # Check long_ok
-            long_ok = check_long_ok(
+        symbol_df = df.loc[symbol] if isinstance(df.index, pd.MultiIndex) else df
+
+        if symbol_df.empty or not all(col in symbol_df.columns for col in required_cols):
+            signals[symbol] = False
+            continue
+
+        close = symbol_df["close"]
+        # high = symbol_df["high"]  # Reserved for future use (stop losses, etc.)
+        # low = symbol_df["low"]    # Reserved for future use (stop losses, etc.)
+
+        # Calculate EMAs
+        ema_fast = ema(close, config.features.ema_fast)
+        ema_slow = ema(close, config.features.ema_slow)
+
+        # Calculate MACD if enabled
+        macd_line = None
+        if config.features.macd.enabled:
+            macd_line, _, _ = macd(
                 close,
-                ema_fast,
-                ema_slow,
-                macd_line,
-                config.features.macd.enabled,
+                fast=config.features.macd.fast,
+                slow=config.features.macd.slow,
+                signal=config.features.macd.signal,
             )
 
-            signals[symbol] = long_ok
-
-        except Exception as e:
-            logger.error(f"Error calculating signal for {symbol}: {e}")
-            signals[symbol] = False
+        # Check long_ok
+        signals[symbol] = check_long_ok(
+            close,
+            ema_fast,
+            ema_slow,
+            macd_line,
+            config.features.macd.enabled,
+        )
 
     return signals
@@ -1,16 +1,44 @@
 """Walk-forward analysis with rolling train/OOS re-optimization."""
-from datetime import datetime, timedelta
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow.dataset as ds
 
 from src.core.config import AppConfig
 from src.core.logging import get_logger
-from src.strategy.backtest import run_backtest
+from src.strategy.backtest import (
+    BacktestArrays,
+    build_backtest_arrays,
+    iter_backtest_arrays,
+    run_backtest,
+    run_backtest_arrays,
+    slice_by_date,
+)
 from src.strategy.metrics import calculate_all_metrics
 
 logger = get_logger(__name__)
 
+try:
+    from scipy.stats import qmc
+
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Grid-candidate objectives memoized across windows and repeated searches (LRU).
+# Guarded by a lock because permutation runs call grid_search from threads.
+SCORE_CACHE_SIZE = 4096
+_score_cache: "OrderedDict[tuple, Optional[float]]" = OrderedDict()
+_score_cache_lock = threading.Lock()
+
 
 def generate_walkforward_windows(
     start_date: datetime,
@@ -30,29 +58,285 @@ def generate_walkforward_windows(
     Returns:
         List of (train_start, train_end, oos_start, oos_end) tuples
     """
-    windows = []
-    current_date = start_date
+    # Each window starts where the previous training period ended. Calendar
+    # offsets keep boundaries on the same day of year across leap years.
+    train_offset = pd.DateOffset(years=train_years)
+    starts = pd.date_range(start_date, end_date, freq=train_offset, inclusive="left")
+    train_ends = starts + train_offset
+    end = pd.Timestamp(end_date)
+    oos_ends = train_ends + pd.DateOffset(months=oos_months)
+    oos_ends = oos_ends.where(oos_ends <= end, end)
+
+    keep = (train_ends <= end) & (train_ends < oos_ends)
+    return list(zip(starts[keep], train_ends[keep], train_ends[keep], oos_ends[keep]))
+
+
+def _apply_params(config: AppConfig, ema_fast: int, ema_slow: int, top_n: int, corr_cap: float) -> AppConfig:
+    """
+    Return a copy of the config with grid parameters applied.
+
+    Uses shallow ``model_copy`` on the two sections that change instead of
+    re-validating the whole config tree.
+
+    Args:
+        config: Base application configuration
+        ema_fast: Fast EMA window
+        ema_slow: Slow EMA window
+        top_n: Number of assets to select
+        corr_cap: Correlation cap
+
+    Returns:
+        Configuration copy with updated features and selection
+    """
+    return config.model_copy(
+        update={
+            "features": config.features.model_copy(update={"ema_fast": ema_fast, "ema_slow": ema_slow}),
+            "selection": config.selection.model_copy(update={"top_n": top_n, "corr_cap": corr_cap}),
+        }
+    )
+
+
+def _score_params(
+    arrays: BacktestArrays,
+    config: AppConfig,
+    train_start: datetime,
+    train_end: datetime,
+    params: tuple[int, int, int, float],
+) -> Optional[float]:
+    """
+    Backtest one grid candidate on the training period and return its objective.
+
+    Args:
+        arrays: Training-period data extracted once per grid search
+        config: Application configuration
+        train_start: Training start date
+        train_end: Training end date
+        params: (ema_fast, ema_slow, top_n, corr_cap) candidate
+
+    Returns:
+        Objective value, or None if the backtest produced no results
+    """
+    ema_fast, ema_slow, top_n, corr_cap = params
+    test_config = _apply_params(config, ema_fast, ema_slow, top_n, corr_cap)
+
+    try:
+        # Run backtest on training period
+        results = run_backtest_arrays(arrays, test_config, train_start, train_end)
+        return _objective(results, config)
+
+    except Exception as e:
+        logger.warning("Error in grid search for params %s/%s/%s/%s: %s", ema_fast, ema_slow, top_n, corr_cap, e)
+        return None
+
+
+def _objective(results: dict, config: AppConfig) -> Optional[float]:
+    """
+    Objective value of a backtest result.
+
+    Args:
+        results: Backtest results dictionary
+        config: Application configuration
+
+    Returns:
+        Objective value, or None if the backtest produced no results
+    """
+    if not results:
+        return None
+
+    equity = results.get("equity", pd.Series())
+    returns_series = results.get("returns", pd.Series())
+    turnover = results.get("turnover", pd.Series())
+
+    if equity.empty or returns_series.empty:
+        return None
+
+    # Calculate metrics
+    metrics = calculate_all_metrics(returns_series, equity, turnover)
+
+    # Use Calmar as objective (or config objective)
+    return metrics.get(config.permutation.objective, metrics.get("Calmar", 0.0))
+
+
+def _score_params_halving(
+    arrays: BacktestArrays,
+    config: AppConfig,
+    train_start: datetime,
+    train_end: datetime,
+    candidates: list[tuple[int, int, int, float]],
+) -> list[Optional[float]]:
+    """
+    Score grid candidates with one round of successive halving.
+
+    Every candidate is backtested on the first half of the training period and
+    ranked by its partial objective; only the top half is resumed to the end.
+    Resuming continues the same run, so survivors get exactly their full-period
+    objective while pruned candidates skip half of their backtest.
+
+    Args:
+        arrays: Training-period data extracted once per grid search
+        config: Application configuration
+        train_start: Training start date
+        train_end: Training end date
+        candidates: (ema_fast, ema_slow, top_n, corr_cap) candidates
+
+    Returns:
+        Objective per candidate (None for pruned or failed candidates)
+    """
+    midpoint = pd.Timestamp(train_start) + (pd.Timestamp(train_end) - pd.Timestamp(train_start)) / 2
+    runs = {}
+    partial_scores = {}
+
+    for params in candidates:
+        try:
+            run = iter_backtest_arrays(arrays, _apply_params(config, *params), train_start, train_end, [midpoint])
+            partial_scores[params] = _objective(next(run), config)
+            runs[params] = run
+        except Exception as e:
+            logger.warning("Error in grid search for params %s: %s", params, e)
+
+    # Stable sort keeps grid order among equal partial scores
+    ranked = sorted(
+        (params for params, score in partial_scores.items() if score is not None),
+        key=lambda params: partial_scores[params],
+        reverse=True,
+    )
+    survivors = set(ranked[: (len(ranked) + 1) // 2])
+
+    scores: list[Optional[float]] = []
+    for params in candidates:
+        score = None
+        if params in survivors:
+            try:
+                score = _objective(next(runs[params]), config)
+            except Exception as e:
+                logger.warning("Error in grid search for params %s: %s", params, e)
+        scores.append(score)
+
+    return scores
+
+
+def _sample_candidates(
+    param_grid: dict,
+    search_mode: str,
+    n_trials: int,
+    seed: int,
+) -> list[tuple[int, int, int, float]]:
+    """
+    Sample grid candidates instead of enumerating the full grid.
+
+    Draws n_trials points over the four axis indices, either uniformly at random
+    or from a scrambled Sobol sequence, then drops invalid (ema_fast >= ema_slow)
+    and duplicate combinations.
+
+    Args:
+        param_grid: Parameter grid with ema_fast, ema_slow, top_n and corr_cap axes
+        search_mode: "random" or "sobol"
+        n_trials: Number of points to draw
+        seed: Random seed
+
+    Returns:
+        Distinct valid (ema_fast, ema_slow, top_n, corr_cap) candidates in draw order
+    """
+    axes = [param_grid["ema_fast"], param_grid["ema_slow"], param_grid["top_n"], param_grid["corr_cap"]]
+    sizes = np.array([len(axis) for axis in axes])
+
+    if search_mode == "sobol" and not SCIPY_AVAILABLE:
+        logger.warning("scipy not available, falling back to random search")
+        search_mode = "random"
+
+    if search_mode == "sobol":
+        sampler = qmc.Sobol(d=len(axes), scramble=True, seed=seed)
+        points = sampler.random_base2(m=int(np.ceil(np.log2(max(n_trials, 1)))))[:n_trials]
+        indices = np.minimum((points * sizes).astype(np.int64), sizes - 1)
+    elif search_mode == "random":
+        indices = np.random.default_rng(seed).integers(0, sizes, size=(n_trials, len(axes)))
+    else:
+        raise ValueError(f"Unknown search_mode: {search_mode}")
+
+    candidates = []
+    for row in indices:
+        ema_fast, ema_slow, top_n, corr_cap = (axis[i] for axis, i in zip(axes, row))
+        if ema_fast < ema_slow:
+            candidates.append((ema_fast, ema_slow, top_n, corr_cap))
+
+    return list(dict.fromkeys(candidates))
+
+
+def _data_fingerprint(train_data: dict[str, pd.DataFrame]) -> tuple:
+    """
+    Content hash of the training data, used as part of the score cache key.
+
+    Args:
+        train_data: Training-period OHLCV data per symbol
+
+    Returns:
+        Hashable fingerprint that changes whenever any value or date changes
+    """
+    return tuple(
+        (symbol, len(df), int(pd.util.hash_pandas_object(df, index=True).sum()))
+        for symbol, df in sorted(train_data.items())
+    )
+
+
+def _score_config_key(config: AppConfig) -> tuple:
+    """
+    Config sections that change grid-search objectives, used in the score cache key.
+
+    Execution-only settings (worker counts, permutation backend, stopping rule)
+    are left out so they don't split the cache.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        Hashable key of the result-affecting configuration
+    """
+    return (
+        config.features.model_dump_json(),
+        config.selection.model_dump_json(),
+        config.weights.model_dump_json(),
+        config.backtest.model_dump_json(),
+        config.costs.model_dump_json(),
+        config.permutation.objective,
+        # Halving reports pruned candidates as None, so it changes cached values
+        config.walkforward.reoptimize.successive_halving,
+    )
 
-    while current_date < end_date:
-        train_start = current_date
-        train_end = train_start + timedelta(days=365 * train_years)
 
-        if train_end > end_date:
-            break
+def clear_score_cache() -> None:
+    """Drop all memoized grid-search objectives."""
+    with _score_cache_lock:
+        _score_cache.clear()
 
-        oos_start = train_end
-        oos_end = oos_start + timedelta(days=30 * oos_months)
 
-        if oos_end > end_date:
-            oos_end = end_date
+# Per-process state for grid-search workers, set once by _init_grid_worker
+_grid_worker_state: dict = {}
 
-        if oos_start >= oos_end:
-            break
 
-        windows.append((train_start, train_end, oos_start, oos_end))
-        current_date = oos_start
+def _init_grid_worker(
+    arrays: BacktestArrays,
+    config: AppConfig,
+    train_start: datetime,
+    train_end: datetime,
+) -> None:
+    """Store the training arrays in a grid-search worker process."""
+    _grid_worker_state.update(
+        arrays=arrays,
+        config=config,
+        train_start=train_start,
+        train_end=train_end,
+    )
+
 
-    return windows
+def _evaluate_params(params: tuple[int, int, int, float]) -> Optional[float]:
+    """Score one grid candidate inside a worker process."""
+    return _score_params(
+        _grid_worker_state["arrays"],
+        _grid_worker_state["config"],
+        _grid_worker_state["train_start"],
+        _grid_worker_state["train_end"],
+        params,
+    )
 
 
 def grid_search(
@@ -91,65 +375,245 @@ def grid_search(
     # Filter data to training period
     train_data = {}
     for symbol, df in data.items():
-        train_df = df[(df.index >= train_start) & (df.index < train_end)]
+        train_df = slice_by_date(df, train_start, train_end)
         if not train_df.empty:
             train_data[symbol] = train_df
 
-    train_returns = returns[(returns.index >= train_start) & (returns.index < train_end)]
+    train_returns = slice_by_date(returns, train_start, train_end)
 
     if not train_data or train_returns.empty:
         logger.warning(f"Insufficient data for grid search {train_start} to {train_end}")
         return {"params": None, "score": float("-inf")}
 
-    # Grid search
-    for ema_fast in param_grid["ema_fast"]:
-        for ema_slow in param_grid["ema_slow"]:
-            if ema_fast >= ema_slow:
-                continue
+    # Flatten the grid into independent (ema_fast, ema_slow, top_n, corr_cap) candidates
+    candidates = [
+        (ema_fast, ema_slow, top_n, corr_cap)
+        for ema_fast in param_grid["ema_fast"]
+        for ema_slow in param_grid["ema_slow"]
+        if ema_fast < ema_slow
+        for top_n in param_grid["top_n"]
+        for corr_cap in param_grid["corr_cap"]
+    ]
+
+    reoptimize = config.walkforward.reoptimize
+    if reoptimize.search_mode != "grid" and reoptimize.n_trials < len(candidates):
+        candidates = _sample_candidates(param_grid, reoptimize.search_mode, reoptimize.n_trials, config.backtest.seed)
+
+    # Objectives depend only on the data, config, window and params, so identical
+    # searches (e.g. repeated windows or permutation runs) reuse earlier backtests
+    base_key = (
+        _data_fingerprint(train_data),
+        _score_config_key(config),
+        pd.Timestamp(train_start).value,
+        pd.Timestamp(train_end).value,
+    )
+    # Snapshot cached scores once so concurrent evictions can't drop them mid-search
+    scores: dict[tuple, Optional[float]] = {}
+    with _score_cache_lock:
+        for params in candidates:
+            key = (base_key, params)
+            if key in _score_cache:
+                _score_cache.move_to_end(key)
+                scores[params] = _score_cache[key]
+    pending = [params for params in candidates if params not in scores]
+
+    # Extract the training data to dense arrays once for every candidate backtest
+    arrays = None
+    if pending:
+        try:
+            arrays = build_backtest_arrays(train_data)
+        except Exception as e:
+            logger.warning(f"Error preparing grid search data {train_start} to {train_end}: {e}")
+            return {"params": None, "score": float("-inf")}
+
+    n_jobs = config.walkforward.n_jobs
+    workers = (os.cpu_count() or 1) if n_jobs == -1 else n_jobs
+    workers = min(workers, len(pending))
+
+    if config.walkforward.reoptimize.successive_halving and len(pending) >= 4:
+        # Runs are resumed in place, so halving evaluates candidates serially
+        pending_scores = _score_params_halving(arrays, config, train_start, train_end, pending)
+    elif workers > 1:
+        # Training data is shipped once per worker via the initializer, not per task
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_grid_worker,
+            initargs=(arrays, config, train_start, train_end),
+        ) as executor:
+            pending_scores = list(executor.map(_evaluate_params, pending, chunksize=4))
+    else:
+        pending_scores = [_score_params(arrays, config, train_start, train_end, params) for params in pending]
+
+    scores.update(zip(pending, pending_scores))
+    with _score_cache_lock:
+        for params, objective in zip(pending, pending_scores):
+            _score_cache[(base_key, params)] = objective
+        while len(_score_cache) > SCORE_CACHE_SIZE:
+            _score_cache.popitem(last=False)
+
+    for ema_fast, ema_slow, top_n, corr_cap in candidates:
+        objective = scores[(ema_fast, ema_slow, top_n, corr_cap)]
+        if objective is not None and objective > best_score:
+            best_score = objective
+            best_params = {
+                "ema_fast": ema_fast,
+                "ema_slow": ema_slow,
+                "top_n": top_n,
+                "corr_cap": corr_cap,
+            }
 
-            for top_n in param_grid["top_n"]:
-                for corr_cap in param_grid["corr_cap"]:
-                    # Create modified config
-                    test_config = AppConfig(**config.model_dump())
-                    test_config.features.ema_fast = ema_fast
-                    test_config.features.ema_slow = ema_slow
-                    test_config.selection.top_n = top_n
-                    test_config.selection.corr_cap = corr_cap
+    return {"params": best_params, "score": best_score}
 
-                    try:
-                        # Run backtest on training period
-                        results = run_backtest(train_data, test_config, train_start, train_end)
 
-                        if not results:
-                            continue
+def _process_window(
+    window_idx: int,
+    n_windows: int,
+    window: tuple[datetime, datetime, datetime, datetime],
+    data: dict[str, pd.DataFrame],
+    returns: pd.DataFrame,
+    config: AppConfig,
+) -> dict:
+    """
+    Optimize one walk-forward window and backtest the chosen params out of sample.
 
-                        equity = results.get("equity", pd.Series())
-                        returns_series = results.get("returns", pd.Series())
-                        turnover = results.get("turnover", pd.Series())
+    Args:
+        window_idx: Zero-based window index
+        n_windows: Total number of windows (for progress logging)
+        window: (train_start, train_end, oos_start, oos_end) tuple
+        data: Dictionary mapping symbols to sorted OHLCV DataFrames
+        returns: DataFrame with returns
+        config: Application configuration
 
-                        if equity.empty or returns_series.empty:
-                            continue
+    Returns:
+        Dictionary with chosen params, normalized OOS equity and OOS result
+        (params is None if no valid parameters; equity/result are None if no OOS backtest)
+    """
+    train_start, train_end, oos_start, oos_end = window
+    output: dict = {"params": None, "equity": None, "result": None}
+
+    logger.info(
+        "Window %d/%d: Train %s to %s, OOS %s to %s",
+        window_idx + 1,
+        n_windows,
+        train_start.date(),
+        train_end.date(),
+        oos_start.date(),
+        oos_end.date(),
+    )
 
-                        # Calculate metrics
-                        metrics = calculate_all_metrics(returns_series, equity, turnover)
+    # Grid search on training period
+    grid_result = grid_search(data, returns, config, train_start, train_end)
 
-                        # Use Calmar as objective (or config objective)
-                        objective = metrics.get(config.permutation.objective, metrics.get("Calmar", 0.0))
+    if grid_result["params"] is None:
+        logger.warning("No valid parameters found for window %d", window_idx + 1)
+        return output
 
-                        if objective > best_score:
-                            best_score = objective
-                            best_params = {
-                                "ema_fast": ema_fast,
-                                "ema_slow": ema_slow,
-                                "top_n": top_n,
-                                "corr_cap": corr_cap,
-                            }
+    best_params = grid_result["params"]
+    output["params"] = best_params
 
-                    except Exception as e:
-                        logger.warning(f"Error in grid search for params {ema_fast}/{ema_slow}/{top_n}/{corr_cap}: {e}")
-                        continue
+    # Apply best params to OOS period
+    test_config = _apply_params(config, **best_params)
 
-    return {"params": best_params, "score": best_score}
+    # Run backtest on OOS period
+    oos_data = {}
+    for symbol, df in data.items():
+        oos_df = slice_by_date(df, oos_start, oos_end, inclusive_end=True)
+        if not oos_df.empty:
+            oos_data[symbol] = oos_df
+
+    if not oos_data:
+        return output
+
+    oos_results_window = run_backtest(oos_data, test_config, oos_start, oos_end)
+
+    if oos_results_window:
+        oos_equity = oos_results_window.get("equity", pd.Series())
+        oos_returns = oos_results_window.get("returns", pd.Series())
+        oos_turnover = oos_results_window.get("turnover", pd.Series())
+
+        if not oos_equity.empty:
+            # Normalize equity to start at 1.0 for concatenation
+            output["equity"] = oos_equity / oos_equity.iloc[0]
+
+            # Calculate OOS metrics
+            output["result"] = {
+                "window": window_idx + 1,
+                "oos_start": oos_start,
+                "oos_end": oos_end,
+                "params": best_params,
+                "metrics": calculate_all_metrics(oos_returns, oos_equity, oos_turnover),
+            }
+
+    return output
+
+
+# Per-process state for walk-forward window workers, set once by _init_window_worker
+_window_worker_state: dict = {}
+
+
+def _init_window_worker(
+    data: dict[str, pd.DataFrame],
+    returns: pd.DataFrame,
+    config: AppConfig,
+    n_windows: int,
+) -> None:
+    """Store the full data set in a walk-forward window worker process."""
+    _window_worker_state.update(data=data, returns=returns, config=config, n_windows=n_windows)
+
+
+def _evaluate_window(indexed_window: tuple[int, tuple]) -> dict:
+    """Process one (index, window) pair inside a worker process."""
+    window_idx, window = indexed_window
+    return _process_window(
+        window_idx,
+        _window_worker_state["n_windows"],
+        window,
+        _window_worker_state["data"],
+        _window_worker_state["returns"],
+        _window_worker_state["config"],
+    )
+
+
+def _write_window_output(output_dir: Path, window_idx: int, output: dict) -> None:
+    """
+    Persist one window's normalized OOS equity (Parquet) and result (JSON).
+
+    Args:
+        output_dir: Directory receiving the per-window files
+        window_idx: Zero-based window index (used in file names)
+        output: Window output from _process_window with equity and result set
+    """
+    equity = output["equity"]
+    frame = pd.DataFrame(
+        {
+            "date": equity.index,
+            "equity": equity.to_numpy(dtype=np.float64),
+            "window": window_idx,
+        }
+    )
+    frame.to_parquet(output_dir / f"oos_{window_idx:04d}.parquet", engine="pyarrow", index=False)
+
+    with open(output_dir / f"m_{window_idx:04d}.json", "w") as f:
+        json.dump(output["result"], f, indent=2, default=str)
+
+
+def _read_streamed_equity(output_dir: Path) -> pd.Series:
+    """
+    Assemble the combined OOS equity from per-window Parquet files.
+
+    Args:
+        output_dir: Directory written by _write_window_output
+
+    Returns:
+        Combined equity Series (first window wins on overlapping dates)
+    """
+    files = sorted(str(path) for path in output_dir.glob("oos_*.parquet"))
+    if not files:
+        return pd.Series()
+
+    table = ds.dataset(files, format="parquet").to_table(columns=["date", "equity", "window"])
+    frame = table.to_pandas().sort_values("window", kind="stable")
+    return pd.Series(frame["equity"].to_numpy(), index=pd.DatetimeIndex(frame["date"].to_numpy()))
 
 
 def run_walkforward(
@@ -158,6 +622,7 @@ def run_walkforward(
     config: AppConfig,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
+    output_dir: Optional[Path] = None,
 ) -> dict:
     """
     Run walk-forward analysis.
@@ -168,24 +633,23 @@ def run_walkforward(
         config: Application configuration
         start_date: Start date (uses data range if not provided)
         end_date: End date (uses data range if not provided)
+        output_dir: If set, each window's OOS equity and metrics are written here
+            as soon as the window completes instead of being held in memory
 
     Returns:
         Dictionary with walk-forward results
     """
     # Determine date range
     if start_date is None or end_date is None:
-        all_dates = set()
-        for df in data.values():
-            if not df.empty:
-                all_dates.update(df.index)
-        if not all_dates:
+        # Only the global bounds are needed, not the union of all dates
+        frames = [df for df in data.values() if not df.empty]
+        if not frames:
             logger.warning("No dates found in data")
             return {}
-        all_dates = sorted(all_dates)
         if start_date is None:
-            start_date = all_dates[0]
+            start_date = min(df.index.min() for df in frames)
         if end_date is None:
-            end_date = all_dates[-1]
+            end_date = max(df.index.max() for df in frames)
 
     # Generate windows
     windows = generate_walkforward_windows(
@@ -199,74 +663,80 @@ def run_walkforward(
         logger.warning("No walk-forward windows generated")
         return {}
 
+    # Sort once so every per-window slice below is a binary search, not a mask
+    data = {symbol: df if df.index.is_monotonic_increasing else df.sort_index() for symbol, df in data.items()}
+    if not returns.index.is_monotonic_increasing:
+        returns = returns.sort_index()
+
     logger.info(f"Generated {len(windows)} walk-forward windows")
 
+    n_jobs = config.walkforward.window_jobs
+    workers = (os.cpu_count() or 1) if n_jobs == -1 else n_jobs
+    workers = min(workers, len(windows))
+
+    if workers > 1:
+        # Windows are independent; run them in worker processes, each with a serial
+        # grid search so the two levels of parallelism don't oversubscribe the cores
+        window_config = config.model_copy(
+            update={"walkforward": config.walkforward.model_copy(update={"n_jobs": 1})}
+        )
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_window_worker,
+            initargs=(data, returns, window_config, len(windows)),
+        )
+        window_outputs = executor.map(_evaluate_window, enumerate(windows))
+    else:
+        executor = None
+        window_outputs = (
+            _process_window(i, len(windows), window, data, returns, config)
+            for i, window in enumerate(windows)
+        )
+
+    if output_dir is not None:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        # Drop files from a previous run so they aren't picked up when assembling
+        for stale in [*output_dir.glob("oos_*.parquet"), *output_dir.glob("m_*.json")]:
+            stale.unlink()
+
     oos_results = []
     oos_equity_segments = []
     chosen_params_history = []
 
-    for i, (train_start, train_end, oos_start, oos_end) in enumerate(windows):
-        logger.info(f"Window {i+1}/{len(windows)}: Train {train_start.date()} to {train_end.date()}, OOS {oos_start.date()} to {oos_end.date()}")
-
-        # Grid search on training period
-        grid_result = grid_search(data, returns, config, train_start, train_end)
-
-        if grid_result["params"] is None:
-            logger.warning(f"No valid parameters found for window {i+1}")
-            continue
-
-        best_params = grid_result["params"]
-        chosen_params_history.append({oos_start: best_params})
-
-        # Apply best params to OOS period
-        test_config = AppConfig(**config.model_dump())
-        test_config.features.ema_fast = best_params["ema_fast"]
-        test_config.features.ema_slow = best_params["ema_slow"]
-        test_config.selection.top_n = best_params["top_n"]
-        test_config.selection.corr_cap = best_params["corr_cap"]
-
-        # Run backtest on OOS period
-        oos_data = {}
-        for symbol, df in data.items():
-            oos_df = df[(df.index >= oos_start) & (df.index <= oos_end)]
-            if not oos_df.empty:
-                oos_data[symbol] = oos_df
-
-        if not oos_data:
-            continue
-
-        oos_results_window = run_backtest(oos_data, test_config, oos_start, oos_end)
-
-        if oos_results_window:
-            oos_equity = oos_results_window.get("equity", pd.Series())
-            oos_returns = oos_results_window.get("returns", pd.Series())
-            oos_turnover = oos_results_window.get("turnover", pd.Series())
-
-            if not oos_equity.empty:
-                # Normalize equity to start at 1.0 for concatenation
-                oos_equity_normalized = oos_equity / oos_equity.iloc[0]
-                oos_equity_segments.append(oos_equity_normalized)
-
-                # Calculate OOS metrics
-                oos_metrics = calculate_all_metrics(oos_returns, oos_equity, oos_turnover)
-                oos_results.append(
-                    {
-                        "window": i + 1,
-                        "oos_start": oos_start,
-                        "oos_end": oos_end,
-                        "params": best_params,
-                        "metrics": oos_metrics,
-                    }
-                )
+    try:
+        # Outputs are consumed as windows complete, so with output_dir set each
+        # equity segment is released right after it has been written
+        for window_idx, (window, output) in enumerate(zip(windows, window_outputs)):
+            if output["params"] is None:
+                continue
+            chosen_params_history.append({window[2]: output["params"]})
+            if output["equity"] is not None:
+                oos_results.append(output["result"])
+                if output_dir is not None:
+                    _write_window_output(output_dir, window_idx, output)
+                else:
+                    oos_equity_segments.append(output["equity"])
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     # Concatenate OOS equity segments
-    if oos_equity_segments:
-        oos_equity_combined = pd.concat(oos_equity_segments)
+    if output_dir is not None:
+        oos_equity_combined = _read_streamed_equity(output_dir)
+    elif oos_equity_segments:
+        # One allocation for all segments instead of pairwise Series concatenation
+        oos_equity_combined = pd.Series(
+            np.concatenate([segment.to_numpy(dtype=np.float64) for segment in oos_equity_segments]),
+            index=pd.DatetimeIndex(np.concatenate([segment.index.values for segment in oos_equity_segments])),
+        )
+    else:
+        oos_equity_combined = pd.Series()
+
+    if not oos_equity_combined.empty:
         # Remove duplicates (overlapping dates)
         oos_equity_combined = oos_equity_combined[~oos_equity_combined.index.duplicated(keep="first")]
         oos_equity_combined = oos_equity_combined.sort_index()
-    else:
-        oos_equity_combined = pd.Series()
 
     return {
         "windows": windows,
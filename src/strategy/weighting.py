@@ -4,12 +4,63 @@ import numpy as np
 import pandas as pd
 
 from src.core.config import AppConfig
+from src.core.jit import njit
 from src.core.logging import get_logger
-from src.features.indicators import stdev
+from src.features.indicators import tail_std
 
 logger = get_logger(__name__)
 
 
+def _inverse_vols(
+    selected_symbols: list[str],
+    returns: pd.DataFrame,
+    vol_window: int,
+) -> tuple[list[str], np.ndarray]:
+    """
+    Compute inverse volatilities for the symbols that have a valid volatility.
+
+    Args:
+        selected_symbols: List of selected symbols
+        returns: DataFrame with returns (columns = symbols, index = dates)
+        vol_window: Window for volatility calculation
+
+    Returns:
+        Tuple of (symbols with valid volatility, their inverse volatilities)
+    """
+    missing = [s for s in selected_symbols if s not in returns.columns]
+    for symbol in missing:
+        logger.warning("Symbol %s not in returns DataFrame", symbol)
+
+    symbols = [s for s in selected_symbols if s in returns.columns]
+    if not symbols:
+        return [], np.empty(0)
+
+    # Each symbol's volatility is the std of its last vol_window non-NaN
+    # returns, computed in one pass for all symbols instead of a full rolling
+    # std per symbol
+    values = returns.reindex(columns=symbols).to_numpy(dtype=np.float64, copy=False)
+    sub = values[-vol_window:]
+    if len(values) >= vol_window and not np.isnan(sub).any():
+        sufficient = np.ones(len(symbols), dtype=bool)
+    else:
+        # Gappy columns: compact each one's non-NaN returns to its tail
+        observed = ~np.isnan(values)
+        sufficient = np.count_nonzero(observed, axis=0) >= vol_window
+        sub = np.full((vol_window, len(symbols)), np.nan)
+        for j in np.flatnonzero(sufficient):
+            sub[:, j] = values[observed[:, j], j][-vol_window:]
+    for symbol in np.asarray(symbols)[~sufficient]:
+        logger.warning("Insufficient data for %s volatility calculation", symbol)
+
+    vols = np.where(sufficient, tail_std(sub, vol_window), np.nan)
+
+    valid = (vols > 0) & np.isfinite(vols)
+    for symbol, vol in zip(np.asarray(symbols)[sufficient & ~valid], vols[sufficient & ~valid]):
+        logger.warning("Invalid volatility for %s: %s", symbol, vol)
+
+    return [str(s) for s in np.asarray(symbols)[valid]], 1.0 / vols[valid]
+
+
 def calculate_inverse_vol_weights(
     selected_symbols: list[str],
     returns: pd.DataFrame,
@@ -29,42 +80,44 @@ def calculate_inverse_vol_weights(
     if not selected_symbols:
         return {}
 
-    weights = {}
-    inv_vols = {}
+    symbols, inv_vols = _inverse_vols(selected_symbols, returns, vol_window)
+    if not symbols:
+        return {}
 
-    for symbol in selected_symbols:
-        if symbol not in returns.columns:
-            logger.warning(f"Symbol {symbol} not in returns DataFrame")
-            continue
+    # Normalize inverse volatilities
+    weights_arr = inv_vols / inv_vols.sum()
 
-        symbol_returns = returns[symbol].dropna()
-        if len(symbol_returns) < vol_window:
-            logger.warning(f"Insufficient data for {symbol} volatility calculation")
-            continue
+    return dict(zip(symbols, weights_arr.tolist()))
 
-        # Calculate volatility (standard deviation of returns)
-        vol = stdev(symbol_returns, window=vol_window).iloc[-1]
 
-        if vol <= 0 or np.isnan(vol):
-            logger.warning(f"Invalid volatility for {symbol}: {vol}")
-            continue
+@njit(cache=True)
+def _apply_caps_kernel(w: np.ndarray, cap: float) -> np.ndarray:
+    """
+    Cap weights, redistribute the excess to uncapped weights, and renormalize.
 
-        # Inverse volatility
-        inv_vol = 1.0 / vol
-        inv_vols[symbol] = inv_vol
+    Args:
+        w: Raw weights as a float64 array
+        cap: Maximum weight per asset
 
-    if not inv_vols:
-        return {}
+    Returns:
+        Capped weights summing to 1.0 (unless all weights are zero)
+    """
+    excess = np.sum(np.where(w > cap, w - cap, 0.0))
+    capped = np.minimum(w, cap)
 
-    # Normalize weights
-    total_inv_vol = sum(inv_vols.values())
-    if total_inv_vol == 0:
-        return {}
+    # Redistribute excess proportionally to uncapped assets
+    if excess > 0:
+        uncapped = capped < cap
+        total_uncapped = np.sum(np.where(uncapped, capped, 0.0))
+        if total_uncapped > 0:
+            capped = np.where(uncapped, capped + excess * (capped / total_uncapped), capped)
 
-    for symbol, inv_vol in inv_vols.items():
-        weights[symbol] = inv_vol / total_inv_vol
+    # Renormalize to ensure sum = 1.0
+    total = np.sum(capped)
+    if total > 0:
+        capped = capped / total
 
-    return weights
+    return capped
 
 
 def apply_weight_caps(
@@ -84,31 +137,10 @@ def apply_weight_caps(
     if not weights:
         return {}
 
-    capped_weights = {}
-    excess = 0.0
+    symbols = list(weights)
+    capped = _apply_caps_kernel(np.fromiter(weights.values(), dtype=np.float64, count=len(weights)), max_weight_per_asset)
 
-    for symbol, weight in weights.items():
-        if weight > max_weight_per_asset:
-            excess += weight - max_weight_per_asset
-            capped_weights[symbol] = max_weight_per_asset
-        else:
-            capped_weights[symbol] = weight
-
-    # Redistribute excess proportionally to uncapped assets
-    if excess > 0:
-        uncapped_symbols = [s for s, w in capped_weights.items() if w < max_weight_per_asset]
-        if uncapped_symbols:
-            total_uncapped = sum(capped_weights[s] for s in uncapped_symbols)
-            if total_uncapped > 0:
-                for symbol in uncapped_symbols:
-                    capped_weights[symbol] += excess * (capped_weights[symbol] / total_uncapped)
-
-    # Renormalize to ensure sum = 1.0
-    total = sum(capped_weights.values())
-    if total > 0:
-        capped_weights = {s: w / total for s, w in capped_weights.items()}
-
-    return capped_weights
+    return dict(zip(symbols, capped.tolist()))
 
 
 def apply_cash_buffer(
@@ -134,6 +166,24 @@ def apply_cash_buffer(
     return scaled_weights
 
 
+def _finalize_weights(inv_vols: np.ndarray, cap: float, cash_buffer: float) -> np.ndarray:
+    """
+    Turn inverse volatilities into final weights in one pass.
+
+    Normalizes, caps and redistributes with the same semantics as
+    ``apply_weight_caps``, then scales to ``1 - cash_buffer``.
+
+    Args:
+        inv_vols: Inverse volatilities (all positive)
+        cap: Maximum weight per asset
+        cash_buffer: Cash buffer fraction
+
+    Returns:
+        Final weights summing to 1 - cash_buffer
+    """
+    return _apply_caps_kernel(inv_vols / inv_vols.sum(), cap) * (1.0 - cash_buffer)
+
+
 def calculate_weights(
     selected_symbols: list[str],
     returns: pd.DataFrame,
@@ -153,32 +203,12 @@ def calculate_weights(
     if not selected_symbols:
         return {}
 
-    # Calculate inverse-volatility weights
-    weights = calculate_inverse_vol_weights(
-        selected_symbols,
-        returns,
-        vol_window=config.weights.vol_window,
-    )
-
-    if not weights:
+    symbols, inv_vols = _inverse_vols(selected_symbols, returns, config.weights.vol_window)
+    if not symbols:
         return {}
 
-    # Apply weight caps
-    weights = apply_weight_caps(weights, config.weights.max_weight_per_asset)
-
-    # Apply cash buffer
-    weights = apply_cash_buffer(weights, config.weights.cash_buffer)
-
-    # Verify weights sum correctly
-    total_weight = sum(weights.values())
-    expected_total = 1.0 - config.weights.cash_buffer
-    if abs(total_weight - expected_total) > 0.01:
-        logger.warning(
-            f"Weight sum ({total_weight:.4f}) does not match expected ({expected_total:.4f}), "
-            "renormalizing"
-        )
-        if total_weight > 0:
-            weights = {s: w / total_weight * expected_total for s, w in weights.items()}
+    final = _finalize_weights(inv_vols, config.weights.max_weight_per_asset, config.weights.cash_buffer)
+    weights = dict(zip(symbols, final.tolist()))
 
-    logger.info(f"Calculated weights: {weights}")
+    logger.info("Calculated weights: %s", weights)
     return weights
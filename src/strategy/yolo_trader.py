@@ -14,12 +14,13 @@ DO NOT USE WITH REAL MONEY!
 """
 
 import asyncio
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
 from typing import Optional
 
 from src.sentiment.aggregator import SentimentAggregator
 from src.brokers.ibkr_client import IBKRClient
 from src.brokers.ibkr_exec import IBKRExecutor
+from src.core.clock import ET, get_current_et_time
 from src.core.config import AppConfig
 from src.core.logging import get_logger
 from src.core.alerting import DiscordAlerter
@@ -40,6 +41,11 @@ class YOLOTrader:
     6. Maximum regret
     """
     
+    # Regular trading hours (ET) and longest sleep while the market is closed
+    MARKET_OPEN = time(9, 30)
+    MARKET_CLOSE = time(16, 0)
+    MAX_CLOSED_SLEEP = 3600
+    
     def __init__(
         self,
         config: AppConfig,
@@ -76,6 +82,9 @@ class YOLOTrader:
         self.entry_yolo_score: float = 0.0
         self.scan_count: int = 0
         
+        # In-flight Discord alerts (kept referenced until done, cancelled on shutdown)
+        self._pending_alerts: set[asyncio.Task] = set()
+        
         logger.info(
             f"YOLO Trader initialized: "
             f"buy_threshold={buy_threshold}, "
@@ -87,7 +96,7 @@ class YOLOTrader:
         """Start the YOLO trading loop."""
         logger.info("🔥🔥🔥 YOLO TRADER STARTING 🔥🔥🔥")
         
-        self.alerter.send_message(
+        self._send_alert(
             title="🔥 YOLO TRADER ACTIVATED",
             description=(
                 "**Real-time sentiment trading is now LIVE!**\n\n"
@@ -103,37 +112,70 @@ class YOLOTrader:
             ]
         )
         
+        try:
+            await self._run_loop()
+        finally:
+            self._cancel_pending_alerts()
+    
+    async def _run_loop(self):
+        """Scan-and-trade loop until interrupted."""
         while True:
             try:
                 # Check if market is open
-                if self._is_market_open():
+                now = get_current_et_time()
+                if self._is_market_open(now):
                     await self._yolo_scan_and_trade()
+                    sleep_seconds = self.scan_interval
                 else:
+                    # Sleep towards the next open instead of polling every scan_interval
+                    sleep_seconds = max(1.0, min(self._seconds_until_open(now), self.MAX_CLOSED_SLEEP))
                     logger.info("Market closed, sleeping...")
                 
                 # Wait before next scan
-                logger.info(f"Next scan in {self.scan_interval} seconds...")
-                await asyncio.sleep(self.scan_interval)
+                logger.info(f"Next scan in {sleep_seconds:.0f} seconds...")
+                await asyncio.sleep(sleep_seconds)
                 
             except KeyboardInterrupt:
                 logger.info("YOLO Trader stopped by user")
                 break
             except Exception as e:
                 logger.error(f"YOLO trading error: {e}", exc_info=True)
-                self.alerter.send_message(
+                self._send_alert(
                     title="⚠️ YOLO TRADER ERROR",
                     description=f"**Error:** {str(e)}\n\nTrader will retry in 60s...",
                     color=0xFFA500  # Orange
                 )
                 await asyncio.sleep(60)  # Wait 1 minute before retry
     
+    def _send_alert(self, **kwargs) -> None:
+        """
+        Schedule a Discord alert without waiting for the webhook round-trip.
+        
+        Args:
+            **kwargs: Arguments for DiscordAlerter.send_message_async
+        """
+        task = asyncio.create_task(self.alerter.send_message_async(**kwargs))
+        self._pending_alerts.add(task)
+        task.add_done_callback(self._pending_alerts.discard)
+    
+    def _cancel_pending_alerts(self) -> None:
+        """Cancel alerts that have not been delivered yet."""
+        for task in self._pending_alerts:
+            task.cancel()
+        self._pending_alerts.clear()
+    
     async def _yolo_scan_and_trade(self):
         """Scan sentiment and execute YOLO trades."""
         self.scan_count += 1
         logger.info(f"🔍 YOLO SCAN #{self.scan_count} - Analyzing sentiment...")
         
         # Get top YOLO pick from universe
-        picks = self.sentiment.get_top_yolo_picks(self.config.universe, top_n=3)
+        # Score the held position in the same batch as the universe
+        picks = self.sentiment.get_top_yolo_picks(
+            self.config.universe,
+            top_n=3,
+            always_include=[self.current_position] if self.current_position else None
+        )
         
         if not picks:
             logger.warning("No YOLO picks found!")
@@ -156,10 +198,8 @@ class YOLOTrader:
         
         # 2. SELL SIGNAL: Score dropped significantly from entry
         elif self.current_position:
-            # Get current score for our position
-            current_score, current_breakdown = self.sentiment.calculate_yolo_score(
-                self.current_position
-            )
+            # Get current score for our position (already scored in this scan)
+            current_score, current_breakdown = self._held_score()
             
             # Check if score dropped below sell threshold
             if current_score < self.entry_yolo_score * self.sell_threshold:
@@ -180,6 +220,18 @@ class YOLOTrader:
                 f"(need {self.buy_threshold})"
             )
     
+    def _held_score(self) -> tuple[float, dict]:
+        """
+        YOLO score of the current position, reusing this scan's batch if possible.
+        
+        Returns:
+            (score, breakdown) for the held ticker
+        """
+        cached = self.sentiment.last_scores.get(self.current_position)
+        if cached is not None:
+            return cached
+        return self.sentiment.calculate_yolo_score(self.current_position)
+    
     async def _yolo_buy(self, ticker: str, yolo_score: float, breakdown: dict):
         """
         Execute YOLO buy: 100% into one ticker.
@@ -193,7 +245,7 @@ class YOLOTrader:
         
         # Sell current position if any
         if self.current_position and self.current_position != ticker:
-            current_score, _ = self.sentiment.calculate_yolo_score(self.current_position)
+            current_score, _ = self._held_score()
             await self._yolo_sell(current_score, reason="Switching to better YOLO")
         
         # BUY 100% into new ticker
@@ -218,7 +270,7 @@ class YOLOTrader:
             )
             
             # Alert
-            self.alerter.send_message(
+            self._send_alert(
                 title=f"🚀 YOLO BUY: ${ticker}",
                 description=(
                     f"**YOLO Score:** {yolo_score:.2f}\n"
@@ -239,7 +291,7 @@ class YOLOTrader:
             
         except Exception as e:
             logger.error(f"YOLO buy failed: {e}", exc_info=True)
-            self.alerter.send_message(
+            self._send_alert(
                 title=f"❌ YOLO BUY FAILED: ${ticker}",
                 description=f"**Error:** {str(e)}",
                 color=0xFF0000
@@ -281,7 +333,7 @@ class YOLOTrader:
             )
             
             # Alert
-            self.alerter.send_message(
+            self._send_alert(
                 title=f"💰 YOLO SELL: ${old_position} {pnl_indicator}",
                 description=(
                     f"**Reason:** {reason}\n"
@@ -304,15 +356,23 @@ class YOLOTrader:
             
         except Exception as e:
             logger.error(f"YOLO sell failed: {e}", exc_info=True)
-            self.alerter.send_message(
+            self._send_alert(
                 title=f"❌ YOLO SELL FAILED: ${self.current_position}",
                 description=f"**Error:** {str(e)}",
                 color=0xFF0000
             )
     
-    def _is_market_open(self) -> bool:
-        """Check if US market is open."""
-        now = datetime.now()
+    def _is_market_open(self, now: Optional[datetime] = None) -> bool:
+        """
+        Check if US market is open.
+        
+        Args:
+            now: Current ET time (default: now)
+        
+        Returns:
+            True during regular trading hours on a weekday
+        """
+        now = now or get_current_et_time()
         
         # Check if weekend
         if now.weekday() >= 5:  # Saturday = 5, Sunday = 6
@@ -320,9 +380,23 @@ class YOLOTrader:
         
         # Check market hours (9:30 AM - 4:00 PM ET)
         # TODO: Handle US holidays
-        market_open = time(9, 30)
-        market_close = time(16, 0)
-        current_time = now.time()
+        return self.MARKET_OPEN <= now.time() <= self.MARKET_CLOSE
+    
+    def _seconds_until_open(self, now: datetime) -> float:
+        """
+        Seconds from now until the next weekday market open.
         
-        return market_open <= current_time <= market_close
-
+        Args:
+            now: Current ET time
+        
+        Returns:
+            Seconds until the next 9:30 AM ET open on a weekday
+        """
+        next_open = now.date()
+        if now.time() >= self.MARKET_OPEN:
+            next_open += timedelta(days=1)
+        while next_open.weekday() >= 5:
+            next_open += timedelta(days=1)
+        
+        open_dt = ET.localize(datetime.combine(next_open, self.MARKET_OPEN))
+        return (open_dt - now).total_seconds()
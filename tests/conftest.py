@@ -0,0 +1,175 @@
+"""Shared pytest fixtures."""
+import logging
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import numpy as np
+import pandas as pd
+import pyarrow.fs as pafs
+import pytest
+from ib_insync import IB
+
+from src.brokers.ibkr_client import IBKRClient
+from src.core.config import AppConfig, load_config
+from src.data.cache import ParquetCache
+
+
+def make_ohlcv(periods: int, start: str = "2020-01-01", base: int = 100, step: int = 1) -> pd.DataFrame:
+    """Build a daily OHLCV frame with prices moving by ``step`` per bar.
+
+    Args:
+        periods: Number of daily bars
+        start: First date
+        base: First close price
+        step: Close change per bar (negative for a falling series, 0 for flat)
+
+    Returns:
+        DataFrame with open/high/low/close/volume columns
+    """
+    # One int64 block wrapped without a copy instead of five column arrays
+    values = np.empty((periods, 5), dtype=np.int64)
+    values[:, 3] = base + step * np.arange(periods)
+    values[:, 0] = values[:, 3]
+    values[:, 1] = values[:, 3] + 1
+    values[:, 2] = values[:, 3] - 1
+    values[:, 4] = np.arange(1000, 1000 + periods)
+    return pd.DataFrame(
+        values,
+        index=pd.date_range(start, periods=periods, freq="D"),
+        columns=["open", "high", "low", "close", "volume"],
+        copy=False,
+    )
+
+
+@pytest.fixture
+def rng() -> np.random.Generator:
+    """Freshly seeded PCG64 generator, so each test sees the same draws."""
+    return np.random.default_rng(12345)
+
+
+@pytest.fixture(scope="session")
+def base_config() -> AppConfig:
+    """Load the application configuration once per test session.
+
+    Tests that mutate the config must work on ``copy.deepcopy(base_config)``.
+    """
+    return load_config()
+
+
+@pytest.fixture(scope="session")
+def ohlcv_factory() -> Callable[..., pd.DataFrame]:
+    """Expose make_ohlcv to tests that need other lengths or a falling series."""
+    return make_ohlcv
+
+
+@pytest.fixture
+def ohlcv_10() -> pd.DataFrame:
+    """10 daily bars starting 2024-01-01."""
+    return make_ohlcv(10, start="2024-01-01")
+
+
+@pytest.fixture
+def ohlcv_50() -> pd.DataFrame:
+    """50 daily bars starting 2020-01-01."""
+    return make_ohlcv(50)
+
+
+@pytest.fixture
+def ohlcv_100() -> pd.DataFrame:
+    """100 daily bars starting 2020-01-01."""
+    return make_ohlcv(100)
+
+
+@pytest.fixture
+def ohlcv_flat_10() -> pd.DataFrame:
+    """10 daily bars starting 2020-01-01 with a flat close of 100."""
+    return make_ohlcv(10, step=0)
+
+
+@pytest.fixture
+def two_asset_ohlcv() -> dict[str, pd.DataFrame]:
+    """100 daily bars for SPY (closes 100-199) and QQQ (closes 200-299)."""
+    return {"SPY": make_ohlcv(100), "QQQ": make_ohlcv(100, base=200)}
+
+
+@pytest.fixture(scope="session")
+def seeded_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Cache directory holding ohlcv_10's bars as SPY, written once per session.
+
+    Shared by every test that uses it, so tests must only read from it.
+    """
+    cache_dir = tmp_path_factory.mktemp("spy_cache")
+    ParquetCache(cache_dir).write("SPY", make_ohlcv(10, start="2024-01-01"))
+    return cache_dir
+
+
+@pytest.fixture(scope="session")
+def spy_parquet(seeded_cache_dir: Path) -> Path:
+    """Path of the session-wide SPY cache file."""
+    return ParquetCache(seeded_cache_dir).get_cache_path("SPY")
+
+
+@pytest.fixture
+def fs_cache(tmp_path: Path) -> ParquetCache:
+    """Fresh ParquetCache on an explicit pyarrow filesystem rooted at tmp_path.
+
+    Exercises the ``filesystem=`` code path (as used for remote stores) through
+    the public SubTreeFileSystem.
+    """
+    return ParquetCache(Path("cache"), filesystem=pafs.SubTreeFileSystem(str(tmp_path), pafs.LocalFileSystem()))
+
+
+@pytest.fixture
+def populated_cache(fs_cache: ParquetCache, spy_parquet: Path) -> ParquetCache:
+    """fs_cache holding ohlcv_10 as SPY (file copied, not re-encoded)."""
+    pafs.copy_files(
+        str(spy_parquet),
+        fs_cache.get_cache_path("SPY").as_posix(),
+        source_filesystem=pafs.LocalFileSystem(),
+        destination_filesystem=fs_cache.filesystem,
+    )
+    return fs_cache
+
+
+@pytest.fixture
+def mock_ib() -> Iterator[Mock]:
+    """Patch the IB class used by IBKRClient and yield its spec'd instance.
+
+    ``Mock(spec=IB)`` rejects misspelled attributes and makes the async IB
+    methods AsyncMocks automatically.
+    """
+    instance = Mock(spec=IB)
+    with patch("src.brokers.ibkr_client.IB", return_value=instance):
+        yield instance
+
+
+@pytest.fixture
+def isolated_root_logger() -> Iterator[logging.Logger]:
+    """Restore the root logger's handlers and level after a setup_logging test.
+
+    Handlers added by the test (e.g. a JSONL file handler) are closed, so later
+    tests don't keep writing their log records to disk.
+    """
+    root = logging.getLogger()
+    saved_handlers = root.handlers[:]
+    saved_level = root.level
+    yield root
+    for handler in root.handlers:
+        if handler not in saved_handlers:
+            handler.close()
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
+
+
+@pytest.fixture
+def mock_ibkr() -> MagicMock:
+    """Spec'd IBKRClient mock to pass as ``DataIngestion(..., client=mock_ibkr)``.
+
+    Async methods are AsyncMocks and fetch_historical_data returns an empty
+    frame; tests set ``return_value``/``side_effect`` as needed.
+    """
+    client = MagicMock(spec=IBKRClient)
+    client.connected = False
+    client.fetch_historical_data.return_value = pd.DataFrame()
+    return client
@@ -1,7 +1,9 @@
 """Tests for Discord alerting system."""
 import os
+from typing import Callable, Optional
 from unittest.mock import Mock, patch
 
+import pytest
 import requests
 
 from src.core.alerting import (
@@ -14,6 +16,16 @@ from src.core.alerting import (
 )
 
 
+@pytest.fixture(autouse=True)
+def mock_requests_post(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace requests.post with a mock returning a successful response."""
+    response = Mock()
+    response.raise_for_status = Mock()
+    post = Mock(return_value=response)
+    monkeypatch.setattr(requests, "post", post)
+    return post
+
+
 def test_discord_alerter_init_with_webhook() -> None:
     """Test DiscordAlerter initialization with webhook."""
     alerter = DiscordAlerter(webhook_url="https://discord.com/api/webhooks/test")
@@ -44,21 +56,16 @@ def test_send_message_not_enabled() -> None:
     assert result is False
 
 
-@patch("requests.post")
-def test_send_message_success(mock_post: Mock) -> None:
+def test_send_message_success(mock_requests_post: Mock) -> None:
     """Test successful message send."""
-    mock_response = Mock()
-    mock_response.raise_for_status = Mock()
-    mock_post.return_value = mock_response
-
     alerter = DiscordAlerter(webhook_url="https://discord.com/api/webhooks/test")
     result = alerter.send_message("Test", "Body", color=0x123456)
 
     assert result is True
-    mock_post.assert_called_once()
+    mock_requests_post.assert_called_once()
 
     # Verify payload structure
-    call_args = mock_post.call_args
+    call_args = mock_requests_post.call_args
     payload = call_args[1]["json"]
     assert "embeds" in payload
     assert payload["embeds"][0]["title"] == "Test"
@@ -66,13 +73,8 @@ def test_send_message_success(mock_post: Mock) -> None:
     assert payload["embeds"][0]["color"] == 0x123456
 
 
-@patch("requests.post")
-def test_send_message_with_fields(mock_post: Mock) -> None:
+def test_send_message_with_fields(mock_requests_post: Mock) -> None:
     """Test message send with fields."""
-    mock_response = Mock()
-    mock_response.raise_for_status = Mock()
-    mock_post.return_value = mock_response
-
     alerter = DiscordAlerter(webhook_url="https://test.com")
     fields = [
         {"name": "Field1", "value": "Value1", "inline": True},
@@ -82,14 +84,13 @@ def test_send_message_with_fields(mock_post: Mock) -> None:
     result = alerter.send_message("Test", "Body", fields=fields)
 
     assert result is True
-    payload = mock_post.call_args[1]["json"]
+    payload = mock_requests_post.call_args[1]["json"]
     assert payload["embeds"][0]["fields"] == fields
 
 
-@patch("requests.post")
-def test_send_message_http_error(mock_post: Mock) -> None:
+def test_send_message_http_error(mock_requests_post: Mock) -> None:
     """Test message send with HTTP error."""
-    mock_post.side_effect = requests.exceptions.HTTPError("Server error")
+    mock_requests_post.side_effect = requests.exceptions.HTTPError("Server error")
 
     alerter = DiscordAlerter(webhook_url="https://test.com")
     result = alerter.send_message("Test", "Body")
@@ -97,73 +98,71 @@ def test_send_message_http_error(mock_post: Mock) -> None:
     assert result is False
 
 
-@patch("src.core.alerting.DiscordAlerter.send_message")
-def test_send_rebalance_success_alert(mock_send: Mock) -> None:
-    """Test rebalance success alert."""
-    mock_send.return_value = True
-
-    send_rebalance_success_alert(
-        orders_placed=2,
-        portfolio_value=10000.0,
-        positions={"SPY": 0.5, "QQQ": 0.45},
-        execution_time_seconds=5.3
-    )
-
-    mock_send.assert_called_once()
-    call_args = mock_send.call_args
-    assert "✅" in call_args[1]["title"]
-    assert call_args[1]["color"] == 0x2ECC71  # Green
-
-
-@patch("src.core.alerting.DiscordAlerter.send_message")
-def test_send_rebalance_error_alert(mock_send: Mock) -> None:
-    """Test rebalance error alert."""
-    mock_send.return_value = True
-
-    error = ConnectionError("Test error")
-    send_rebalance_error_alert(error, context={"account": "DUK200445"})
-
-    mock_send.assert_called_once()
-    call_args = mock_send.call_args
-    assert "🚨" in call_args[1]["title"]
-    assert call_args[1]["color"] == 0xE74C3C  # Red
-
-
-@patch("src.core.alerting.DiscordAlerter.send_message")
-def test_send_data_quality_warning(mock_send: Mock) -> None:
-    """Test data quality warning alert."""
-    mock_send.return_value = True
-
-    send_data_quality_warning("SPY", "Price jump detected")
-
-    mock_send.assert_called_once()
-    call_args = mock_send.call_args
-    assert "⚠️" in call_args[1]["title"]
-    assert call_args[1]["color"] == 0xF39C12  # Orange
-
-
-@patch("src.core.alerting.DiscordAlerter.send_message")
-def test_send_startup_notification(mock_send: Mock) -> None:
-    """Test startup notification."""
-    mock_send.return_value = True
-
-    send_startup_notification()
-
-    mock_send.assert_called_once()
-    call_args = mock_send.call_args
-    assert "🚀" in call_args[1]["title"]
-    assert call_args[1]["color"] == 0x3498DB  # Blue
-
-
-@patch("src.core.alerting.DiscordAlerter.send_message")
-def test_send_test_alert(mock_send: Mock) -> None:
-    """Test test alert."""
-    mock_send.return_value = True
-
-    result = send_test_alert()
+@pytest.fixture
+def mock_send_message(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace DiscordAlerter.send_message with a mock reporting success."""
+    send = Mock(return_value=True)
+    monkeypatch.setattr(DiscordAlerter, "send_message", send)
+    return send
+
+
+@pytest.mark.parametrize(
+    "func, kwargs, emoji, color, expected",
+    [
+        (
+            send_rebalance_success_alert,
+            {
+                "orders_placed": 2,
+                "portfolio_value": 10000.0,
+                "positions": {"SPY": 0.5, "QQQ": 0.45},
+                "execution_time_seconds": 5.3,
+            },
+            "✅",
+            0x2ECC71,  # Green
+            None,
+        ),
+        (
+            send_rebalance_error_alert,
+            {"error": ConnectionError("Test error"), "context": {"account": "DUK200445"}},
+            "🚨",
+            0xE74C3C,  # Red
+            None,
+        ),
+        (
+            send_data_quality_warning,
+            {"symbol": "SPY", "issue": "Price jump detected"},
+            "⚠️",
+            0xF39C12,  # Orange
+            None,
+        ),
+        (send_startup_notification, {}, "🚀", 0x3498DB, None),  # Blue
+        (send_test_alert, {}, "🧪", 0x9B59B6, True),  # Purple
+    ],
+    ids=["rebalance_success", "rebalance_error", "data_quality", "startup", "test_alert"],
+)
+def test_send_alert_wrappers(
+    mock_send_message: Mock,
+    func: Callable[..., Optional[bool]],
+    kwargs: dict,
+    emoji: str,
+    color: int,
+    expected: Optional[bool],
+) -> None:
+    """Test each alert wrapper sends one message with its emoji and color."""
+    result = func(**kwargs)
+
+    assert result is expected
+    mock_send_message.assert_called_once()
+    call_args = mock_send_message.call_args
+    assert emoji in call_args[1]["title"]
+    assert call_args[1]["color"] == color
+
+
+async def test_send_message_async(mock_requests_post: Mock) -> None:
+    """Test async send posts the webhook off the event loop."""
+    alerter = DiscordAlerter(webhook_url="https://discord.com/api/webhooks/test")
+    result = await alerter.send_message_async("Test", "Body", fields=[{"name": "A", "value": "B"}])
 
     assert result is True
-    mock_send.assert_called_once()
-    call_args = mock_send.call_args
-    assert "🧪" in call_args[1]["title"]
-
+    payload = mock_requests_post.call_args[1]["json"]
+    assert payload["embeds"][0]["fields"] == [{"name": "A", "value": "B"}]
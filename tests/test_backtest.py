@@ -1,8 +1,12 @@
 """Test backtest engine for no look-ahead."""
+import copy
+from collections.abc import Callable
+
+import numpy as np
 import pandas as pd
 import pytest
 
-from src.core.config import load_config
+from src.core.config import AppConfig
 from src.strategy.backtest import calculate_costs, calculate_returns, run_backtest
 from src.strategy.metrics import (
     calculate_cagr,
@@ -14,17 +18,27 @@ from src.strategy.metrics import (
 )
 
 
-def test_calculate_returns() -> None:
-    """Test returns calculation."""
-    dates = pd.date_range("2024-01-01", periods=10, freq="D")
-    df = pd.DataFrame({"close": range(100, 110)}, index=dates)
-    returns = calculate_returns(df)
-    assert len(returns) == 10
-    # First return is NaN (no previous value)
-    first_val = returns.iloc[0]
-    if isinstance(first_val, pd.Series):
-        first_val = first_val.iloc[0] if len(first_val) > 0 else None
-    assert pd.isna(first_val) or first_val == 0.0
+@pytest.mark.parametrize(
+    "make_df, expected_len",
+    [
+        (lambda ohlcv: ohlcv[["close"]], 10),
+        (lambda ohlcv: pd.concat({"SPY": ohlcv, "QQQ": ohlcv}, names=["symbol", "date"]), 10),
+        (lambda ohlcv: pd.DataFrame(), 0),
+        (lambda ohlcv: ohlcv[["open", "high"]], 0),  # Missing close
+    ],
+    ids=["single", "multiindex", "empty", "missing_close"],
+)
+def test_calculate_returns(
+    ohlcv_10: pd.DataFrame,
+    make_df: Callable[[pd.DataFrame], pd.DataFrame],
+    expected_len: int,
+) -> None:
+    """Test returns calculation for single, MultiIndex, empty and close-less frames."""
+    returns = calculate_returns(make_df(ohlcv_10))
+    assert len(returns) == expected_len
+    if expected_len:
+        # First return is NaN (no previous value)
+        assert returns.iloc[0].isna().all()
 
 
 def test_calculate_costs() -> None:
@@ -35,24 +49,24 @@ def test_calculate_costs() -> None:
     assert all(costs >= 0)
 
 
-def test_no_look_ahead() -> None:
+def test_no_look_ahead(base_config: AppConfig) -> None:
     """Test that positions are lagged by +1 bar (no look-ahead)."""
     # Create simple data
     dates = pd.date_range("2024-01-01", periods=5, freq="D")
     data = {
         "SPY": pd.DataFrame(
             {
-                "open": [100] * 5,
-                "high": [101] * 5,
-                "low": [99] * 5,
-                "close": [100, 101, 102, 103, 104],  # Rising
-                "volume": [1000] * 5,
+                "open": np.full(5, 100, dtype=np.int64),
+                "high": np.full(5, 101, dtype=np.int64),
+                "low": np.full(5, 99, dtype=np.int64),
+                "close": np.arange(100, 105, dtype=np.int64),  # Rising
+                "volume": np.full(5, 1000, dtype=np.int64),
             },
             index=dates,
         )
     }
 
-    config = load_config()
+    config = copy.deepcopy(base_config)
     config.selection.top_n = 1
 
     # Run backtest
@@ -76,7 +90,7 @@ def test_no_look_ahead() -> None:
 
 def test_metrics_calculation() -> None:
     """Test metrics calculation."""
-    dates = pd.date_range("2024-01-01", periods=100, freq="D")
+    dates = pd.date_range("2024-01-01", periods=10, freq="D")
     returns = pd.Series(0.001, index=dates)  # Small positive returns
     equity = (1 + returns).cumprod()
 
@@ -95,6 +109,6 @@ def test_metrics_calculation() -> None:
     pf = calculate_profit_factor(returns)
     assert pf > 0
 
-    turnover = pd.Series([0.1] * 100, index=dates)
+    turnover = pd.Series(0.1, index=dates)
     turnover_ann = calculate_turnover_annualized(turnover)
     assert turnover_ann > 0
@@ -1,29 +1,12 @@
 """Test backtest module expansion."""
+import copy
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
-from src.core.config import load_config
-from src.strategy.backtest import calculate_costs, calculate_returns, run_backtest
-
-
-def test_calculate_returns_multiindex() -> None:
-    """Test returns calculation with MultiIndex."""
-    dates = pd.date_range("2024-01-01", periods=10, freq="D")
-    index = pd.MultiIndex.from_product([["SPY", "QQQ"], dates], names=["symbol", "date"])
-    df = pd.DataFrame(
-        {
-            "open": range(100, 120),
-            "high": range(101, 121),
-            "low": range(99, 119),
-            "close": range(100, 120),
-            "volume": [1000] * 20,
-        },
-        index=index,
-    )
-
-    returns = calculate_returns(df)
-    assert not returns.empty
+from src.core.config import AppConfig
+from src.strategy.backtest import calculate_costs, run_backtest
 
 
 def test_calculate_costs_with_prices() -> None:
@@ -35,23 +18,11 @@ def test_calculate_costs_with_prices() -> None:
     assert all(costs >= 0)
 
 
-def test_run_backtest_with_date_range() -> None:
+def test_run_backtest_with_date_range(base_config: AppConfig, ohlcv_100: pd.DataFrame) -> None:
     """Test backtest with specific date range."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
-    data = {
-        "SPY": pd.DataFrame(
-            {
-                "open": range(100, 200),
-                "high": range(101, 201),
-                "low": range(99, 199),
-                "close": range(100, 200),
-                "volume": [1000] * 100,
-            },
-            index=dates,
-        )
-    }
+    data = {"SPY": ohlcv_100}
 
-    config = load_config()
+    config = copy.deepcopy(base_config)
     config.selection.top_n = 1
 
     start_date = datetime(2020, 1, 10)
@@ -64,30 +35,17 @@ def test_run_backtest_with_date_range() -> None:
         assert not equity.empty
 
 
-def test_run_backtest_empty_data() -> None:
+def test_run_backtest_empty_data(base_config: AppConfig) -> None:
     """Test backtest with empty data."""
-    config = load_config()
-    results = run_backtest({}, config)
+    results = run_backtest({}, base_config)
     assert results == {}
 
 
-def test_run_backtest_single_symbol() -> None:
+def test_run_backtest_single_symbol(base_config: AppConfig, ohlcv_50: pd.DataFrame) -> None:
     """Test backtest with single symbol."""
-    dates = pd.date_range("2020-01-01", periods=50, freq="D")
-    data = {
-        "SPY": pd.DataFrame(
-            {
-                "open": range(100, 150),
-                "high": range(101, 151),
-                "low": range(99, 149),
-                "close": range(100, 150),
-                "volume": [1000] * 50,
-            },
-            index=dates,
-        )
-    }
+    data = {"SPY": ohlcv_50}
 
-    config = load_config()
+    config = copy.deepcopy(base_config)
     config.selection.top_n = 1
 
     results = run_backtest(data, config)
@@ -95,3 +53,28 @@ def test_run_backtest_single_symbol() -> None:
     if results:
         assert "equity" in results
         assert "returns" in results
+
+
+def test_run_backtest_weights_history_matrix(base_config: AppConfig) -> None:
+    """Test weights history is a dates x symbols float32 matrix."""
+    dates = pd.date_range("2020-01-01", periods=30, freq="D")
+    data = {
+        symbol: pd.DataFrame(
+            {
+                "open": np.arange(100, 130, dtype=np.int64),
+                "high": np.arange(101, 131, dtype=np.int64),
+                "low": np.arange(99, 129, dtype=np.int64),
+                "close": np.arange(100, 130, dtype=np.int64),
+                "volume": np.full(30, 1000, dtype=np.int64),
+            },
+            index=dates,
+        )
+        for symbol in ["SPY", "QQQ"]
+    }
+
+    results = run_backtest(data, base_config)
+
+    weights_history = results["weights_history"]
+    assert isinstance(weights_history, pd.DataFrame)
+    assert weights_history.shape == (30, 2)
+    assert (weights_history.dtypes == "float32").all()
@@ -1,35 +1,22 @@
 """Additional tests for backtest module."""
+import copy
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
+import pytest
 
-from src.core.config import load_config
-from src.strategy.backtest import calculate_returns, run_backtest
+from src.core.config import AppConfig
+from src.strategy.backtest import (
+    build_backtest_arrays,
+    iter_backtest_arrays,
+    run_backtest,
+    run_backtest_arrays,
+    slice_by_date,
+)
 
 
-def test_calculate_returns_empty_dataframe() -> None:
-    """Test calculate_returns with empty DataFrame."""
-    df = pd.DataFrame()
-    returns = calculate_returns(df)
-    assert returns.empty
-
-
-def test_calculate_returns_missing_close_column() -> None:
-    """Test calculate_returns with missing close column."""
-    dates = pd.date_range("2020-01-01", periods=10, freq="D")
-    df = pd.DataFrame(
-        {
-            "open": range(100, 110),
-            "high": range(101, 111),
-            # Missing close
-        },
-        index=dates,
-    )
-    returns = calculate_returns(df)
-    assert returns.empty
-
-
-def test_run_backtest_no_dates() -> None:
+def test_run_backtest_no_dates(base_config: AppConfig) -> None:
     """Test run_backtest when no dates found."""
     data = {
         "SPY": pd.DataFrame(
@@ -42,28 +29,14 @@ def test_run_backtest_no_dates() -> None:
             }
         )
     }
-    config = load_config()
-
-    results = run_backtest(data, config)
+    results = run_backtest(data, base_config)
     assert results == {}
 
 
-def test_run_backtest_date_range_filtering() -> None:
+def test_run_backtest_date_range_filtering(base_config: AppConfig, ohlcv_100: pd.DataFrame) -> None:
     """Test run_backtest with date range filtering."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
-    data = {
-        "SPY": pd.DataFrame(
-            {
-                "open": range(100, 200),
-                "high": range(101, 201),
-                "low": range(99, 199),
-                "close": range(100, 200),
-                "volume": [1000] * 100,
-            },
-            index=dates,
-        )
-    }
-    config = load_config()
+    data = {"SPY": ohlcv_100}
+    config = copy.deepcopy(base_config)
     config.selection.top_n = 1
 
     start_date = datetime(2020, 1, 10)
@@ -75,23 +48,95 @@ def test_run_backtest_date_range_filtering() -> None:
         assert "returns" in results
 
 
-def test_run_backtest_no_returns_calculated() -> None:
+def test_run_backtest_no_returns_calculated(base_config: AppConfig) -> None:
     """Test run_backtest when no returns can be calculated."""
     dates = pd.date_range("2020-01-01", periods=5, freq="D")
     data = {
         "SPY": pd.DataFrame(
             {
-                "open": [100] * 5,  # Flat prices
-                "high": [101] * 5,
-                "low": [99] * 5,
-                "close": [100] * 5,  # No price change
-                "volume": [1000] * 5,
+                "open": np.full(5, 100, dtype=np.int64),  # Flat prices
+                "high": np.full(5, 101, dtype=np.int64),
+                "low": np.full(5, 99, dtype=np.int64),
+                "close": np.full(5, 100, dtype=np.int64),  # No price change
+                "volume": np.full(5, 1000, dtype=np.int64),
             },
             index=dates,
         )
     }
-    config = load_config()
-
-    results = run_backtest(data, config)
+    results = run_backtest(data, base_config)
     # Should handle gracefully
     assert isinstance(results, dict)
+
+
+def test_slice_by_date_matches_boolean_mask() -> None:
+    """Test searchsorted slicing matches boolean-mask filtering."""
+    dates = pd.date_range("2020-01-01", periods=100, freq="D")
+    df = pd.DataFrame({"close": np.arange(100, dtype=np.int64)}, index=dates)
+    start = datetime(2020, 1, 15)
+    end = datetime(2020, 3, 1)
+
+    expected = df[(df.index >= start) & (df.index < end)]
+    pd.testing.assert_frame_equal(slice_by_date(df, start, end), expected)
+
+    expected_inclusive = df[(df.index >= start) & (df.index <= end)]
+    pd.testing.assert_frame_equal(slice_by_date(df, start, end, inclusive_end=True), expected_inclusive)
+
+    assert slice_by_date(pd.DataFrame(), start, end).empty
+
+
+def test_build_backtest_arrays_aligns_symbols() -> None:
+    """Test backtest arrays align symbols on the union of dates with NaN gaps."""
+    dates = pd.date_range("2020-01-01", periods=5, freq="D")
+    data = {
+        "SPY": pd.DataFrame(
+            {"open": 1.0, "high": 2.0, "low": 0.5, "close": [1.0, 2.0, 3.0, 4.0, 5.0], "volume": 100},
+            index=dates,
+        ),
+        "QQQ": pd.DataFrame({"close": [10.0, 11.0]}, index=dates[3:]),
+        "EMPTY": pd.DataFrame(),
+    }
+
+    arrays = build_backtest_arrays(data)
+
+    assert arrays.symbols == ["SPY", "QQQ"]
+    assert arrays.close.shape == (5, 2)
+    assert np.isnan(arrays.close[:3, 1]).all()
+    assert arrays.returns[4, 1] == pytest.approx(0.1)
+    assert arrays.selectable.tolist() == [True, False]
+
+
+def test_run_backtest_arrays_matches_run_backtest(base_config: AppConfig) -> None:
+    """Test backtesting pre-built arrays gives the same results as run_backtest."""
+    dates = pd.date_range("2020-01-01", periods=120, freq="D")
+    close = 100 + np.cumsum(np.sin(np.arange(120) / 5.0) + 0.3)
+    data = {
+        "SPY": pd.DataFrame(
+            {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1000},
+            index=dates,
+        )
+    }
+    arrays = build_backtest_arrays(data)
+    from_arrays = run_backtest_arrays(arrays, base_config, dates[10], dates[100])
+    from_frames = run_backtest(data, base_config, dates[10], dates[100])
+
+    pd.testing.assert_series_equal(from_arrays["equity"], from_frames["equity"])
+    assert from_arrays["dates"][0] == dates[10]
+    assert from_arrays["dates"][-1] == dates[100]
+
+
+def test_iter_backtest_arrays_checkpoint_is_prefix(base_config: AppConfig) -> None:
+    """Test checkpoint results are the leading rows of the full backtest."""
+    dates = pd.date_range("2020-01-01", periods=120, freq="D")
+    close = 100 + np.cumsum(np.sin(np.arange(120) / 5.0) + 0.3)
+    data = {
+        "SPY": pd.DataFrame(
+            {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1000},
+            index=dates,
+        )
+    }
+
+    arrays = build_backtest_arrays(data)
+    partial, full = iter_backtest_arrays(arrays, base_config, dates[0], dates[-1], [dates[59]])
+
+    assert len(partial["equity"]) == 60
+    pd.testing.assert_series_equal(partial["equity"], full["equity"].iloc[:60])
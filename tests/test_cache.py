@@ -1,6 +1,7 @@
 """Test Parquet cache functionality."""
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -8,33 +9,15 @@ from src.data.cache import ParquetCache
 
 
 @pytest.fixture
-def cache_dir(tmp_path: Path) -> Path:
-    """Create temporary cache directory."""
-    cache = tmp_path / "cache"
-    cache.mkdir()
-    return cache
-
-
-@pytest.fixture
-def cache(cache_dir: Path) -> ParquetCache:
+def cache(fs_cache: ParquetCache) -> ParquetCache:
     """Create ParquetCache instance."""
-    return ParquetCache(cache_dir)
+    return fs_cache
 
 
 @pytest.fixture
-def sample_data() -> pd.DataFrame:
-    """Create sample OHLCV data."""
-    dates = pd.date_range("2024-01-01", periods=10, freq="D")
-    return pd.DataFrame(
-        {
-            "open": range(100, 110),
-            "high": range(101, 111),
-            "low": range(99, 109),
-            "close": range(100, 110),
-            "volume": range(1000, 1010),
-        },
-        index=dates,
-    )
+def sample_data(ohlcv_10: pd.DataFrame) -> pd.DataFrame:
+    """Create sample OHLCV data (a copy, since writing renames the index)."""
+    return ohlcv_10.copy()
 
 
 def test_cache_write_read(cache: ParquetCache, sample_data: pd.DataFrame) -> None:
@@ -46,6 +29,14 @@ def test_cache_write_read(cache: ParquetCache, sample_data: pd.DataFrame) -> Non
     assert list(df.columns) == ["open", "high", "low", "close", "volume"]
 
 
+def test_cache_write_read_local_disk(tmp_path: Path, sample_data: pd.DataFrame) -> None:
+    """Test the default local-disk cache writes a Parquet file and reads it back."""
+    cache = ParquetCache(tmp_path / "cache")
+    cache.write("TEST", sample_data)
+    assert cache.get_cache_path("TEST").is_file()
+    pd.testing.assert_frame_equal(cache.read("TEST"), sample_data, check_freq=False)
+
+
 def test_cache_append_idempotent(cache: ParquetCache, sample_data: pd.DataFrame) -> None:
     """Test idempotent append."""
     # Write initial data
@@ -60,11 +51,11 @@ def test_cache_append_idempotent(cache: ParquetCache, sample_data: pd.DataFrame)
     new_dates = pd.date_range("2024-01-11", periods=5, freq="D")
     new_data = pd.DataFrame(
         {
-            "open": range(110, 115),
-            "high": range(111, 116),
-            "low": range(109, 114),
-            "close": range(110, 115),
-            "volume": range(1010, 1015),
+            "open": np.arange(110, 115, dtype=np.int64),
+            "high": np.arange(111, 116, dtype=np.int64),
+            "low": np.arange(109, 114, dtype=np.int64),
+            "close": np.arange(110, 115, dtype=np.int64),
+            "volume": np.arange(1010, 1015, dtype=np.int64),
         },
         index=new_dates,
     )
@@ -1,217 +1,160 @@
 """Additional tests for cache module."""
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow.fs as pafs
 import pytest
 
-from src.data.cache import ParquetCache
+from src.data.cache import CACHE_FORMAT_ENV, ParquetCache
 
+# Shared across tests; DatetimeIndex is immutable
+_DATES_10 = pd.date_range("2020-01-01", periods=10, freq="D")
 
-def test_cache_read_missing_file() -> None:
-    """Test reading from non-existent cache file."""
-    cache_dir = Path("/tmp/test_cache_read_missing")
-    cache = ParquetCache(cache_dir)
 
-    df = cache.read("NONEXISTENT")
+def test_cache_read_missing_file(fs_cache: ParquetCache) -> None:
+    """Test reading from non-existent cache file."""
+    df = fs_cache.read("NONEXISTENT")
     assert df.empty
 
 
-def test_cache_read_with_timestamp_column() -> None:
+def test_cache_read_with_timestamp_column(fs_cache: ParquetCache) -> None:
     """Test reading cache with timestamp column instead of index."""
-    cache_dir = Path("/tmp/test_cache_timestamp_col")
-    cache_dir.mkdir(exist_ok=True, parents=True)
-    cache = ParquetCache(cache_dir)
-
     # Write with timestamp column
-    dates = pd.date_range("2020-01-01", periods=10, freq="D")
+    dates = _DATES_10
     df = pd.DataFrame(
         {
             "timestamp": dates,
-            "open": range(100, 110),
-            "high": range(101, 111),
-            "low": range(99, 109),
-            "close": range(100, 110),
-            "volume": [1000] * 10,
+            "open": np.arange(100, 110, dtype=np.int64),
+            "high": np.arange(101, 111, dtype=np.int64),
+            "low": np.arange(99, 109, dtype=np.int64),
+            "close": np.arange(100, 110, dtype=np.int64),
+            "volume": np.full(10, 1000, dtype=np.int64),
         }
     )
     df = df.set_index("timestamp")
-    cache.write("SPY", df)
+    fs_cache.write("SPY", df)
 
     # Read should handle timestamp column
-    result = cache.read("SPY")
+    result = fs_cache.read("SPY")
     assert not result.empty
 
 
-def test_cache_write_empty_dataframe() -> None:
+def test_cache_write_empty_dataframe(fs_cache: ParquetCache) -> None:
     """Test writing empty DataFrame."""
-    cache_dir = Path("/tmp/test_cache_write_empty")
-    cache = ParquetCache(cache_dir)
-
     # Should not crash, just warn
-    cache.write("SPY", pd.DataFrame())
+    fs_cache.write("SPY", pd.DataFrame())
 
 
-def test_cache_write_missing_columns() -> None:
+def test_cache_write_missing_columns(fs_cache: ParquetCache) -> None:
     """Test writing DataFrame with missing required columns."""
-    cache_dir = Path("/tmp/test_cache_missing_cols")
-    cache = ParquetCache(cache_dir)
-
-    dates = pd.date_range("2020-01-01", periods=10, freq="D")
+    dates = _DATES_10
     df = pd.DataFrame(
         {
-            "open": range(100, 110),
-            "close": range(100, 110),
+            "open": np.arange(100, 110, dtype=np.int64),
+            "close": np.arange(100, 110, dtype=np.int64),
             # Missing high, low, volume
         },
         index=dates,
     )
 
     with pytest.raises(ValueError):
-        cache.write("SPY", df)
+        fs_cache.write("SPY", df)
 
 
-def test_cache_write_duplicate_dates() -> None:
+def test_cache_write_duplicate_dates(fs_cache: ParquetCache) -> None:
     """Test writing DataFrame with duplicate dates."""
-    cache_dir = Path("/tmp/test_cache_duplicates")
-    cache_dir.mkdir(exist_ok=True, parents=True)
-    cache = ParquetCache(cache_dir)
-
-    dates = pd.date_range("2020-01-01", periods=10, freq="D")
+    dates = _DATES_10
     # Add duplicate
     dates_dup = list(dates) + [dates[0]]
     df = pd.DataFrame(
         {
-            "open": range(100, 111),
-            "high": range(101, 112),
-            "low": range(99, 110),
-            "close": range(100, 111),
-            "volume": [1000] * 11,
+            "open": np.arange(100, 111, dtype=np.int64),
+            "high": np.arange(101, 112, dtype=np.int64),
+            "low": np.arange(99, 110, dtype=np.int64),
+            "close": np.arange(100, 111, dtype=np.int64),
+            "volume": np.full(11, 1000, dtype=np.int64),
         },
         index=pd.DatetimeIndex(dates_dup),
     )
 
     # Should handle duplicates by keeping first
-    cache.write("SPY", df)
-    result = cache.read("SPY")
+    fs_cache.write("SPY", df)
+    result = fs_cache.read("SPY")
     assert len(result) == 10  # Duplicate removed
 
 
-def test_cache_append_empty_new_data() -> None:
+def test_cache_append_empty_new_data(populated_cache: ParquetCache) -> None:
     """Test appending empty DataFrame."""
-    cache_dir = Path("/tmp/test_cache_append_empty")
-    cache_dir.mkdir(exist_ok=True, parents=True)
-    cache = ParquetCache(cache_dir)
-
-    # Write initial data
-    dates = pd.date_range("2020-01-01", periods=10, freq="D")
-    df = pd.DataFrame(
-        {
-            "open": range(100, 110),
-            "high": range(101, 111),
-            "low": range(99, 109),
-            "close": range(100, 110),
-            "volume": [1000] * 10,
-        },
-        index=dates,
-    )
-    cache.write("SPY", df)
-
     # Append empty - should not crash
-    cache.append("SPY", pd.DataFrame())
+    populated_cache.append("SPY", pd.DataFrame())
 
 
-def test_cache_append_all_dates_exist() -> None:
+def test_cache_append_all_dates_exist(populated_cache: ParquetCache, ohlcv_10: pd.DataFrame) -> None:
     """Test appending when all dates already exist."""
-    cache_dir = Path("/tmp/test_cache_append_all_exist")
-    cache_dir.mkdir(exist_ok=True, parents=True)
-    cache = ParquetCache(cache_dir)
-
-    dates = pd.date_range("2020-01-01", periods=10, freq="D")
-    df = pd.DataFrame(
-        {
-            "open": range(100, 110),
-            "high": range(101, 111),
-            "low": range(99, 109),
-            "close": range(100, 110),
-            "volume": [1000] * 10,
-        },
-        index=dates,
-    )
-    cache.write("SPY", df)
-
     # Append same data - should be idempotent
-    cache.append("SPY", df)
-    result = cache.read("SPY")
+    populated_cache.append("SPY", ohlcv_10.copy())
+    result = populated_cache.read("SPY")
     assert len(result) == 10  # No duplicates
 
 
-def test_cache_append_with_timestamp_column() -> None:
+def test_cache_append_with_timestamp_column(populated_cache: ParquetCache) -> None:
     """Test appending with timestamp column."""
-    cache_dir = Path("/tmp/test_cache_append_timestamp")
-    cache_dir.mkdir(exist_ok=True, parents=True)
-    cache = ParquetCache(cache_dir)
-
-    # Write initial
-    dates1 = pd.date_range("2020-01-01", periods=5, freq="D")
-    df1 = pd.DataFrame(
-        {
-            "open": range(100, 105),
-            "high": range(101, 106),
-            "low": range(99, 104),
-            "close": range(100, 105),
-            "volume": [1000] * 5,
-        },
-        index=dates1,
-    )
-    cache.write("SPY", df1)
-
     # Append new data with timestamp column
-    dates2 = pd.date_range("2020-01-06", periods=5, freq="D")
-    df2 = pd.DataFrame(
+    dates = pd.date_range("2024-01-11", periods=5, freq="D")
+    df = pd.DataFrame(
         {
-            "timestamp": dates2,
-            "open": range(105, 110),
-            "high": range(106, 111),
-            "low": range(104, 109),
-            "close": range(105, 110),
-            "volume": [1000] * 5,
+            "timestamp": dates,
+            "open": np.arange(110, 115, dtype=np.int64),
+            "high": np.arange(111, 116, dtype=np.int64),
+            "low": np.arange(109, 114, dtype=np.int64),
+            "close": np.arange(110, 115, dtype=np.int64),
+            "volume": np.full(5, 1000, dtype=np.int64),
         }
     )
-    cache.append("SPY", df2)
-
-    result = cache.read("SPY")
-    assert len(result) == 10
+    populated_cache.append("SPY", df)
 
+    result = populated_cache.read("SPY")
+    assert len(result) == 15
 
-def test_cache_get_date_range_empty() -> None:
-    """Test get_date_range with empty cache."""
-    cache_dir = Path("/tmp/test_cache_date_range_empty")
-    cache = ParquetCache(cache_dir)
 
-    min_date, max_date = cache.get_date_range("NONEXISTENT")
+def test_cache_get_date_range_empty(fs_cache: ParquetCache) -> None:
+    """Test get_date_range with an empty cache."""
+    min_date, max_date = fs_cache.get_date_range("NONEXISTENT")
     assert min_date is None
     assert max_date is None
 
 
-def test_cache_get_date_range() -> None:
+def test_cache_get_date_range(populated_cache: ParquetCache, ohlcv_10: pd.DataFrame) -> None:
     """Test get_date_range with cached data."""
-    cache_dir = Path("/tmp/test_cache_date_range")
-    cache_dir.mkdir(exist_ok=True, parents=True)
-    cache = ParquetCache(cache_dir)
+    min_date, max_date = populated_cache.get_date_range("SPY")
+    assert min_date == ohlcv_10.index[0]
+    assert max_date == ohlcv_10.index[-1]
 
-    dates = pd.date_range("2020-01-01", periods=10, freq="D")
-    df = pd.DataFrame(
-        {
-            "open": range(100, 110),
-            "high": range(101, 111),
-            "low": range(99, 109),
-            "close": range(100, 110),
-            "volume": [1000] * 10,
-        },
-        index=dates,
-    )
-    cache.write("SPY", df)
 
-    min_date, max_date = cache.get_date_range("SPY")
-    assert min_date == dates[0]
-    assert max_date == dates[-1]
+def test_cache_arrow_ipc_round_trip(tmp_path: Path, ohlcv_10: pd.DataFrame) -> None:
+    """Test the Arrow IPC format round-trips OHLCV data with its index."""
+    cache = ParquetCache(tmp_path, file_format="arrow_ipc")
+    cache.write("SPY", ohlcv_10.copy())
+
+    assert cache.get_cache_path("SPY").suffix == ".arrow"
+    pd.testing.assert_frame_equal(cache.read("SPY"), ohlcv_10.rename_axis("timestamp"), check_freq=False)
+
+
+def test_cache_arrow_ipc_append_on_filesystem(tmp_path: Path, ohlcv_10: pd.DataFrame) -> None:
+    """Test append works on an Arrow IPC cache backed by an explicit pyarrow filesystem."""
+    filesystem = pafs.SubTreeFileSystem(str(tmp_path), pafs.LocalFileSystem())
+    cache = ParquetCache(Path("cache"), filesystem=filesystem, file_format="arrow_ipc")
+    cache.write("SPY", ohlcv_10.iloc[:5].copy())
+    cache.append("SPY", ohlcv_10.iloc[3:].copy())
+
+    assert len(cache.read("SPY")) == 10
+
+
+def test_cache_format_from_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the cache format defaults to $IBKR_CACHE_FORMAT and rejects unknown formats."""
+    monkeypatch.setenv(CACHE_FORMAT_ENV, "arrow_ipc")
+    assert ParquetCache(tmp_path).file_format == "arrow_ipc"
+
+    with pytest.raises(ValueError, match="Unknown cache format"):
+        ParquetCache(tmp_path, file_format="csv")
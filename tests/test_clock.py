@@ -2,6 +2,8 @@
 from datetime import datetime, time
 
 import pandas as pd
+import pytest
+from pytz import UTC, timezone
 
 from src.core.clock import (
     et_to_utc,
@@ -14,6 +16,14 @@ from src.core.clock import (
     utc_to_et,
 )
 
+ET = timezone("America/New_York")
+
+
+@pytest.fixture(scope="session")
+def market_calendar() -> pd.DataFrame:
+    """Build the market calendar once for all clock tests."""
+    return get_market_calendar()
+
 
 def test_parse_rebalance_time() -> None:
     """Test rebalance time parsing."""
@@ -23,9 +33,6 @@ def test_parse_rebalance_time() -> None:
 
 def test_get_rebalance_datetime() -> None:
     """Test rebalance datetime creation."""
-    from pytz import timezone
-
-    ET = timezone("America/New_York")
     date = ET.localize(datetime(2024, 1, 1))
     rebalance_dt = get_rebalance_datetime(date, "15:55")
     assert rebalance_dt.hour == 15
@@ -34,9 +41,6 @@ def test_get_rebalance_datetime() -> None:
 
 def test_et_to_utc() -> None:
     """Test ET to UTC conversion."""
-    from pytz import timezone
-
-    ET = timezone("America/New_York")
     et_dt = ET.localize(datetime(2024, 1, 1, 15, 55))
     utc_dt = et_to_utc(et_dt)
     assert utc_dt.tzinfo.zone == "UTC"
@@ -44,8 +48,6 @@ def test_et_to_utc() -> None:
 
 def test_utc_to_et() -> None:
     """Test UTC to ET conversion."""
-    from pytz import UTC
-
     utc_dt = UTC.localize(datetime(2024, 1, 1, 20, 55))
     et_dt = utc_to_et(utc_dt)
     assert et_dt.tzinfo.zone == "America/New_York"
@@ -57,28 +59,23 @@ def test_get_current_et_time() -> None:
     assert et_time.tzinfo.zone == "America/New_York"
 
 
-def test_get_market_calendar() -> None:
+def test_get_market_calendar(market_calendar: pd.DataFrame) -> None:
     """Test market calendar retrieval."""
-    calendar = get_market_calendar()
-    assert isinstance(calendar, pd.DataFrame)
+    assert isinstance(market_calendar, pd.DataFrame)
+    # Cached: repeated calls don't rebuild the schedule
+    assert get_market_calendar() is market_calendar
 
 
-def test_is_market_open() -> None:
+def test_is_market_open(market_calendar: pd.DataFrame) -> None:
     """Test market open check."""
-    from pytz import timezone
-
-    ET = timezone("America/New_York")
     # Use a known market day
     market_date = ET.localize(datetime(2024, 1, 2))  # Tuesday
-    is_open = is_market_open(market_date)
+    is_open = is_market_open(market_date, calendar=market_calendar)
     assert isinstance(is_open, bool)
 
 
-def test_get_next_market_date() -> None:
+def test_get_next_market_date(market_calendar: pd.DataFrame) -> None:
     """Test getting next market date."""
-    from pytz import timezone
-
-    ET = timezone("America/New_York")
     date = ET.localize(datetime(2024, 1, 1))
-    next_date = get_next_market_date(date)
+    next_date = get_next_market_date(date, calendar=market_calendar)
     assert next_date > date
@@ -1,14 +1,13 @@
 """Test compliance checks."""
 from datetime import datetime
 
-from src.core.config import load_config
+from src.core.config import AppConfig
 from src.strategy.compliance import ComplianceChecker
 
 
-def test_settlement_guard() -> None:
+def test_settlement_guard(base_config: AppConfig) -> None:
     """Test settlement guard check."""
-    config = load_config()
-    checker = ComplianceChecker(config)
+    checker = ComplianceChecker(base_config)
 
     # Should pass: target < settled
     is_valid, error = checker.check_settlement_guard(target_notional=1000.0, settled_cash=2000.0)
@@ -20,10 +19,9 @@ def test_settlement_guard() -> None:
     assert len(error) > 0
 
 
-def test_one_rebalance_per_day() -> None:
+def test_one_rebalance_per_day(base_config: AppConfig) -> None:
     """Test one rebalance per day check."""
-    config = load_config()
-    checker = ComplianceChecker(config)
+    checker = ComplianceChecker(base_config)
 
     date1 = datetime(2024, 1, 1, 15, 55)
     date2 = datetime(2024, 1, 1, 16, 0)  # Same day
@@ -43,17 +41,16 @@ def test_one_rebalance_per_day() -> None:
     assert is_valid is True
 
 
-def test_max_orders_per_day() -> None:
+def test_max_orders_per_day(base_config: AppConfig) -> None:
     """Test max orders per day check."""
-    config = load_config()
-    checker = ComplianceChecker(config)
+    checker = ComplianceChecker(base_config)
 
     # Should pass initially
     is_valid, error = checker.check_max_orders_per_day()
     assert is_valid is True
 
     # Record orders up to limit
-    for _ in range(config.execution.max_orders_per_day):
+    for _ in range(base_config.execution.max_orders_per_day):
         checker.record_order()
 
     # Should fail after limit
@@ -61,10 +58,9 @@ def test_max_orders_per_day() -> None:
     assert is_valid is False
 
 
-def test_validate_trade() -> None:
+def test_validate_trade(base_config: AppConfig) -> None:
     """Test full trade validation."""
-    config = load_config()
-    checker = ComplianceChecker(config)
+    checker = ComplianceChecker(base_config)
 
     date = datetime(2024, 1, 1, 15, 55)
 
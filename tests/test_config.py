@@ -1,19 +1,38 @@
 """Test core configuration loading."""
+from pathlib import Path
 
-from src.core.config import load_config
+import pytest
 
+from src.core.config import AppConfig, load_config, reload_config
 
-def test_config_loads() -> None:
+
+def test_config_loads(base_config: AppConfig) -> None:
     """Test that configuration loads successfully."""
-    config = load_config()
-    assert config is not None
-    assert config.ibkr.host == "127.0.0.1"
-    assert config.ibkr.port == 7497
-    assert len(config.universe) > 0
+    assert base_config is not None
+    assert base_config.ibkr.host == "127.0.0.1"
+    assert base_config.ibkr.port == 7497
+    assert len(base_config.universe) > 0
 
 
-def test_config_universe_default() -> None:
+def test_config_universe_default(base_config: AppConfig) -> None:
     """Test that default universe is set."""
-    config = load_config()
-    assert "SPY" in config.universe
-    assert "QQQ" in config.universe
+    assert "SPY" in base_config.universe
+    assert "QQQ" in base_config.universe
+
+
+def test_load_config_cached_copies_are_independent(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test cached loads hand out independent copies and track env and file changes."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("selection:\n  top_n: 3\n")
+    local_path = tmp_path / "config.local.yaml"
+
+    first = load_config(config_path, local_path)
+    first.selection.top_n = 99
+    assert load_config(config_path, local_path).selection.top_n == 3
+
+    monkeypatch.setenv("IB_PORT", "4002")
+    assert load_config(config_path, local_path).ibkr.port == 4002
+
+    config_path.write_text("selection:\n  top_n: 5\n")
+    assert load_config(config_path, local_path).selection.top_n == 3
+    assert reload_config(config_path, local_path).selection.top_n == 5
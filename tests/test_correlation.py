@@ -8,10 +8,13 @@ from src.features.correlation import (
     select_with_correlation_cap,
 )
 
+# Shared across tests; DatetimeIndex is immutable
+_DATES_100 = pd.date_range("2024-01-01", periods=100, freq="D")
+
 
 def test_correlation_matrix_basic() -> None:
     """Test correlation matrix calculation."""
-    dates = pd.date_range("2024-01-01", periods=100, freq="D")
+    dates = _DATES_100
     returns = pd.DataFrame(
         {
             "SPY": np.random.randn(100).cumsum(),
@@ -34,7 +37,7 @@ def test_correlation_matrix_basic() -> None:
 def test_correlation_cap_selection() -> None:
     """Test correlation cap selection."""
     # Create returns with known correlation
-    dates = pd.date_range("2024-01-01", periods=100, freq="D")
+    dates = _DATES_100
     base_returns = np.random.randn(100)
 
     # SPY and VTI highly correlated (similar returns)
@@ -87,6 +90,21 @@ def test_apply_correlation_cap() -> None:
     assert "GLD" in selected  # Should be included (low correlation)
 
 
+def test_apply_correlation_cap_missing_and_nan_correlations() -> None:
+    """Test symbols missing from the matrix or with NaN correlation are never blocked."""
+    corr_matrix = pd.DataFrame(
+        [[1.0, -0.9, np.nan], [-0.9, 1.0, 0.1], [np.nan, 0.1, 1.0]],
+        index=["SPY", "SH", "FLAT"],
+        columns=["SPY", "SH", "FLAT"],
+    )
+    scores = {"SPY": 1.0, "SH": 0.9, "FLAT": 0.8, "NEW": 0.7}
+
+    selected = apply_correlation_cap(["SPY", "SH", "FLAT", "NEW"], scores, corr_matrix, corr_cap=0.7)
+
+    # SH is blocked by |corr| with SPY; FLAT (NaN) and NEW (missing) pass
+    assert selected == ["SPY", "FLAT", "NEW"]
+
+
 def test_correlation_empty_returns() -> None:
     """Test correlation with empty returns."""
     returns = pd.DataFrame()
@@ -96,7 +114,7 @@ def test_correlation_empty_returns() -> None:
 
 def test_select_with_correlation_cap_empty() -> None:
     """Test selection with empty scores."""
-    dates = pd.date_range("2024-01-01", periods=100, freq="D")
+    dates = _DATES_100
     returns = pd.DataFrame({"SPY": np.random.randn(100)}, index=dates)
     selected = select_with_correlation_cap({}, returns, top_n=2)
     assert selected == []
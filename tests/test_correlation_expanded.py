@@ -3,10 +3,13 @@ import pandas as pd
 
 from src.features.correlation import get_correlation_matrix, select_with_correlation_cap
 
+# Shared across tests; DatetimeIndex is immutable
+_DATES_100 = pd.date_range("2020-01-01", periods=100, freq="D")
+
 
 def test_correlation_matrix_single_asset() -> None:
     """Test correlation matrix with single asset."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
+    dates = _DATES_100
     returns = pd.DataFrame({"SPY": pd.Series(0.001, index=dates)})
 
     corr_matrix = get_correlation_matrix(returns, window=30)
@@ -30,7 +33,7 @@ def test_correlation_matrix_small_window() -> None:
 
 def test_correlation_matrix_specific_date() -> None:
     """Test correlation matrix at specific date."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
+    dates = _DATES_100
     returns = pd.DataFrame(
         {
             "SPY": pd.Series(0.001, index=dates),
@@ -45,7 +48,7 @@ def test_correlation_matrix_specific_date() -> None:
 
 def test_select_with_correlation_cap_high_correlation() -> None:
     """Test selection with high correlation assets."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
+    dates = _DATES_100
     returns = pd.DataFrame(
         {
             "SPY": pd.Series(0.001, index=dates),
@@ -63,7 +66,7 @@ def test_select_with_correlation_cap_high_correlation() -> None:
 
 def test_select_with_correlation_cap_all_high_corr() -> None:
     """Test selection when all assets are highly correlated."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
+    dates = _DATES_100
     returns = pd.DataFrame(
         {
             "SPY": pd.Series(0.001, index=dates),
@@ -81,7 +84,7 @@ def test_select_with_correlation_cap_all_high_corr() -> None:
 
 def test_select_with_correlation_cap_specific_date() -> None:
     """Test selection at specific date."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
+    dates = _DATES_100
     returns = pd.DataFrame(
         {
             "SPY": pd.Series(0.001, index=dates),
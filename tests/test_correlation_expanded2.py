@@ -1,7 +1,14 @@
 """Additional tests for correlation module."""
+import numpy as np
 import pandas as pd
+import pytest
 
-from src.features.correlation import get_correlation_matrix
+from src.features import correlation
+from src.features.correlation import clear_correlation_cache, get_correlation_matrix
+
+# Shared across tests; DatetimeIndex is immutable
+_DATES_60 = pd.date_range("2020-01-01", periods=60, freq="D")
+_DATES_100 = pd.date_range("2020-01-01", periods=100, freq="D")
 
 
 def test_get_correlation_matrix_empty_returns() -> None:
@@ -13,12 +20,14 @@ def test_get_correlation_matrix_empty_returns() -> None:
 
 def test_get_correlation_matrix_single_column() -> None:
     """Test get_correlation_matrix with single column."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
+    dates = _DATES_100
     returns = pd.DataFrame({"SPY": pd.Series(0.001, index=dates)})
 
     corr_matrix = get_correlation_matrix(returns, window=30)
     # Single column should return 1x1 matrix
     assert not corr_matrix.empty
+    assert corr_matrix.shape == (1, 1)
+    assert corr_matrix.loc["SPY", "SPY"] == 1.0
 
 
 def test_get_correlation_matrix_insufficient_data() -> None:
@@ -38,7 +47,7 @@ def test_get_correlation_matrix_insufficient_data() -> None:
 
 def test_get_correlation_matrix_date_before_data() -> None:
     """Test get_correlation_matrix with date before any data."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
+    dates = _DATES_100
     returns = pd.DataFrame(
         {
             "SPY": pd.Series(0.001, index=dates),
@@ -50,3 +59,90 @@ def test_get_correlation_matrix_date_before_data() -> None:
     corr_matrix = get_correlation_matrix(returns, window=30, date=target_date)
     # Should handle gracefully
     assert isinstance(corr_matrix, pd.DataFrame)
+
+
+def test_get_correlation_matrix_matches_pandas() -> None:
+    """Test the Gram-matrix correlation matches pandas, including constant columns."""
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2020-01-01", periods=120, freq="D")
+    returns = pd.DataFrame(rng.normal(size=(120, 6)), index=dates, columns=list("ABCDEF"))
+    returns["F"] = returns["A"] * 0.9 + returns["B"] * 0.1
+    returns["FLAT"] = 0.001
+
+    corr_matrix = get_correlation_matrix(returns, window=90)
+    expected = returns.tail(90).corr()
+
+    pd.testing.assert_frame_equal(corr_matrix, expected, rtol=1e-10, atol=1e-12)
+
+
+def test_get_correlation_matrix_missing_values_use_pairwise() -> None:
+    """Test windows with NaNs fall back to pairwise-complete correlation."""
+    rng = np.random.default_rng(1)
+    dates = _DATES_60
+    returns = pd.DataFrame(rng.normal(size=(60, 3)), index=dates, columns=["SPY", "QQQ", "GLD"])
+    returns.iloc[:5, 2] = np.nan
+
+    corr_matrix = get_correlation_matrix(returns, window=60)
+
+    pd.testing.assert_frame_equal(corr_matrix, returns.corr())
+
+
+def test_get_correlation_matrix_memoized_per_returns_object() -> None:
+    """Test repeated queries on the same frame hit the cache and copies do not."""
+    clear_correlation_cache()
+    rng = np.random.default_rng(2)
+    dates = _DATES_60
+    returns = pd.DataFrame(rng.normal(size=(60, 3)), index=dates, columns=["SPY", "QQQ", "GLD"])
+
+    first = get_correlation_matrix(returns, window=30, date=dates[40])
+    assert get_correlation_matrix(returns, window=30, date=dates[40]) is first
+    assert get_correlation_matrix(returns, window=20, date=dates[40]) is not first
+
+    copied = get_correlation_matrix(returns.copy(), window=30, date=dates[40])
+    assert copied is not first
+    pd.testing.assert_frame_equal(copied, first)
+
+
+def test_get_correlation_matrix_rolling_stats_match_each_date() -> None:
+    """Test correlations read from rolling sums match pandas on every date."""
+    clear_correlation_cache()
+    rng = np.random.default_rng(3)
+    dates = pd.date_range("2020-01-01", periods=150, freq="D")
+    returns = pd.DataFrame(rng.normal(0, 0.01, size=(150, 4)), index=dates, columns=["SPY", "QQQ", "GLD", "TLT"])
+    returns.iloc[100:, 3] = 0.0
+    returns.iloc[10, 2] = np.nan
+
+    for date in dates[29::7]:
+        corr_matrix = get_correlation_matrix(returns, window=30, date=date)
+        expected = returns.loc[:date].tail(30).corr()
+        pd.testing.assert_frame_equal(corr_matrix, expected, rtol=1e-9, atol=1e-12)
+
+
+def test_get_correlation_matrix_window_path_reuses_buffer(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the per-window path (no rolling stats) matches pandas via a reused buffer."""
+    monkeypatch.setattr(correlation, "ROLLING_STATS_MAX_CELLS", 0)
+    clear_correlation_cache()
+    rng = np.random.default_rng(5)
+    dates = pd.date_range("2020-01-01", periods=80, freq="D")
+    returns = pd.DataFrame(rng.normal(0, 0.01, size=(80, 3)), index=dates, columns=["SPY", "QQQ", "GLD"])
+
+    for date in dates[[40, 60]]:
+        corr_matrix = get_correlation_matrix(returns, window=30, date=date)
+        expected = returns.loc[:date].tail(30).corr()
+        pd.testing.assert_frame_equal(corr_matrix, expected, rtol=1e-9, atol=1e-12)
+
+    assert correlation._get_buf((30, 3)) is correlation._get_buf((30, 3))
+
+
+def test_get_correlation_matrix_unsorted_index_matches_sorted() -> None:
+    """Test an unsorted index falls back to label filtering with the same result."""
+    rng = np.random.default_rng(6)
+    dates = _DATES_60
+    returns = pd.DataFrame(rng.normal(0, 0.01, size=(60, 3)), index=dates, columns=["SPY", "QQQ", "GLD"])
+    shuffled = returns.iloc[np.r_[30:60, 0:30]]
+
+    # tail() of the unsorted frame takes its last rows, which are the first 30 dates
+    result = get_correlation_matrix(shuffled, window=30, date=dates[40])
+    expected = get_correlation_matrix(returns, window=30, date=dates[29])
+    pd.testing.assert_frame_equal(result, expected, rtol=1e-9, atol=1e-12)
+    assert get_correlation_matrix(shuffled, window=30, date=dates[10]).empty
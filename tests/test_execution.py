@@ -32,9 +32,7 @@ def test_weights_to_orders() -> None:
     orders = executor.weights_to_orders(weights, equity=25000.0, dry_run=True)
 
     assert len(orders) == 2
-    assert all("symbol" in order for order in orders)
-    assert all("action" in order for order in orders)
-    assert all("quantity" in order for order in orders)
+    assert all(order.keys() >= {"symbol", "action", "quantity"} for order in orders)
 
 
 def test_weights_to_orders_limit_price() -> None:
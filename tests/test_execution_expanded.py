@@ -168,3 +168,49 @@ def test_execute_rebalance_with_positions() -> None:
     import asyncio
 
     asyncio.run(run_test())
+
+
+def test_weights_to_orders_quantities_and_limit_prices() -> None:
+    """Test order quantities, sides and limit prices across several symbols."""
+    config = load_config()
+    config.execution.order_type = "LMT"
+    config.execution.limit_offset_bps = 10
+    executor = IBKRExecutor(MagicMock(), config)
+
+    weights = {"SPY": 0.4, "QQQ": 0.1, "TLT": 0.2}
+    current_positions = {"QQQ": 40.0, "TLT": 20.0}
+
+    orders = executor.weights_to_orders(weights, current_positions=current_positions, equity=10000.0)
+
+    # TLT already holds its 20-share target, so only SPY and QQQ trade
+    assert [order["symbol"] for order in orders] == ["SPY", "QQQ"]
+    assert orders[0]["action"] == "BUY"
+    assert orders[0]["quantity"] == pytest.approx(40.0)
+    assert orders[0]["limit_price"] == pytest.approx(99.9)
+    assert orders[1]["action"] == "SELL"
+    assert orders[1]["quantity"] == pytest.approx(30.0)
+    assert orders[1]["limit_price"] == pytest.approx(100.1)
+    assert all(type(order["quantity"]) is float for order in orders)
+
+
+def test_weights_to_orders_min_trade_notional() -> None:
+    """Test rebalances below the minimum traded notional are skipped."""
+    config = load_config()
+    config.execution.min_trade_notional = 50.0
+    executor = IBKRExecutor(MagicMock(), config)
+
+    weights = {"SPY": 0.5, "QQQ": 0.5}
+    current_positions = {"SPY": 124.7, "QQQ": 100.0}
+
+    orders = executor.weights_to_orders(weights, current_positions=current_positions, equity=25000.0)
+
+    # SPY is $30 off target (skipped); QQQ needs 25 more shares ($2,500)
+    assert [order["symbol"] for order in orders] == ["QQQ"]
+
+
+def test_calculate_target_notional_empty_and_type() -> None:
+    """Test target notional is a plain float and zero for no weights."""
+    executor = IBKRExecutor(MagicMock(), load_config())
+
+    assert executor.calculate_target_notional({}, 25000.0) == 0.0
+    assert type(executor.calculate_target_notional({"SPY": 0.25, "TLT": 0.25}, 20000.0)) is float
@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from src.brokers.ibkr_client import IBKRClient
 from src.brokers.ibkr_exec import IBKRExecutor
 from src.core.config import load_config
 
@@ -91,3 +92,71 @@ async def test_execute_rebalance_live_mode() -> None:
     # In dry_run, should not actually place orders
     results = await executor.execute_rebalance(weights, dry_run=True, live=True)
     assert isinstance(results, list)
+
+
+@pytest.mark.asyncio
+async def test_place_orders_keeps_order_and_drops_skipped() -> None:
+    """Test placed orders come back in input order without skipped ones."""
+    config = load_config()
+    mock_client = MagicMock()
+    mock_client.connected = True
+    mock_client.ib.placeOrder = MagicMock(
+        side_effect=lambda contract, order: MagicMock(order=MagicMock(orderId=mock_client.ib.placeOrder.call_count))
+    )
+
+    executor = IBKRExecutor(mock_client, config)
+
+    base = {"action": "BUY", "quantity": 1.0, "account": "DUK200445"}
+    orders = [
+        {**base, "symbol": "SPY", "order_type": "MKT", "limit_price": None},
+        {**base, "symbol": "QQQ", "order_type": "LMT", "limit_price": None},
+        {**base, "symbol": "TLT", "order_type": "LMT", "limit_price": 99.0},
+    ]
+
+    results = await executor.place_orders(orders, dry_run=False)
+
+    assert [r["order"]["symbol"] for r in results] == ["SPY", "TLT"]
+    assert [r["order_id"] for r in results] == [1, 2]
+    assert all(r["status"] == "placed" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_place_orders_reuses_stock_contracts() -> None:
+    """Test repeated orders for a symbol share one cached Stock contract."""
+    mock_client = MagicMock()
+    mock_client.connected = True
+    executor = IBKRExecutor(mock_client, load_config())
+
+    order = {"symbol": "SPY", "action": "BUY", "quantity": 1.0, "order_type": "MKT", "account": "DUK200445"}
+    await executor.place_orders([order], dry_run=False)
+    await executor.place_orders([order], dry_run=False)
+
+    first, second = (call.args[0] for call in mock_client.ib.placeOrder.call_args_list)
+    assert first is second
+    assert (first.symbol, first.exchange, first.currency) == ("SPY", "SMART", "USD")
+
+
+@pytest.mark.asyncio
+async def test_stock_contracts_are_per_executor_and_reset_on_reconnect() -> None:
+    """Test executors don't share contracts and a reconnect drops the cached ones."""
+    client = IBKRClient(load_config().ibkr)
+    client.connected = True
+    client.ib.placeOrder = MagicMock()
+    first_executor = IBKRExecutor(client, load_config())
+    second_executor = IBKRExecutor(client, load_config())
+
+    order = {
+        "symbol": "SPY",
+        "action": "BUY",
+        "quantity": 1.0,
+        "order_type": "MKT",
+        "account": "DUK200445",
+    }
+    await first_executor.place_orders([order], dry_run=False)
+    await second_executor.place_orders([order], dry_run=False)
+    client.ib.connectedEvent.emit()
+    await first_executor.place_orders([order], dry_run=False)
+
+    contracts = [call.args[0] for call in client.ib.placeOrder.call_args_list]
+    assert contracts[0] is not contracts[1]
+    assert contracts[0] is not contracts[2]
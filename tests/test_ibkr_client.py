@@ -1,33 +1,25 @@
 """Test IBKR client with mocks."""
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import Mock
 
 import pytest
+from ib_insync import AccountValue, BarData
 
 from src.brokers.ibkr_client import IBKRClient
-from src.core.config import load_config
+from src.core.config import AppConfig
 
 
-def test_ibkr_client_init() -> None:
+def test_ibkr_client_init(base_config: AppConfig) -> None:
     """Test IBKRClient initialization."""
-    config = load_config()
-    client = IBKRClient(config.ibkr)
+    client = IBKRClient(base_config.ibkr)
     assert client.config is not None
     assert client.connected is False
 
 
 @pytest.mark.asyncio
-@patch("src.brokers.ibkr_client.IB")
-async def test_ibkr_client_connect(mock_ib_class) -> None:
+async def test_ibkr_client_connect(mock_ib: Mock, base_config: AppConfig) -> None:
     """Test IBKR client connection."""
-    # Setup mock
-    mock_ib = MagicMock()
-    mock_ib.connectAsync = AsyncMock()
-    mock_ib.reqMarketDataType = MagicMock()
-    mock_ib_class.return_value = mock_ib
-
-    config = load_config()
-    client = IBKRClient(config.ibkr)
+    client = IBKRClient(base_config.ibkr)
 
     await client.connect()
 
@@ -36,43 +28,12 @@ async def test_ibkr_client_connect(mock_ib_class) -> None:
 
 
 @pytest.mark.asyncio
-@patch("src.brokers.ibkr_client.IB")
-@patch("src.brokers.ibkr_client.util")
-async def test_ibkr_client_fetch_historical_data(mock_util, mock_ib_class) -> None:
+async def test_ibkr_client_fetch_historical_data(mock_ib: Mock, base_config: AppConfig) -> None:
     """Test historical data fetching."""
-    import pandas as pd
-
-    # Setup mock DataFrame from util.df
-    mock_df = pd.DataFrame(
-        {
-            "date": [pd.Timestamp("2024-01-01")],
-            "open": [100.0],
-            "high": [101.0],
-            "low": [99.0],
-            "close": [100.0],
-            "volume": [1000],
-        }
-    )
-    mock_util.df = MagicMock(return_value=mock_df)
-
-    # Setup mock Bar object
-    mock_bar = MagicMock()
-    mock_bar.time = datetime(2024, 1, 1)
-    mock_bar.open = 100.0
-    mock_bar.high = 101.0
-    mock_bar.low = 99.0
-    mock_bar.close = 100.0
-    mock_bar.volume = 1000
-
-    # Setup mock IB
-    mock_ib = MagicMock()
-    mock_ib.connectAsync = AsyncMock()
-    mock_ib.reqMarketDataType = MagicMock()
-    mock_ib.reqHistoricalDataAsync = AsyncMock(return_value=[mock_bar])
-    mock_ib_class.return_value = mock_ib
-
-    config = load_config()
-    client = IBKRClient(config.ibkr)
+    bar = BarData(date=datetime(2024, 1, 1), open=100.0, high=101.0, low=99.0, close=100.0, volume=1000)
+    mock_ib.reqHistoricalDataAsync.return_value = [bar]
+
+    client = IBKRClient(base_config.ibkr)
     await client.connect()
 
     start_date = datetime(2024, 1, 1)
@@ -85,23 +46,13 @@ async def test_ibkr_client_fetch_historical_data(mock_util, mock_ib_class) -> No
 
 
 @pytest.mark.asyncio
-@patch("src.brokers.ibkr_client.IB")
-async def test_ibkr_client_get_account_summary(mock_ib_class) -> None:
+async def test_ibkr_client_get_account_summary(mock_ib: Mock, base_config: AppConfig) -> None:
     """Test account summary retrieval."""
-    # Setup mock AccountValue object
-    mock_account_value = MagicMock()
-    mock_account_value.tag = "NetLiquidation"
-    mock_account_value.value = "25000"
-
-    # Setup mock IB
-    mock_ib = MagicMock()
-    mock_ib.connectAsync = AsyncMock()
-    mock_ib.reqMarketDataType = MagicMock()
-    mock_ib.accountValues = MagicMock(return_value=[mock_account_value])
-    mock_ib_class.return_value = mock_ib
-
-    config = load_config()
-    client = IBKRClient(config.ibkr)
+    mock_ib.accountValues.return_value = [
+        AccountValue(account="DUK200445", tag="NetLiquidation", value="25000", currency="USD", modelCode="")
+    ]
+
+    client = IBKRClient(base_config.ibkr)
     await client.connect()
 
     summary = client.get_account_summary()
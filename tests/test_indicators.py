@@ -1,8 +1,9 @@
 """Test indicators against known values."""
+import numpy as np
 import pandas as pd
 import pytest
 
-from src.features.indicators import atr, ema, macd, stdev
+from src.features.indicators import _ema2d_kernel, atr, ema, ema2d, macd, stdev, tail_std
 
 
 def test_ema_basic() -> None:
@@ -34,6 +35,21 @@ def test_ema_window_validation() -> None:
         ema(series, window=-1)
 
 
+def test_ema_matches_recursion() -> None:
+    """Test EMA equals the textbook recursion on integer input."""
+    series = pd.Series(np.arange(50) % 7, index=pd.date_range("2024-01-01", periods=50))
+    result = ema(series, window=5)
+
+    alpha = 2.0 / 6.0
+    expected = [float(series.iloc[0])]
+    for value in series.iloc[1:]:
+        expected.append(alpha * value + (1 - alpha) * expected[-1])
+
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=0, atol=1e-12)
+    assert result.index.equals(series.index)
+    assert result.name == "EMA5"
+
+
 def test_atr_basic() -> None:
     """Test ATR with simple data."""
     high = pd.Series([110, 111, 112])
@@ -45,6 +61,18 @@ def test_atr_basic() -> None:
     assert all(atr_result > 0)
 
 
+def test_atr_uses_previous_close() -> None:
+    """Test ATR true range includes gaps against the previous close."""
+    high = pd.Series([110.0, 125.0, 112.0])
+    low = pd.Series([100.0, 120.0, 90.0])
+    close = pd.Series([105.0, 122.0, 95.0])
+    atr_result = atr(high, low, close, window=2)
+
+    # TRs: 10, max(5, 20, 15) = 20, max(22, 10, 32) = 32
+    assert atr_result.tolist() == [10.0, 15.0, 23.5]
+    assert atr_result.name == "ATR2"
+
+
 def test_atr_window_validation() -> None:
     """Test ATR window validation."""
     high = pd.Series([110, 111])
@@ -68,6 +96,18 @@ def test_stdev_basic() -> None:
     assert stdev_result.iloc[-1] > 0
 
 
+def test_stdev_matches_pandas_rolling() -> None:
+    """Test the Welford rolling std matches pandas, including NaNs and flat runs."""
+    rng = np.random.default_rng(4)
+    series = pd.Series(100 + rng.normal(0, 1, 300).cumsum(), name="close")
+    series.iloc[50:80] = series.iloc[50]
+    series.iloc[rng.choice(300, 20, replace=False)] = np.nan
+
+    for window in [2, 5, 20]:
+        expected = series.rolling(window=window, min_periods=1).std(ddof=1)
+        pd.testing.assert_series_equal(stdev(series, window), expected, rtol=1e-9, atol=1e-9)
+
+
 def test_macd_basic() -> None:
     """Test MACD calculation."""
     close = pd.Series(range(100, 150), dtype=float)
@@ -79,6 +119,20 @@ def test_macd_basic() -> None:
     assert not macd_line.isna().all()
 
 
+def test_macd_matches_chained_emas() -> None:
+    """Test the fused MACD pass equals MACD built from separate EMAs."""
+    rng = np.random.default_rng(3)
+    close = pd.Series(100 + rng.normal(0, 1, 120).cumsum())
+
+    macd_line, signal_line, histogram = macd(close, fast=12, slow=26, signal=9)
+
+    expected_macd = ema(close, 12) - ema(close, 26)
+    expected_signal = ema(expected_macd, 9)
+    np.testing.assert_array_equal(macd_line.to_numpy(), expected_macd.to_numpy())
+    np.testing.assert_array_equal(signal_line.to_numpy(), expected_signal.to_numpy())
+    np.testing.assert_array_equal(histogram.to_numpy(), (expected_macd - expected_signal).to_numpy())
+
+
 def test_macd_validation() -> None:
     """Test MACD parameter validation."""
     close = pd.Series([100, 101, 102])
@@ -102,3 +156,52 @@ def test_atr_empty_series() -> None:
     close = pd.Series(dtype=float)
     atr_result = atr(high, low, close, window=5)
     assert len(atr_result) == 0
+
+
+def test_tail_std_matches_rolling_stdev() -> None:
+    """Test tail_std equals the last rolling stdev value per column."""
+    rng = np.random.default_rng(0)
+    values = rng.normal(0, 0.01, size=(100, 3))
+    values[95, 1] = np.nan
+
+    result = tail_std(values, window=20)
+
+    for j in range(3):
+        expected = pd.Series(values[:, j]).iloc[-20:].std(ddof=1)
+        assert abs(result[j] - expected) < 1e-12
+
+    assert np.isnan(tail_std(np.array([1.0]), window=5)[0])
+
+
+def test_ema2d_matches_pandas_ewm() -> None:
+    """Test ema2d equals per-column pandas EWM with NaN gaps."""
+    rng = np.random.default_rng(1)
+    values = rng.normal(100, 5, size=(200, 3))
+    values[rng.random((200, 3)) < 0.1] = np.nan
+    values[:5, 1] = np.nan
+
+    expected = pd.DataFrame(values).ewm(span=20, adjust=False, ignore_na=True).mean().to_numpy()
+    result = ema2d(values, span=20)
+
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_ema2d_kernel_matches_pandas_ewm() -> None:
+    """Test the EMA kernel (pure-Python without Numba) is bit-identical to pandas."""
+    rng = np.random.default_rng(2)
+    values = rng.normal(100, 5, size=(100, 2))
+    values[rng.random((100, 2)) < 0.1] = np.nan
+
+    for window in [3, 6, 14, 19]:
+        expected = pd.DataFrame(values).ewm(alpha=1.0 / window, adjust=False, ignore_na=True).mean().to_numpy()
+        alpha = 1.0 / window
+        result = _ema2d_kernel(values, 1.0 / (1.0 + (1 - alpha) / alpha))
+        np.testing.assert_array_equal(result, expected)
+
+
+def test_ema2d_invalid_arguments() -> None:
+    """Test ema2d rejects invalid smoothing arguments."""
+    with pytest.raises(ValueError):
+        ema2d(np.ones((3, 1)), alpha=0.0)
+    with pytest.raises(ValueError):
+        ema2d(np.ones((3, 1)))
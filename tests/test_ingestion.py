@@ -1,6 +1,6 @@
 """Test data ingestion module."""
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import pandas as pd
 import pytest
@@ -19,29 +19,23 @@ def test_data_ingestion_init() -> None:
 
 
 @pytest.mark.asyncio
-@patch("src.data.ingestion.IBKRClient")
-async def test_fetch_and_cache_symbol(mock_client_class) -> None:
+async def test_fetch_and_cache_symbol(mock_ibkr: MagicMock, tmp_path: Path) -> None:
     """Test fetching and caching a single symbol."""
     # Setup mocks
-    mock_client = MagicMock()
-    mock_client.connected = False
-    mock_client.fetch_historical_data = AsyncMock(
-        return_value=pd.DataFrame(
-            {
-                "open": [100, 101],
-                "high": [101, 102],
-                "low": [99, 100],
-                "close": [100, 101],
-                "volume": [1000, 1100],
-            },
-            index=pd.date_range("2024-01-01", periods=2, freq="D"),
-        )
+    mock_ibkr.fetch_historical_data.return_value = pd.DataFrame(
+        {
+            "open": [100, 101],
+            "high": [101, 102],
+            "low": [99, 100],
+            "close": [100, 101],
+            "volume": [1000, 1100],
+        },
+        index=pd.date_range("2024-01-01", periods=2, freq="D"),
     )
-    mock_client_class.return_value = mock_client
 
     config = load_config()
-    cache_dir = Path("/tmp/test_cache")
-    ingestion = DataIngestion(config, cache_dir=cache_dir)
+    cache_dir = tmp_path / "cache"
+    ingestion = DataIngestion(config, cache_dir=cache_dir, client=mock_ibkr)
 
     # Test fetch
     df = await ingestion.fetch_and_cache_symbol("SPY", force_refresh=True)
@@ -51,32 +45,24 @@ async def test_fetch_and_cache_symbol(mock_client_class) -> None:
 
 
 @pytest.mark.asyncio
-@patch("src.data.ingestion.IBKRClient")
-async def test_fetch_all(mock_client_class) -> None:
+async def test_fetch_all(mock_ibkr: MagicMock, tmp_path: Path) -> None:
     """Test fetching all symbols."""
     # Setup mocks
-    mock_client = MagicMock()
-    mock_client.connected = False
-    mock_client.connect = AsyncMock()
-    mock_client.disconnect = AsyncMock()
-    mock_client.fetch_historical_data = AsyncMock(
-        return_value=pd.DataFrame(
-            {
-                "open": [100],
-                "high": [101],
-                "low": [99],
-                "close": [100],
-                "volume": [1000],
-            },
-            index=pd.date_range("2024-01-01", periods=1, freq="D"),
-        )
+    mock_ibkr.fetch_historical_data.return_value = pd.DataFrame(
+        {
+            "open": [100],
+            "high": [101],
+            "low": [99],
+            "close": [100],
+            "volume": [1000],
+        },
+        index=pd.date_range("2024-01-01", periods=1, freq="D"),
     )
-    mock_client_class.return_value = mock_client
 
     config = load_config()
     config.universe = ["SPY", "QQQ"]  # Limit for test
-    cache_dir = Path("/tmp/test_cache")
-    ingestion = DataIngestion(config, cache_dir=cache_dir)
+    cache_dir = tmp_path / "cache"
+    ingestion = DataIngestion(config, cache_dir=cache_dir, client=mock_ibkr)
 
     # Test fetch all
     results = await ingestion.fetch_all(force_refresh=True)
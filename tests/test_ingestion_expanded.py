@@ -1,7 +1,7 @@
 """Expanded tests for data ingestion."""
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import pandas as pd
 import pytest
@@ -11,68 +11,31 @@ from src.data.ingestion import DataIngestion
 
 
 @pytest.mark.asyncio
-@patch("src.data.ingestion.IBKRClient")
-async def test_fetch_and_cache_symbol_from_cache(mock_client_class) -> None:
+async def test_fetch_and_cache_symbol_from_cache(mock_ibkr: MagicMock, seeded_cache_dir: Path) -> None:
     """Test fetching symbol that exists in cache."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_client.connected = False
-    mock_client.fetch_historical_data = AsyncMock(return_value=pd.DataFrame())  # Empty when using cache
-    mock_client_class.return_value = mock_client
-
     config = load_config()
-    cache_dir = Path("/tmp/test_cache_expanded")
-    cache_dir.mkdir(exist_ok=True, parents=True)
-
-    # Create cache with existing data
-    from src.data.cache import ParquetCache
-
-    cache = ParquetCache(cache_dir)
-    existing_data = pd.DataFrame(
-        {
-            "open": [100],
-            "high": [101],
-            "low": [99],
-            "close": [100],
-            "volume": [1000],
-        },
-        index=pd.date_range("2024-01-01", periods=1, freq="D"),
-    )
-    cache.write("SPY", existing_data)
-
-    ingestion = DataIngestion(config, cache_dir=cache_dir)
+
+    # Session cache already holds 10 SPY bars; the empty fetch leaves it unchanged
+    ingestion = DataIngestion(config, cache_dir=seeded_cache_dir, client=mock_ibkr)
 
     # Fetch without force refresh should use cache
     df = await ingestion.fetch_and_cache_symbol("SPY", force_refresh=False)
 
     assert not df.empty
-    assert len(df) == 1
+    assert len(df) == 10
 
 
 @pytest.mark.asyncio
-@patch("src.data.ingestion.IBKRClient")
-async def test_fetch_and_cache_symbol_date_range(mock_client_class) -> None:
+async def test_fetch_and_cache_symbol_date_range(
+    mock_ibkr: MagicMock, ohlcv_10: pd.DataFrame, tmp_path: Path
+) -> None:
     """Test fetching symbol with date range."""
     # Setup mocks
-    mock_client = MagicMock()
-    mock_client.connected = False
-    mock_client.fetch_historical_data = AsyncMock(
-        return_value=pd.DataFrame(
-            {
-                "open": range(100, 110),
-                "high": range(101, 111),
-                "low": range(99, 109),
-                "close": range(100, 110),
-                "volume": [1000] * 10,
-            },
-            index=pd.date_range("2024-01-01", periods=10, freq="D"),
-        )
-    )
-    mock_client_class.return_value = mock_client
+    mock_ibkr.fetch_historical_data.return_value = ohlcv_10
 
     config = load_config()
-    cache_dir = Path("/tmp/test_cache_date_range")
-    ingestion = DataIngestion(config, cache_dir=cache_dir)
+    cache_dir = tmp_path / "cache"
+    ingestion = DataIngestion(config, cache_dir=cache_dir, client=mock_ibkr)
 
     start_date = datetime(2024, 1, 1)
     end_date = datetime(2024, 1, 10)
@@ -84,40 +47,24 @@ async def test_fetch_and_cache_symbol_date_range(mock_client_class) -> None:
 
 
 @pytest.mark.asyncio
-@patch("src.data.ingestion.IBKRClient")
-async def test_fetch_all_partial_failure(mock_client_class) -> None:
+async def test_fetch_all_partial_failure(mock_ibkr: MagicMock, tmp_path: Path) -> None:
     """Test fetch_all with some symbols failing."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_client.connected = False
-    mock_client.connect = AsyncMock()
-    mock_client.disconnect = AsyncMock()
-
-    def mock_fetch(symbol, *args, **kwargs):
-        if symbol == "SPY":
-            return pd.DataFrame(
-                {
-                    "open": [100],
-                    "high": [101],
-                    "low": [99],
-                    "close": [100],
-                    "volume": [1000],
-                },
-                index=pd.date_range("2024-01-01", periods=1, freq="D"),
-            )
-        else:
-            raise ValueError(f"Failed to fetch {symbol}")
-
-    mock_client.fetch_historical_data = AsyncMock(side_effect=mock_fetch)
-    mock_client_class.return_value = mock_client
+    # One canned response per fetch, consumed in universe order
+    mock_ibkr.fetch_historical_data.side_effect = [
+        pd.DataFrame(
+            {"open": [100], "high": [101], "low": [99], "close": [100], "volume": [1000]},
+            index=pd.date_range("2024-01-01", periods=1, freq="D"),
+        ),
+        ValueError("Failed to fetch QQQ"),
+    ]
 
     config = load_config()
     config.universe = ["SPY", "QQQ"]  # Limit for test
-    cache_dir = Path("/tmp/test_cache_partial")
-    ingestion = DataIngestion(config, cache_dir=cache_dir)
+    cache_dir = tmp_path / "cache"
+    ingestion = DataIngestion(config, cache_dir=cache_dir, client=mock_ibkr)
 
     # Should handle partial failures gracefully
     results = await ingestion.fetch_all(force_refresh=True)
 
-    # Should have at least SPY
-    assert "SPY" in results or len(results) >= 0
+    assert len(results["SPY"]) == 1
+    assert results["QQQ"].empty
@@ -1,4 +1,5 @@
 """Integration tests for end-to-end workflows."""
+import numpy as np
 import pandas as pd
 
 from src.core.config import load_config
@@ -7,46 +8,14 @@ from src.strategy.selector import select_assets
 from src.strategy.weighting import calculate_weights
 
 
-def test_end_to_end_backtest() -> None:
+def test_end_to_end_backtest(two_asset_ohlcv: dict[str, pd.DataFrame]) -> None:
     """Test end-to-end backtest workflow."""
-    # Create sample data
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
-    data = {
-        "SPY": pd.DataFrame(
-            {
-                "open": range(100, 200),
-                "high": range(101, 201),
-                "low": range(99, 199),
-                "close": range(100, 200),
-                "volume": [1000] * 100,
-            },
-            index=dates,
-        ),
-        "QQQ": pd.DataFrame(
-            {
-                "open": range(200, 300),
-                "high": range(201, 301),
-                "low": range(199, 299),
-                "close": range(200, 300),
-                "volume": [1000] * 100,
-            },
-            index=dates,
-        ),
-    }
+    data = two_asset_ohlcv
 
     config = load_config()
     config.selection.top_n = 2
 
-    # Calculate returns
-    returns_dict = {}
-    for symbol, df in data.items():
-        returns = df["close"].pct_change()
-        returns_dict[symbol] = returns
-
-    returns = pd.DataFrame(returns_dict)
-    returns = returns.fillna(0.0)
-
-    # Run backtest
+    # Run backtest (returns are derived from the closes inside run_backtest)
     results = run_backtest(data, config)
 
     assert results is not None
@@ -55,43 +24,17 @@ def test_end_to_end_backtest() -> None:
     assert not results["equity"].empty
 
 
-def test_end_to_end_selection_and_weights() -> None:
+def test_end_to_end_selection_and_weights(two_asset_ohlcv: dict[str, pd.DataFrame]) -> None:
     """Test end-to-end selection and weighting."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
-    data = {
-        "SPY": pd.DataFrame(
-            {
-                "open": range(100, 200),
-                "high": range(101, 201),
-                "low": range(99, 199),
-                "close": range(100, 200),
-                "volume": [1000] * 100,
-            },
-            index=dates,
-        ),
-        "QQQ": pd.DataFrame(
-            {
-                "open": range(200, 300),
-                "high": range(201, 301),
-                "low": range(199, 299),
-                "close": range(200, 300),
-                "volume": [1000] * 100,
-            },
-            index=dates,
-        ),
-    }
+    data = two_asset_ohlcv
 
     config = load_config()
     config.selection.top_n = 2
 
-    # Calculate returns
-    returns_dict = {}
-    for symbol, df in data.items():
-        returns = df["close"].pct_change()
-        returns_dict[symbol] = returns
-
-    returns = pd.DataFrame(returns_dict)
-    returns = returns.fillna(0.0)
+    # Close-to-close returns of the linear price paths, computed once as one array
+    closes = np.column_stack([df["close"].to_numpy(dtype=np.float64) for df in data.values()])
+    returns = pd.DataFrame(np.zeros_like(closes), index=data["SPY"].index, columns=list(data))
+    returns.iloc[1:] = closes[1:] / closes[:-1] - 1.0
 
     # Select assets
     selected = select_assets(data, returns, config)
@@ -0,0 +1,24 @@
+"""Test optional Numba JIT helper."""
+import numpy as np
+
+from src.core.jit import njit
+
+
+def test_njit_bare_decorator() -> None:
+    """Test njit used without options."""
+
+    @njit
+    def add(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return a + b
+
+    assert np.array_equal(add(np.ones(3), np.ones(3)), np.full(3, 2.0))
+
+
+def test_njit_with_options() -> None:
+    """Test njit used with options."""
+
+    @njit(cache=False, fastmath=True)
+    def total(a: np.ndarray) -> float:
+        return np.sum(a)
+
+    assert total(np.arange(4.0)) == 6.0
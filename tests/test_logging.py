@@ -1,8 +1,10 @@
 """Test core logging setup."""
+import pytest
 
 from src.core.logging import get_logger, setup_logging
 
 
+@pytest.mark.usefixtures("isolated_root_logger")
 def test_logging_setup() -> None:
     """Test that logging can be set up."""
     setup_logging(log_level="INFO", enable_file=False)
@@ -78,6 +78,14 @@ def test_calculate_max_drawdown_large_drawdown() -> None:
     assert max_dd < -0.5  # Should be around -54%
 
 
+def test_calculate_max_drawdown_skips_nan() -> None:
+    """Test max drawdown ignores NaN equity values like expanding().max()."""
+    equity = pd.Series([np.nan, 100.0, 120.0, np.nan, 90.0, 130.0])
+    max_dd = calculate_max_drawdown(equity)
+    assert isinstance(max_dd, float)
+    assert max_dd == -0.25
+
+
 def test_calculate_calmar_zero_drawdown() -> None:
     """Test Calmar with zero drawdown."""
     calmar = calculate_calmar(0.15, 0.0)
@@ -143,3 +151,23 @@ def test_calculate_all_metrics_edge_cases() -> None:
     assert "PF" in metrics
     assert "Turnover" in metrics
     assert metrics["Turnover"] == 0.0
+
+
+def test_calculate_all_metrics_matches_individual_metrics() -> None:
+    """Test the fused all-metrics pass equals the individual metric functions."""
+    rng = np.random.default_rng(0)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 300))
+    returns.iloc[::7] = np.nan
+    equity = (1 + returns.fillna(0.0)).cumprod()
+    turnover = returns.abs()
+
+    metrics = calculate_all_metrics(returns, equity, turnover)
+    cagr = calculate_cagr(equity)
+    max_dd = calculate_max_drawdown(equity)
+
+    assert metrics["CAGR"] == cagr
+    assert metrics["Sharpe"] == calculate_sharpe(returns)
+    assert metrics["MaxDD"] == max_dd
+    assert metrics["Calmar"] == calculate_calmar(cagr, max_dd)
+    assert metrics["PF"] == calculate_profit_factor(returns)
+    assert metrics["Turnover"] == calculate_turnover_annualized(turnover)
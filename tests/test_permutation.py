@@ -44,6 +44,8 @@ def test_permutation_deterministic() -> None:
     pd.testing.assert_frame_equal(permuted1, permuted2)
 
 
+@pytest.mark.slow
+@pytest.mark.xdist_group("slow")
 def test_permutation_p_value_range() -> None:
     """Test that p-value is in valid range [0, 1]."""
     dates = pd.date_range("2020-01-01", periods=200, freq="D")
@@ -5,7 +5,12 @@ import numpy as np
 import pandas as pd
 
 from src.core.config import load_config
-from src.strategy.permutation import permute_returns_joint, run_permutation_test
+from src.strategy.permutation import (
+    partial_shuffle,
+    permute_returns_joint,
+    permute_returns_joint_partial,
+    run_permutation_test,
+)
 
 
 def test_permute_returns_joint_empty() -> None:
@@ -23,23 +28,11 @@ def test_permute_returns_joint_single_column() -> None:
     assert permuted.shape == returns.shape
 
 
-def test_run_permutation_test_insufficient_data() -> None:
+def test_run_permutation_test_insufficient_data(ohlcv_flat_10: pd.DataFrame) -> None:
     """Test permutation test with insufficient data."""
-    dates = pd.date_range("2020-01-01", periods=10, freq="D")  # Too few days
-    data = {
-        "SPY": pd.DataFrame(
-            {
-                "open": [100] * 10,
-                "high": [101] * 10,
-                "low": [99] * 10,
-                "close": [100] * 10,
-                "volume": [1000] * 10,
-            },
-            index=dates,
-        )
-    }
-
-    returns = pd.DataFrame({"SPY": [0.001] * 10}, index=dates)
+    data = {"SPY": ohlcv_flat_10}  # Too few days
+
+    returns = pd.DataFrame({"SPY": [0.001] * 10}, index=ohlcv_flat_10.index)
 
     config = load_config()
     config.selection.top_n = 1
@@ -52,3 +45,32 @@ def test_run_permutation_test_insufficient_data() -> None:
 
     # Should handle insufficient data gracefully
     assert result is not None
+
+
+def test_partial_shuffle_distinct_indices() -> None:
+    """Test partial shuffle returns k distinct in-range indices."""
+    rng = np.random.default_rng(42)
+    sampled = partial_shuffle(1000, 50, rng)
+    assert len(sampled) == 50
+    assert len(set(sampled.tolist())) == 50
+    assert sampled.min() >= 0
+    assert sampled.max() < 1000
+
+
+def test_partial_shuffle_full_is_permutation() -> None:
+    """Test partial shuffle with k == T yields a full permutation."""
+    rng = np.random.default_rng(0)
+    sampled = partial_shuffle(30, 30, rng)
+    assert sorted(sampled.tolist()) == list(range(30))
+
+
+def test_permute_returns_joint_partial() -> None:
+    """Test partial permutation only moves k rows and keeps rows intact."""
+    dates = pd.date_range("2024-01-01", periods=100, freq="D")
+    returns = pd.DataFrame({"SPY": np.arange(100.0), "QQQ": np.arange(100.0) * 2}, index=dates)
+
+    permuted = permute_returns_joint_partial(returns, k=10, seed=42)
+    assert permuted.index.equals(returns.index)
+    assert (permuted["SPY"] != returns["SPY"]).sum() <= 10
+    assert (permuted["QQQ"] == permuted["SPY"] * 2).all()
+    assert sorted(permuted["SPY"]) == sorted(returns["SPY"])
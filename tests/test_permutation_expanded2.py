@@ -1,22 +1,27 @@
 """Additional expanded tests for permutation module."""
+from collections.abc import Callable
 from datetime import datetime
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
+import pytest
 
-from src.strategy.permutation import permute_returns_joint, run_permutation_test
+from src.core.config import load_config
+from src.strategy.permutation import (
+    _permute_rows_kernel,
+    permute_returns_joint,
+    run_permutation_test,
+    wilson_interval,
+)
 
+# Shared across tests; DatetimeIndex is immutable
+_DATES_50 = pd.date_range("2020-01-01", periods=50, freq="D")
 
-def test_permute_returns_joint_different_seeds() -> None:
+
+def test_permute_returns_joint_different_seeds(rng: np.random.Generator) -> None:
     """Test that different seeds produce different permutations."""
-    dates = pd.date_range("2020-01-01", periods=50, freq="D")
-    returns = pd.DataFrame(
-        {
-            "SPY": np.random.RandomState(42).randn(50),
-            "QQQ": np.random.RandomState(43).randn(50),
-        },
-        index=dates,
-    )
+    returns = pd.DataFrame(rng.standard_normal((50, 2)), index=_DATES_50, columns=["SPY", "QQQ"])
 
     permuted1 = permute_returns_joint(returns, seed=1)
     permuted2 = permute_returns_joint(returns, seed=2)
@@ -25,16 +30,9 @@ def test_permute_returns_joint_different_seeds() -> None:
     assert not permuted1.equals(permuted2)
 
 
-def test_permute_returns_joint_same_seed() -> None:
+def test_permute_returns_joint_same_seed(rng: np.random.Generator) -> None:
     """Test that same seed produces same permutation."""
-    dates = pd.date_range("2020-01-01", periods=50, freq="D")
-    returns = pd.DataFrame(
-        {
-            "SPY": np.random.RandomState(44).randn(50),
-            "QQQ": np.random.RandomState(45).randn(50),
-        },
-        index=dates,
-    )
+    returns = pd.DataFrame(rng.standard_normal((50, 2)), index=_DATES_50, columns=["SPY", "QQQ"])
 
     permuted1 = permute_returns_joint(returns, seed=100)
     permuted2 = permute_returns_joint(returns, seed=100)
@@ -43,17 +41,10 @@ def test_permute_returns_joint_same_seed() -> None:
     assert permuted1.equals(permuted2)
 
 
-def test_permute_returns_joint_preserves_shape() -> None:
+def test_permute_returns_joint_preserves_shape(rng: np.random.Generator) -> None:
     """Test that permutation preserves DataFrame shape."""
     dates = pd.date_range("2020-01-01", periods=30, freq="D")
-    returns = pd.DataFrame(
-        {
-            "SPY": np.random.randn(30),
-            "QQQ": np.random.randn(30),
-            "TLT": np.random.randn(30),
-        },
-        index=dates,
-    )
+    returns = pd.DataFrame(rng.standard_normal((30, 3)), index=dates, columns=["SPY", "QQQ", "TLT"])
 
     permuted = permute_returns_joint(returns, seed=50)
 
@@ -61,21 +52,11 @@ def test_permute_returns_joint_preserves_shape() -> None:
     assert list(permuted.columns) == list(returns.columns)
 
 
-def test_run_permutation_test_different_runs() -> None:
+@pytest.mark.slow
+@pytest.mark.xdist_group("slow")
+def test_run_permutation_test_different_runs(ohlcv_factory: Callable[..., pd.DataFrame]) -> None:
     """Test permutation test with different number of runs."""
-    dates = pd.date_range("2020-01-01", periods=200, freq="D")  # More data
-    data = {
-        "SPY": pd.DataFrame(
-            {
-                "open": range(100, 300),
-                "high": range(101, 301),
-                "low": range(99, 299),
-                "close": range(100, 300),
-                "volume": [1000] * 200,
-            },
-            index=dates,
-        )
-    }
+    data = {"SPY": ohlcv_factory(200)}
 
     from src.core.config import load_config
 
@@ -93,26 +74,13 @@ def test_run_permutation_test_different_runs() -> None:
         # If insufficient data, that's acceptable - just verify it doesn't crash
     except (ValueError, KeyError) as e:
         # May fail if insufficient data, which is acceptable
-        import pytest
         pytest.skip(f"Insufficient data for permutation test: {e}")
 
 
-def test_run_permutation_test_insufficient_data_handling() -> None:
+def test_run_permutation_test_insufficient_data_handling(ohlcv_factory: Callable[..., pd.DataFrame]) -> None:
     """Test permutation test handles insufficient data gracefully."""
     # Very small dataset
-    dates = pd.date_range("2020-01-01", periods=10, freq="D")
-    data = {
-        "SPY": pd.DataFrame(
-            {
-                "open": range(100, 110),
-                "high": range(101, 111),
-                "low": range(99, 109),
-                "close": range(100, 110),
-                "volume": [1000] * 10,
-            },
-            index=dates,
-        )
-    }
+    data = {"SPY": ohlcv_factory(10)}
 
     from src.core.config import load_config
 
@@ -129,3 +97,68 @@ def test_run_permutation_test_insufficient_data_handling() -> None:
     except (ValueError, KeyError):
         # Expected for insufficient data
         pass
+
+
+def test_wilson_interval_bounds() -> None:
+    """Test Wilson interval brackets the observed proportion."""
+    lower, upper = wilson_interval(5, 100)
+    assert 0.0 <= lower < 0.05 < upper <= 1.0
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+def test_run_permutation_test_adaptive_stopping() -> None:
+    """Test permutation test stops early when the result is unambiguous."""
+    dates = _DATES_50
+    data = {"SPY": pd.DataFrame({"close": np.arange(100, 150)}, index=dates)}
+    returns = pd.DataFrame({"SPY": [0.01] * 50}, index=dates)
+
+    config = load_config()
+    config.permutation.adaptive_stopping = True
+
+    # Every permuted score beats the real one -> clearly not significant
+    with patch("src.strategy.permutation.grid_search", return_value={"params": {}, "score": 1.0}):
+        result = run_permutation_test(
+            data, returns, config, datetime(2020, 1, 1), datetime(2020, 3, 1), runs=200, seed=42
+        )
+
+    assert result["stopped_early"] is True
+    assert result["valid_runs"] < 200
+    assert result["p_value"] == 1.0
+
+
+def test_run_permutation_test_parallel_matches_serial() -> None:
+    """Test threaded and multi-process permutation runs give the same scores as serial runs."""
+    dates = _DATES_50
+    data = {"SPY": pd.DataFrame({"close": np.arange(100, 150)}, index=dates)}
+    returns = pd.DataFrame({"SPY": np.arange(50) / 1000.0}, index=dates)
+
+    def fake_grid_search(train_data, train_returns, *args, **kwargs) -> dict:
+        return {"params": {}, "score": float(train_returns["SPY"].iloc[0])}
+
+    config = load_config()
+    config.permutation.adaptive_stopping = False
+
+    results = []
+    # Worker processes are forked, so they inherit the patched grid_search
+    for n_jobs, backend in [(1, "thread"), (4, "thread"), (2, "process")]:
+        config.permutation.n_jobs = n_jobs
+        config.permutation.backend = backend
+        with patch("src.strategy.permutation.grid_search", side_effect=fake_grid_search):
+            results.append(
+                run_permutation_test(
+                    data, returns, config, datetime(2020, 1, 1), datetime(2020, 3, 1), runs=10, seed=42
+                )
+            )
+
+    for result in results[1:]:
+        assert result["permuted_scores"] == results[0]["permuted_scores"]
+        assert result["p_value"] == results[0]["p_value"]
+
+
+def test_permute_rows_kernel_matches_numpy_gather() -> None:
+    """Test the row-gather kernel equals NumPy fancy indexing."""
+    values = np.random.default_rng(0).normal(size=(40, 3))
+    indices = np.random.RandomState(1).permutation(40)
+    out = np.empty_like(values)
+    _permute_rows_kernel(values, indices, out)
+    np.testing.assert_array_equal(out, values[indices])
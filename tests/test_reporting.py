@@ -2,6 +2,7 @@
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
 from src.strategy.metrics import (
     calculate_all_metrics,
@@ -13,6 +14,7 @@ from src.strategy.metrics import (
     calculate_turnover_annualized,
 )
 from src.strategy.reporting import (
+    _downsample,
     generate_backtest_report,
     plot_drawdown,
     plot_equity_curve,
@@ -21,10 +23,14 @@ from src.strategy.reporting import (
     save_weights_csv,
 )
 
+# Shared across tests; DatetimeIndex is immutable
+_DATES_100 = pd.date_range("2020-01-01", periods=100, freq="D")
+_DATES_252 = pd.date_range("2020-01-01", periods=252, freq="D")
+
 
 def test_calculate_cagr() -> None:
     """Test CAGR calculation."""
-    dates = pd.date_range("2020-01-01", periods=252, freq="D")
+    dates = _DATES_252
     equity = pd.Series([1.0] + [1.001] * 251, index=dates).cumprod()
     cagr = calculate_cagr(equity, periods_per_year=252.0)
     assert cagr > 0
@@ -32,7 +38,7 @@ def test_calculate_cagr() -> None:
 
 def test_calculate_sharpe() -> None:
     """Test Sharpe ratio calculation."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
+    dates = _DATES_100
     returns = pd.Series(0.001, index=dates)
     sharpe = calculate_sharpe(returns, periods_per_year=252.0)
     assert isinstance(sharpe, float)
@@ -40,7 +46,7 @@ def test_calculate_sharpe() -> None:
 
 def test_calculate_max_drawdown() -> None:
     """Test max drawdown calculation."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
+    dates = _DATES_100
     equity = pd.Series([1.0, 1.1, 0.9, 1.2, 0.8, 1.0], index=dates[:6])
     max_dd = calculate_max_drawdown(equity)
     assert max_dd <= 0
@@ -56,7 +62,7 @@ def test_calculate_calmar() -> None:
 
 def test_calculate_profit_factor() -> None:
     """Test profit factor calculation."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
+    dates = _DATES_100
     returns = pd.Series([0.01, -0.005, 0.01, -0.005], index=dates[:4])
     pf = calculate_profit_factor(returns)
     assert pf > 0
@@ -64,7 +70,7 @@ def test_calculate_profit_factor() -> None:
 
 def test_calculate_turnover_annualized() -> None:
     """Test annualized turnover calculation."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
+    dates = _DATES_100
     turnover = pd.Series([0.1] * 100, index=dates)
     turnover_ann = calculate_turnover_annualized(turnover, periods_per_year=252.0)
     assert turnover_ann > 0
@@ -72,7 +78,7 @@ def test_calculate_turnover_annualized() -> None:
 
 def test_calculate_all_metrics() -> None:
     """Test all metrics calculation."""
-    dates = pd.date_range("2020-01-01", periods=252, freq="D")
+    dates = _DATES_252
     returns = pd.Series(0.001, index=dates)
     equity = (1 + returns).cumprod()
     turnover = pd.Series([0.1] * 252, index=dates)
@@ -96,20 +102,23 @@ def test_save_metrics_json(tmp_path: Path) -> None:
 
 def test_save_weights_csv(tmp_path: Path) -> None:
     """Test weights CSV export."""
-    from datetime import datetime
-
-    weights_history = [
-        {datetime(2024, 1, 1): {"SPY": 0.5, "QQQ": 0.45}},
-        {datetime(2024, 1, 2): {"SPY": 0.6, "QQQ": 0.35}},
-    ]
+    weights_history = pd.DataFrame(
+        {"SPY": [0.5, 0.6, 0.0], "QQQ": [0.45, 0.35, 0.0]},
+        index=pd.date_range("2024-01-01", periods=3, freq="D"),
+    )
     output_path = tmp_path / "weights.csv"
     save_weights_csv(weights_history, output_path)
     assert output_path.exists()
 
+    saved = pd.read_csv(output_path)
+    assert list(saved.columns) == ["date", "symbol", "weight"]
+    assert len(saved) == 4  # Zero weights are dropped
+
 
+@pytest.mark.plot
 def test_plot_equity_curve(tmp_path: Path) -> None:
     """Test equity curve plotting."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
+    dates = _DATES_100
     equity = pd.Series(range(100, 200), index=dates, dtype=float)
     output_path = tmp_path / "equity.png"
     plot_equity_curve(equity, output_path)
@@ -117,15 +126,17 @@ def test_plot_equity_curve(tmp_path: Path) -> None:
     assert True
 
 
+@pytest.mark.plot
 def test_plot_drawdown(tmp_path: Path) -> None:
     """Test drawdown plotting."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
+    dates = _DATES_100
     equity = pd.Series(range(100, 200), index=dates, dtype=float)
     output_path = tmp_path / "drawdown.png"
     plot_drawdown(equity, output_path)
     assert True
 
 
+@pytest.mark.plot
 def test_plot_monthly_returns_heatmap(tmp_path: Path) -> None:
     """Test monthly returns heatmap plotting."""
     dates = pd.date_range("2020-01-01", periods=365, freq="D")
@@ -135,9 +146,10 @@ def test_plot_monthly_returns_heatmap(tmp_path: Path) -> None:
     assert True
 
 
+@pytest.mark.plot
 def test_generate_backtest_report(tmp_path: Path) -> None:
     """Test complete backtest report generation."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
+    dates = _DATES_100
     returns = pd.Series(0.001, index=dates)
     equity = (1 + returns).cumprod()
     turnover = pd.Series([0.1] * 100, index=dates)
@@ -146,12 +158,49 @@ def test_generate_backtest_report(tmp_path: Path) -> None:
         "returns": returns,
         "equity": equity,
         "turnover": turnover,
-        "weights_history": [
-            {dates[0]: {"SPY": 0.5}},
-            {dates[1]: {"SPY": 0.6}},
-        ],
+        "weights_history": pd.DataFrame({"SPY": [0.5, 0.6]}, index=dates[:2]),
     }
 
     metrics = generate_backtest_report(backtest_results, tmp_path)
     assert len(metrics) > 0
     assert (tmp_path / "metrics.json").exists()
+
+
+def test_downsample_long_series() -> None:
+    """Test long series are downsampled for plotting, keeping the last point."""
+    dates = pd.date_range("2000-01-01", periods=5001, freq="D")
+    series = pd.Series(range(5001), index=dates, dtype=float)
+
+    downsampled = _downsample(series, max_points=2000)
+    assert len(downsampled) <= 2001
+    assert downsampled.index[-1] == series.index[-1]
+    assert _downsample(series.iloc[:100]).equals(series.iloc[:100])
+
+
+@pytest.mark.plot
+def test_generate_backtest_report_writes_plots(tmp_path: Path) -> None:
+    """Test report plots are written when drawn on a shared figure."""
+    dates = pd.date_range("2020-01-01", periods=400, freq="D")
+    returns = pd.Series(0.001, index=dates)
+    backtest_results = {
+        "returns": returns,
+        "equity": (1 + returns).cumprod(),
+        "turnover": pd.Series(0.0, index=dates),
+        "weights_history": pd.DataFrame({"SPY": 0.5}, index=dates),
+    }
+
+    generate_backtest_report(backtest_results, tmp_path)
+    for name in ["equity.png", "drawdown.png", "heatmap.png"]:
+        assert (tmp_path / name).read_bytes().startswith(b"\x89PNG")
+
+
+@pytest.mark.plot
+def test_plotting_leaves_global_rcparams_untouched(tmp_path: Path) -> None:
+    """Test the report's rcParams are scoped to the plot, not set process-wide."""
+    matplotlib = pytest.importorskip("matplotlib")
+    before = matplotlib.rcParams["path.simplify_threshold"]
+
+    equity = pd.Series(range(100, 200), index=_DATES_100, dtype=float)
+    plot_equity_curve(equity, tmp_path / "equity.png")
+
+    assert matplotlib.rcParams["path.simplify_threshold"] == before
@@ -1,171 +1,237 @@
 """Tests for retry logic."""
+import random
+import time
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from src.core import retry
 from src.core.retry import async_retry_with_backoff, retry_with_backoff
 
 
+class _Replay:
+    """Plain callable that returns or raises the given responses in order."""
+
+    def __init__(self, responses: list[Any]) -> None:
+        self._responses = iter(responses)
+        self.calls = 0
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls += 1
+        response = next(self._responses)
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+
+class _AsyncReplay(_Replay):
+    """Coroutine-function counterpart of _Replay."""
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return super().__call__(*args, **kwargs)
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record backoff delays instead of sleeping through them."""
+    delays: list[float] = []
+    monkeypatch.setattr(retry.time, "sleep", delays.append)
+    return delays
+
+
+@pytest.fixture
+def async_sleep(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Replace asyncio.sleep with an AsyncMock; a blocking time.sleep fails the test."""
+    fake_sleep = AsyncMock()
+    monkeypatch.setattr(retry.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(retry.time, "sleep", Mock(side_effect=AssertionError("time.sleep blocks the event loop")))
+    return fake_sleep
+
+
 def test_retry_success_first_attempt() -> None:
     """Test successful execution on first attempt."""
-    mock_func = Mock(return_value="success")
-    decorated = retry_with_backoff()(mock_func)
+    replay = _Replay(["success"])
+    decorated = retry_with_backoff()(replay)
 
     result = decorated()
 
     assert result == "success"
-    assert mock_func.call_count == 1
+    assert replay.calls == 1
 
 
-def test_retry_success_after_failures() -> None:
+def test_retry_success_after_failures(sleeps: list[float]) -> None:
     """Test successful execution after transient failures."""
-    mock_func = Mock(side_effect=[ConnectionError(), ConnectionError(), "success"])
-    decorated = retry_with_backoff(max_attempts=3, initial_delay=0.01)(mock_func)
+    replay = _Replay([ConnectionError(), ConnectionError(), "success"])
+    decorated = retry_with_backoff(max_attempts=3, initial_delay=0.01)(replay)
 
     result = decorated()
 
     assert result == "success"
-    assert mock_func.call_count == 3
+    assert replay.calls == 3
 
 
-def test_retry_exhausted() -> None:
+def test_retry_exhausted(sleeps: list[float]) -> None:
     """Test failure after all retries exhausted."""
-    mock_func = Mock(side_effect=ConnectionError("Connection failed"))
-    decorated = retry_with_backoff(max_attempts=3, initial_delay=0.01)(mock_func)
+    replay = _Replay([ConnectionError("Connection failed")] * 3)
+    decorated = retry_with_backoff(max_attempts=3, initial_delay=0.01)(replay)
 
     with pytest.raises(ConnectionError, match="Connection failed"):
         decorated()
 
-    assert mock_func.call_count == 3
+    assert replay.calls == 3
 
 
 def test_retry_unexpected_exception() -> None:
     """Test that unexpected exceptions are not retried."""
-    mock_func = Mock(side_effect=ValueError("Unexpected error"))
+    replay = _Replay([ValueError("Unexpected error")])
     decorated = retry_with_backoff(
         max_attempts=3,
         initial_delay=0.01,
         exceptions=(ConnectionError,)
-    )(mock_func)
+    )(replay)
 
     with pytest.raises(ValueError, match="Unexpected error"):
         decorated()
 
     # Should fail immediately, no retries
-    assert mock_func.call_count == 1
+    assert replay.calls == 1
 
 
-def test_retry_with_custom_exceptions() -> None:
+def test_retry_with_custom_exceptions(sleeps: list[float]) -> None:
     """Test retry with custom exception types."""
-    mock_func = Mock(side_effect=[TimeoutError(), ValueError("success")])
+    replay = _Replay([TimeoutError(), ValueError("success")])
     decorated = retry_with_backoff(
         max_attempts=2,
         initial_delay=0.01,
         exceptions=(TimeoutError,)
-    )(mock_func)
+    )(replay)
 
     # Should retry on TimeoutError, then raise ValueError
     with pytest.raises(ValueError, match="success"):
         decorated()
 
-    assert mock_func.call_count == 2
+    assert replay.calls == 2
 
 
-def test_retry_exponential_backoff() -> None:
+def test_retry_exponential_backoff(sleeps: list[float]) -> None:
     """Test that backoff increases exponentially."""
-    import time
-
-    call_times = []
-
-    def slow_func() -> str:
-        call_times.append(time.time())
-        if len(call_times) < 3:
-            raise ConnectionError()
-        return "success"
-
+    replay = _Replay([ConnectionError(), ConnectionError(), "success"])
     decorated = retry_with_backoff(
         max_attempts=3,
         initial_delay=0.1,
         exponential_base=2.0
-    )(slow_func)
+    )(replay)
 
     result = decorated()
 
     assert result == "success"
-    assert len(call_times) == 3
+    assert replay.calls == 3
+    assert sleeps == [pytest.approx(0.1), pytest.approx(0.2)]
+
 
-    # Check delays are increasing (with some tolerance)
-    delay1 = call_times[1] - call_times[0]
-    delay2 = call_times[2] - call_times[1]
+@pytest.mark.slow
+def test_retry_real_sleep_backoff() -> None:
+    """Test end to end that the backoff really waits (real clock, ~0.3s)."""
+    call_times: list[float] = []
+
+    def flaky() -> str:
+        call_times.append(time.monotonic())
+        if len(call_times) < 3:
+            raise ConnectionError()
+        return "success"
 
-    assert delay1 >= 0.08  # ~0.1s (initial_delay)
-    assert delay2 >= 0.18  # ~0.2s (initial_delay * exponential_base)
-    assert delay2 > delay1  # Should be increasing
+    decorated = retry_with_backoff(max_attempts=3, initial_delay=0.1, exponential_base=2.0)(flaky)
+
+    assert decorated() == "success"
+    assert call_times[1] - call_times[0] >= 0.09
+    assert call_times[2] - call_times[1] >= 0.19
+
+
+@pytest.mark.slow
+def test_retry_overhead_budget() -> None:
+    """Test the no-failure path adds only microseconds per call (wraps hot IBKR calls)."""
+    calls = 100_000
+    decorated = retry_with_backoff()(lambda: None)
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        decorated()
+    per_call = (time.perf_counter() - start) / calls
+
+    # Generous ceiling (~0.5us locally) so only real regressions trip it
+    assert per_call < 5e-6
+
+
+def test_retry_full_jitter(sleeps: list[float]) -> None:
+    """Test jittered backoff draws each delay uniformly from [0, backoff delay]."""
+    replay = _Replay([ConnectionError()] * 4 + ["success"])
+    decorated = retry_with_backoff(
+        max_attempts=5,
+        initial_delay=0.1,
+        jitter=True,
+        rng=random.Random(0),
+    )(replay)
+
+    assert decorated() == "success"
+
+    expected_rng = random.Random(0)
+    assert sleeps == [expected_rng.uniform(0, cap) for cap in (0.1, 0.2, 0.4, 0.8)]
+    assert all(0 <= delay <= cap for delay, cap in zip(sleeps, (0.1, 0.2, 0.4, 0.8)))
 
 
 @pytest.mark.asyncio
 async def test_async_retry_success_first_attempt() -> None:
     """Test async successful execution on first attempt."""
-    async def async_func() -> str:
-        return "success"
-
-    decorated = async_retry_with_backoff()(async_func)
+    replay = _AsyncReplay(["success"])
+    decorated = async_retry_with_backoff()(replay)
     result = await decorated()
 
     assert result == "success"
+    assert replay.calls == 1
 
 
 @pytest.mark.asyncio
-async def test_async_retry_success_after_failures() -> None:
+async def test_async_retry_success_after_failures(async_sleep: AsyncMock) -> None:
     """Test async successful execution after transient failures."""
-    counter = {"calls": 0}
-
-    async def async_func() -> str:
-        counter["calls"] += 1
-        if counter["calls"] < 3:
-            raise ConnectionError()
-        return "success"
-
-    decorated = async_retry_with_backoff(max_attempts=3, initial_delay=0.01)(async_func)
+    replay = _AsyncReplay([ConnectionError(), ConnectionError(), "success"])
+    decorated = async_retry_with_backoff(max_attempts=3, initial_delay=0.01)(replay)
     result = await decorated()
 
     assert result == "success"
-    assert counter["calls"] == 3
+    assert replay.calls == 3
+    assert async_sleep.await_count == 2
 
 
 @pytest.mark.asyncio
-async def test_async_retry_exhausted() -> None:
+async def test_async_retry_exhausted(async_sleep: AsyncMock) -> None:
     """Test async failure after all retries exhausted."""
-    async def async_func() -> str:
-        raise ConnectionError("Connection failed")
-
-    decorated = async_retry_with_backoff(max_attempts=3, initial_delay=0.01)(async_func)
+    replay = _AsyncReplay([ConnectionError("Connection failed")] * 3)
+    decorated = async_retry_with_backoff(max_attempts=3, initial_delay=0.1)(replay)
 
     with pytest.raises(ConnectionError, match="Connection failed"):
         await decorated()
 
+    # Awaited between attempts only, with the exponential schedule
+    assert [c.args[0] for c in async_sleep.await_args_list] == [pytest.approx(0.1), pytest.approx(0.2)]
+
 
 @pytest.mark.asyncio
-async def test_async_retry_unexpected_exception() -> None:
+async def test_async_retry_unexpected_exception(async_sleep: AsyncMock) -> None:
     """Test async that unexpected exceptions are not retried."""
-    counter = {"calls": 0}
-
-    async def async_func() -> str:
-        counter["calls"] += 1
-        raise ValueError("Unexpected error")
-
+    replay = _AsyncReplay([ValueError("Unexpected error")])
     decorated = async_retry_with_backoff(
         max_attempts=3,
         initial_delay=0.01,
         exceptions=(ConnectionError,)
-    )(async_func)
+    )(replay)
 
     with pytest.raises(ValueError, match="Unexpected error"):
         await decorated()
 
     # Should fail immediately, no retries
-    assert counter["calls"] == 1
+    assert replay.calls == 1
+    async_sleep.assert_not_awaited()
 
 
 def test_retry_with_args_and_kwargs() -> None:
@@ -191,31 +257,41 @@ async def test_async_retry_with_args_and_kwargs() -> None:
     assert result == (("arg1", "arg2"), {"kwarg1": "val1", "kwarg2": "val2"})
 
 
-def test_retry_max_delay_cap() -> None:
+def test_retry_max_delay_cap(sleeps: list[float]) -> None:
     """Test that delay is capped at max_delay."""
-    import time
-
-    call_times = []
-
-    def slow_func() -> str:
-        call_times.append(time.time())
-        if len(call_times) < 4:
-            raise ConnectionError()
-        return "success"
-
+    replay = _Replay([ConnectionError(), ConnectionError(), ConnectionError(), "success"])
     decorated = retry_with_backoff(
         max_attempts=4,
         initial_delay=0.1,
         max_delay=0.2,  # Cap at 0.2s
         exponential_base=2.0
-    )(slow_func)
+    )(replay)
 
     result = decorated()
 
     assert result == "success"
-    assert len(call_times) == 4
+    assert replay.calls == 4
+
+    # Last delay is capped at max_delay (0.2s), not 0.4s
+    assert sleeps == [pytest.approx(0.1), pytest.approx(0.2), pytest.approx(0.2)]
 
-    # Last delay should be capped at max_delay (0.2s)
-    delay3 = call_times[3] - call_times[2]
-    assert delay3 < 0.25  # Should be ~0.2s, not 0.4s
 
+@pytest.mark.asyncio
+async def test_async_retry_full_jitter(async_sleep: AsyncMock) -> None:
+    """Test async jittered backoff awaits the seeded jittered delays."""
+    replay = _AsyncReplay([ConnectionError()] * 3)
+    decorated = async_retry_with_backoff(
+        max_attempts=3,
+        initial_delay=0.1,
+        jitter=True,
+        rng=random.Random(1),
+    )(replay)
+
+    with pytest.raises(ConnectionError):
+        await decorated()
+
+    expected_rng = random.Random(1)
+    assert [c.args[0] for c in async_sleep.await_args_list] == [
+        expected_rng.uniform(0, 0.1),
+        expected_rng.uniform(0, 0.2),
+    ]
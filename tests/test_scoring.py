@@ -1,4 +1,6 @@
 """Test scoring function."""
+from collections.abc import Callable
+
 import pandas as pd
 import pytest
 
@@ -19,19 +21,9 @@ def test_score_basic() -> None:
     assert scores.iloc[-1] > 0
 
 
-def test_score_with_dataframe() -> None:
+def test_score_with_dataframe(ohlcv_factory: Callable[..., pd.DataFrame]) -> None:
     """Test score calculation from DataFrame."""
-    dates = pd.date_range("2024-01-01", periods=25, freq="D")
-    df = pd.DataFrame(
-        {
-            "open": range(100, 125),
-            "high": range(101, 126),
-            "low": range(99, 124),
-            "close": range(100, 125),
-            "volume": range(1000, 1025),
-        },
-        index=dates,
-    )
+    df = ohlcv_factory(25, start="2024-01-01")
 
     scores = calculate_scores_for_dataframe(df, ema_fast_window=20, atr_window=20)
     assert len(scores) == 25
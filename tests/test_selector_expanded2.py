@@ -1,46 +1,24 @@
 """Additional tests for selector module."""
+import copy
+from collections.abc import Callable
+
+import numpy as np
 import pandas as pd
 
-from src.core.config import load_config
+from src.core.config import AppConfig
 from src.strategy.selector import select_assets
 
-
-def test_select_assets_empty_data() -> None:
-    """Test selector with empty data dictionary."""
-    config = load_config()
-    returns = pd.DataFrame()
-
-    selected = select_assets({}, returns, config)
-    assert selected == []
-
-
-def test_select_assets_empty_dataframe() -> None:
-    """Test selector with empty DataFrame for a symbol."""
-    config = load_config()
-    data = {"SPY": pd.DataFrame()}
-    returns = pd.DataFrame()
-
-    selected = select_assets(data, returns, config)
-    assert selected == []
+# Shared across tests; DatetimeIndex is immutable
+_DATES_100 = pd.date_range("2020-01-01", periods=100, freq="D")
+_OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
 
 
-def test_select_assets_date_filtering() -> None:
+def test_select_assets_date_filtering(base_config: AppConfig, ohlcv_100: pd.DataFrame) -> None:
     """Test selector with date filtering."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
-    data = {
-        "SPY": pd.DataFrame(
-            {
-                "open": range(100, 200),
-                "high": range(101, 201),
-                "low": range(99, 199),
-                "close": range(100, 200),
-                "volume": [1000] * 100,
-            },
-            index=dates,
-        )
-    }
+    dates = _DATES_100
+    data = {"SPY": ohlcv_100}
     returns = pd.DataFrame({"SPY": pd.Series(0.001, index=dates)})
-    config = load_config()
+    config = copy.deepcopy(base_config)
     config.selection.top_n = 1
 
     target_date = pd.Timestamp("2020-02-01")
@@ -49,95 +27,112 @@ def test_select_assets_date_filtering() -> None:
     assert isinstance(selected, list)
 
 
-def test_select_assets_date_before_data() -> None:
+def test_select_assets_date_before_data(base_config: AppConfig, ohlcv_100: pd.DataFrame) -> None:
     """Test selector with date before any data."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
-    data = {
-        "SPY": pd.DataFrame(
-            {
-                "open": range(100, 200),
-                "high": range(101, 201),
-                "low": range(99, 199),
-                "close": range(100, 200),
-                "volume": [1000] * 100,
-            },
-            index=dates,
-        )
-    }
+    dates = _DATES_100
+    data = {"SPY": ohlcv_100}
     returns = pd.DataFrame({"SPY": pd.Series(0.001, index=dates)})
-    config = load_config()
 
     target_date = pd.Timestamp("2019-01-01")  # Before data
-    selected = select_assets(data, returns, config, date=target_date)
+    selected = select_assets(data, returns, base_config, date=target_date)
     assert isinstance(selected, list)
 
 
-def test_select_assets_empty_scores() -> None:
-    """Test selector when scores are empty."""
-    dates = pd.date_range("2020-01-01", periods=10, freq="D")
-    data = {
-        "SPY": pd.DataFrame(
-            {
-                "open": [100] * 10,
-                "high": [101] * 10,
-                "low": [99] * 10,
-                "close": [100] * 10,  # Flat price
-                "volume": [1000] * 10,
-            },
+def _random_universe(rng: np.random.Generator) -> tuple[dict[str, pd.DataFrame], pd.DataFrame]:
+    """Random-walk OHLCV frames for 1-4 symbols over 20-120 days, plus their returns."""
+    n_days = int(rng.integers(20, 121))
+    symbols = ["SPY", "QQQ", "TLT", "GLD"][: int(rng.integers(1, 5))]
+    dates = pd.date_range("2020-01-01", periods=n_days, freq="D")
+
+    data = {}
+    for symbol in symbols:
+        close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, n_days)))
+        spread = rng.uniform(0.0, 0.02, n_days)
+        data[symbol] = pd.DataFrame(
+            np.column_stack([close, close * (1 + spread), close * (1 - spread), close, np.full(n_days, 1000.0)]),
+            columns=_OHLCV_COLUMNS,
             index=dates,
         )
-    }
-    returns = pd.DataFrame({"SPY": pd.Series(0.0, index=dates)})
-    config = load_config()
+    returns = pd.DataFrame({symbol: df["close"].pct_change().fillna(0.0) for symbol, df in data.items()})
+    return data, returns
 
-    selected = select_assets(data, returns, config)
-    # May return empty if no valid scores
-    assert isinstance(selected, list)
 
+def test_select_assets_invariants(base_config: AppConfig, rng: np.random.Generator) -> None:
+    """Test selection invariants over many random universes in one test."""
+    config = copy.deepcopy(base_config)
+    strict_config = copy.deepcopy(base_config)
+    strict_config.selection.min_score = float("inf")
 
-def test_select_assets_score_below_min() -> None:
-    """Test selector when scores are below minimum."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
-    data = {
-        "SPY": pd.DataFrame(
-            {
-                "open": range(100, 200),
-                "high": range(101, 201),
-                "low": range(99, 199),
-                "close": range(100, 200),
-                "volume": [1000] * 100,
-            },
-            index=dates,
-        )
-    }
-    returns = pd.DataFrame({"SPY": pd.Series(0.001, index=dates)})
-    config = load_config()
-    config.selection.min_score = 100.0  # Very high minimum
+    for _ in range(50):
+        data, returns = _random_universe(rng)
+        selected = select_assets(data, returns, config)
+
+        # A unique subset of the universe, at most top_n long
+        assert set(selected) <= set(data)
+        assert len(set(selected)) == len(selected) <= config.selection.top_n
+
+        # Scores and gates are scale-free: scaling prices by a power of two is
+        # exact in floating point, so the selection must not change
+        scaled = {symbol: df * 4.0 for symbol, df in data.items()}
+        assert select_assets(scaled, returns, config) == selected
+
+        # Open prices are not an input, so missing opens change nothing
+        gappy = {symbol: df.assign(open=np.nan) for symbol, df in data.items()}
+        assert select_assets(gappy, returns, config) == selected
+
+        # Nothing clears an infinite min_score
+        assert select_assets(data, returns, strict_config) == []
+
+
+def test_select_assets_selects_passing_symbol(
+    base_config: AppConfig, ohlcv_100: pd.DataFrame
+) -> None:
+    """Test a symbol passing the score and trend gates is selected with the default config.
+
+    Regression: the original selector looked up long_ok under the key
+    calculate_signals uses for single-symbol frames ("UNKNOWN"), so no asset
+    was ever selected.
+    """
+    returns = pd.DataFrame({"SPY": ohlcv_100["close"].pct_change().fillna(0.0)})
+    config = copy.deepcopy(base_config)
+    config.selection.top_n = 1
+
+    assert select_assets({"SPY": ohlcv_100}, returns, config) == ["SPY"]
+
+
+def test_select_assets_uptrend_selected_downtrend_skipped(
+    base_config: AppConfig, ohlcv_100: pd.DataFrame, ohlcv_factory: Callable[..., pd.DataFrame]
+) -> None:
+    """Test uptrending symbols pass the trend gate and downtrending ones do not."""
+    data = {"SPY": ohlcv_100, "TLT": ohlcv_factory(100, base=200, step=-1)}
+    returns = pd.DataFrame({symbol: df["close"].pct_change().fillna(0.0) for symbol, df in data.items()})
+    config = copy.deepcopy(base_config)
+    config.selection.top_n = 2
+    config.features.macd.enabled = False
 
     selected = select_assets(data, returns, config)
-    # Should filter out low scores
-    assert isinstance(selected, list)
+    assert selected == ["SPY"]
 
 
-def test_select_assets_exception_handling() -> None:
-    """Test selector handles exceptions gracefully."""
-    # Create data that might cause exceptions
-    dates = pd.date_range("2020-01-01", periods=5, freq="D")
+def test_select_assets_macd_gate(base_config: AppConfig) -> None:
+    """Test the batched MACD gate filters symbols whose MACD line is negative."""
+    dates = _DATES_100
+    # Long uptrend followed by a sharp recent drop: EMA20 > EMA50 but MACD < 0
+    close = np.concatenate([np.arange(100.0, 188.0), np.arange(186.0, 162.0, -2.0)])
     data = {
         "SPY": pd.DataFrame(
-            {
-                "open": [100, 101, None, 103, 104],  # Invalid data
-                "high": [101, 102, 102, 104, 105],
-                "low": [99, 100, 100, 102, 103],
-                "close": [100, 101, 101, 103, 104],
-                "volume": [1000] * 5,
-            },
+            np.column_stack([close, close, close, close, np.full_like(close, 1000)]),
+            columns=_OHLCV_COLUMNS,
             index=dates,
         )
     }
-    returns = pd.DataFrame({"SPY": pd.Series(0.001, index=dates)})
-    config = load_config()
+    returns = pd.DataFrame({"SPY": data["SPY"]["close"].pct_change().fillna(0.0)})
+    config = copy.deepcopy(base_config)
+    config.selection.top_n = 1
+    config.selection.min_score = -1000.0
 
-    # Should handle exceptions without crashing
-    selected = select_assets(data, returns, config)
-    assert isinstance(selected, list)
+    config.features.macd.enabled = False
+    assert select_assets(data, returns, config) == ["SPY"]
+
+    config.features.macd.enabled = True
+    assert select_assets(data, returns, config) == []
@@ -1,10 +1,24 @@
 """Expanded tests for signals module."""
+import numpy as np
 import pandas as pd
+import pytest
 
-from src.core.config import load_config
+from src.core.config import AppConfig
 from src.strategy.signals import calculate_signals, check_exit, check_long_ok
 
 
+@pytest.fixture
+def rising() -> pd.Series:
+    """Three-bar rising series [100, 101, 102]."""
+    return pd.Series(np.array([100.0, 101.0, 102.0]))
+
+
+@pytest.fixture
+def rising_lagged() -> pd.Series:
+    """The rising series one point lower, [99, 100, 101]."""
+    return pd.Series(np.array([99.0, 100.0, 101.0]))
+
+
 def test_check_long_ok_empty_series() -> None:
     """Test check_long_ok with empty series."""
     close = pd.Series([], dtype=float)
@@ -15,55 +29,39 @@ def test_check_long_ok_empty_series() -> None:
     assert result is False
 
 
-def test_check_long_ok_trend_down() -> None:
+def test_check_long_ok_trend_down(rising: pd.Series, rising_lagged: pd.Series) -> None:
     """Test check_long_ok when trend is down."""
-    close = pd.Series([100, 101, 102])
-    ema_fast = pd.Series([99, 100, 101])  # Fast < Slow
-    ema_slow = pd.Series([100, 101, 102])
-
-    result = check_long_ok(close, ema_fast, ema_slow)
+    result = check_long_ok(rising, rising_lagged, rising)  # Fast < Slow
     assert result is False
 
 
-def test_check_long_ok_with_macd_enabled_positive() -> None:
+def test_check_long_ok_with_macd_enabled_positive(rising: pd.Series, rising_lagged: pd.Series) -> None:
     """Test check_long_ok with MACD enabled and positive."""
-    close = pd.Series([100, 101, 102])
-    ema_fast = pd.Series([100, 101, 102])
-    ema_slow = pd.Series([99, 100, 101])
-    macd_line = pd.Series([0.1, 0.2, 0.3])
+    macd_line = pd.Series(np.array([0.1, 0.2, 0.3]))
 
-    result = check_long_ok(close, ema_fast, ema_slow, macd_line, macd_enabled=True)
+    result = check_long_ok(rising, rising, rising_lagged, macd_line, macd_enabled=True)
     assert result is True
 
 
-def test_check_long_ok_with_macd_enabled_negative() -> None:
+def test_check_long_ok_with_macd_enabled_negative(rising: pd.Series, rising_lagged: pd.Series) -> None:
     """Test check_long_ok with MACD enabled and negative."""
-    close = pd.Series([100, 101, 102])
-    ema_fast = pd.Series([100, 101, 102])
-    ema_slow = pd.Series([99, 100, 101])
-    macd_line = pd.Series([-0.1, -0.2, -0.3])
+    macd_line = pd.Series(np.array([-0.1, -0.2, -0.3]))
 
-    result = check_long_ok(close, ema_fast, ema_slow, macd_line, macd_enabled=True)
+    result = check_long_ok(rising, rising, rising_lagged, macd_line, macd_enabled=True)
     assert result is False
 
 
-def test_check_long_ok_with_macd_empty() -> None:
+def test_check_long_ok_with_macd_empty(rising: pd.Series, rising_lagged: pd.Series) -> None:
     """Test check_long_ok with MACD enabled but empty series."""
-    close = pd.Series([100, 101, 102])
-    ema_fast = pd.Series([100, 101, 102])
-    ema_slow = pd.Series([99, 100, 101])
     macd_line = pd.Series([], dtype=float)
 
-    result = check_long_ok(close, ema_fast, ema_slow, macd_line, macd_enabled=True)
+    result = check_long_ok(rising, rising, rising_lagged, macd_line, macd_enabled=True)
     assert result is False
 
 
-def test_check_exit_no_position() -> None:
+def test_check_exit_no_position(rising: pd.Series, rising_lagged: pd.Series) -> None:
     """Test check_exit when no position."""
-    close = pd.Series([100, 101, 102])
-    ema_fast = pd.Series([99, 100, 101])
-
-    result = check_exit(close, ema_fast, current_position=False)
+    result = check_exit(rising, rising_lagged, current_position=False)
     assert result is False
 
 
@@ -85,78 +83,50 @@ def test_check_exit_close_below_ema() -> None:
     assert result is True
 
 
-def test_check_exit_close_above_ema() -> None:
+def test_check_exit_close_above_ema(rising: pd.Series, rising_lagged: pd.Series) -> None:
     """Test check_exit when close is above EMA."""
-    close = pd.Series([100, 101, 102])  # Above EMA
-    ema_fast = pd.Series([99, 100, 101])
-
-    result = check_exit(close, ema_fast, current_position=True)
+    result = check_exit(rising, rising_lagged, current_position=True)  # Above EMA
     assert result is False
 
 
-def test_calculate_signals_empty_dataframe() -> None:
+def test_calculate_signals_empty_dataframe(base_config: AppConfig) -> None:
     """Test calculate_signals with empty DataFrame."""
     df = pd.DataFrame()
-    config = load_config()
 
-    signals = calculate_signals(df, config)
+    signals = calculate_signals(df, base_config)
     assert signals == {}
 
 
-def test_calculate_signals_single_symbol() -> None:
+def test_calculate_signals_single_symbol(base_config: AppConfig, ohlcv_100: pd.DataFrame) -> None:
     """Test calculate_signals with single symbol DataFrame."""
-    dates = pd.date_range("2020-01-01", periods=100, freq="D")
-    df = pd.DataFrame(
-        {
-            "open": range(100, 200),
-            "high": range(101, 201),
-            "low": range(99, 199),
-            "close": range(100, 200),
-            "volume": [1000] * 100,
-        },
-        index=dates,
-    )
-    config = load_config()
-
-    signals = calculate_signals(df, config)
+    signals = calculate_signals(ohlcv_100, base_config)
     # Should handle single symbol case
     assert isinstance(signals, dict)
 
 
-def test_calculate_signals_missing_columns() -> None:
+def test_calculate_signals_missing_columns(base_config: AppConfig) -> None:
     """Test calculate_signals with missing required columns."""
-    dates = pd.date_range("2020-01-01", periods=10, freq="D")
-    df = pd.DataFrame(
-        {
-            "open": range(100, 110),
-            "close": range(100, 110),
-            # Missing high, low, volume
-        },
-        index=dates,
-    )
-    config = load_config()
+    dates = pd.RangeIndex(10)  # Date semantics are not used
+    base = np.arange(100, 110, dtype=np.float64)
+    # Missing high, low, volume
+    df = pd.DataFrame(np.column_stack([base, base]), columns=["open", "close"], index=dates)
 
-    signals = calculate_signals(df, config)
+    signals = calculate_signals(df, base_config)
     # Should handle missing columns gracefully
     assert isinstance(signals, dict)
 
 
-def test_calculate_signals_multiindex() -> None:
+def test_calculate_signals_multiindex(base_config: AppConfig) -> None:
     """Test calculate_signals with MultiIndex DataFrame."""
-    dates = pd.date_range("2020-01-01", periods=50, freq="D")
+    dates = pd.RangeIndex(50)  # Date semantics are not used
     index = pd.MultiIndex.from_product([["SPY", "QQQ"], dates], names=["symbol", "date"])
+    base = np.arange(100, 200, dtype=np.float64)
     df = pd.DataFrame(
-        {
-            "open": range(100, 200),
-            "high": range(101, 201),
-            "low": range(99, 199),
-            "close": range(100, 200),
-            "volume": [1000] * 100,
-        },
+        np.column_stack([base, base + 1, base - 1, base, np.full_like(base, 1000)]),
+        columns=["open", "high", "low", "close", "volume"],
         index=index,
     )
-    config = load_config()
 
-    signals = calculate_signals(df, config)
+    signals = calculate_signals(df, base_config)
     assert isinstance(signals, dict)
     assert len(signals) >= 0  # May have signals or not depending on data
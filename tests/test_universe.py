@@ -1,22 +1,27 @@
 """Test universe management."""
-from src.core.config import load_config
+import copy
+
+import pytest
+
+from src.core.config import AppConfig
 from src.data.universe import UniverseManager
 
 
-def test_universe_manager_default() -> None:
+@pytest.fixture(scope="module")
+def manager(base_config: AppConfig) -> UniverseManager:
+    """Universe manager shared by the read-only tests in this module."""
+    return UniverseManager(base_config)
+
+
+def test_universe_manager_default(manager: UniverseManager) -> None:
     """Test universe manager with default config."""
-    config = load_config()
-    manager = UniverseManager(config)
     universe = manager.get_universe()
     assert len(universe) > 0
     assert "SPY" in universe
 
 
-def test_universe_validation() -> None:
+def test_universe_validation(manager: UniverseManager) -> None:
     """Test symbol validation."""
-    config = load_config()
-    manager = UniverseManager(config)
-
     # Valid symbols
     assert manager.validate_symbol("SPY") is True
     assert manager.validate_symbol("QQQ") is True
@@ -27,10 +32,10 @@ def test_universe_validation() -> None:
     assert manager.validate_symbol("A" * 20) is False  # Too long
 
 
-def test_universe_add_remove() -> None:
+def test_universe_add_remove(manager: UniverseManager) -> None:
     """Test adding and removing symbols."""
-    config = load_config()
-    manager = UniverseManager(config)
+    # add/remove edit the universe list (shared with the config) in place
+    manager = copy.deepcopy(manager)
 
     initial_count = len(manager.get_universe())
 
@@ -48,11 +53,8 @@ def test_universe_add_remove() -> None:
     assert "TEST" not in manager.get_universe()
 
 
-def test_universe_validate_all() -> None:
+def test_universe_validate_all(manager: UniverseManager) -> None:
     """Test validating entire universe."""
-    config = load_config()
-    manager = UniverseManager(config)
-
     is_valid, invalid = manager.validate_universe()
     assert is_valid is True
     assert len(invalid) == 0
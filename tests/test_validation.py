@@ -1,4 +1,5 @@
 """Tests for data validation."""
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -9,24 +10,51 @@ from src.data.validation import (
     validate_bars_safe,
 )
 
+# Column positions in valid_bars, for positional .iat/.iloc edits
+_OPEN, _HIGH, _LOW, _CLOSE, _VOLUME = range(5)
 
-def create_valid_bars(num_bars: int = 10) -> pd.DataFrame:
-    """Create valid OHLCV data for testing."""
-    dates = pd.date_range(end=pd.Timestamp.now(), periods=num_bars, freq="1D")
-    df = pd.DataFrame({
-        "open": [100.0 + i for i in range(num_bars)],
-        "high": [102.0 + i for i in range(num_bars)],
-        "low": [99.0 + i for i in range(num_bars)],
-        "close": [101.0 + i for i in range(num_bars)],
-        "volume": [1000000 + i * 1000 for i in range(num_bars)],
+# Frozen reference time for the staleness tests
+_NOW = pd.Timestamp("2024-06-01")
+
+# Far-future end for valid_bars, so staleness checks against the real clock always pass
+_FROZEN_END = pd.Timestamp("2099-01-01")
+
+
+def _flat_bars(end: pd.Timestamp, num_bars: int = 5) -> pd.DataFrame:
+    """Create flat, otherwise valid daily OHLCV bars ending at ``end``."""
+    dates = pd.date_range(end=end, periods=num_bars, freq="1D")
+    return pd.DataFrame({
+        "open": np.full(num_bars, 100.0),
+        "high": np.full(num_bars, 102.0),
+        "low": np.full(num_bars, 99.0),
+        "close": np.full(num_bars, 101.0),
+        "volume": np.full(num_bars, 1000000),
+    }, index=dates)
+
+
+# Read-only bars ending 10 and 5 days before _NOW
+_STALE_10D = _flat_bars(_NOW - pd.Timedelta(days=10))
+_STALE_5D = _flat_bars(_NOW - pd.Timedelta(days=5))
+
+
+@pytest.fixture(scope="module")
+def valid_bars() -> pd.DataFrame:
+    """Ten valid daily OHLCV bars; tests that mutate must ``.copy()``."""
+    num_bars = 10
+    step = np.arange(num_bars)
+    dates = pd.date_range(end=_FROZEN_END, periods=num_bars, freq="1D")
+    return pd.DataFrame({
+        "open": 100.0 + step,
+        "high": 102.0 + step,
+        "low": 99.0 + step,
+        "close": 101.0 + step,
+        "volume": 1000000 + step * 1000,
     }, index=dates)
-    return df
 
 
-def test_validate_bars_valid_data() -> None:
+def test_validate_bars_valid_data(valid_bars: pd.DataFrame) -> None:
     """Test validation passes for valid data."""
-    df = create_valid_bars()
-    assert validate_bars(df, "TEST") is True
+    assert validate_bars(valid_bars, "TEST") is True
 
 
 def test_validate_bars_empty_dataframe() -> None:
@@ -47,113 +75,69 @@ def test_validate_bars_missing_columns() -> None:
         validate_bars(df, "TEST")
 
 
-def test_validate_bars_nan_values() -> None:
-    """Test validation fails for NaN values."""
-    df = create_valid_bars()
-    df.loc[df.index[0], "close"] = float("nan")
-    with pytest.raises(DataValidationError, match="NaN values found"):
-        validate_bars(df, "TEST")
-
-
-def test_validate_bars_invalid_high_low() -> None:
-    """Test validation fails when high < close."""
-    df = create_valid_bars()
-    df.loc[df.index[0], "high"] = 50.0  # Less than close
-    with pytest.raises(DataValidationError, match="high < close"):
-        validate_bars(df, "TEST")
-
-
-def test_validate_bars_invalid_low_close() -> None:
-    """Test validation fails when low > close."""
-    df = create_valid_bars()
-    df.loc[df.index[0], "low"] = 200.0  # Greater than close
-    with pytest.raises(DataValidationError, match="low > close"):
-        validate_bars(df, "TEST")
-
-
-def test_validate_bars_invalid_high_open() -> None:
-    """Test validation fails when high < open."""
-    df = create_valid_bars()
-    # Make high < open, but keep relationships valid otherwise
-    df.loc[df.index[0], "open"] = 105.0
-    df.loc[df.index[0], "high"] = 102.0  # Less than open
-    df.loc[df.index[0], "close"] = 101.0
-    df.loc[df.index[0], "low"] = 99.0
-    with pytest.raises(DataValidationError, match="high < open"):
-        validate_bars(df, "TEST")
-
-
-def test_validate_bars_invalid_low_open() -> None:
-    """Test validation fails when low > open."""
-    df = create_valid_bars()
-    # Make low > open, but keep relationships valid otherwise
-    df.loc[df.index[0], "open"] = 99.5
-    df.loc[df.index[0], "high"] = 102.0
-    df.loc[df.index[0], "close"] = 101.0
-    df.loc[df.index[0], "low"] = 100.0  # Greater than open
-    with pytest.raises(DataValidationError, match="low > open"):
-        validate_bars(df, "TEST")
-
-
-def test_validate_bars_zero_volume() -> None:
-    """Test validation fails for zero volume (except first bar)."""
-    df = create_valid_bars()
-    df.loc[df.index[1], "volume"] = 0  # Zero volume on second bar
-    with pytest.raises(DataValidationError, match="Zero/negative volume"):
+@pytest.mark.parametrize(
+    "row, cols, values, pattern",
+    [
+        (0, [_CLOSE], [float("nan")], "NaN values found"),
+        (0, [_HIGH], [50.0], "high < close"),
+        (0, [_LOW], [200.0], "low > close"),
+        # Break one open relationship, keep the others valid
+        (0, [_OPEN, _HIGH, _CLOSE, _LOW], [105.0, 102.0, 101.0, 99.0], "high < open"),
+        (0, [_OPEN, _HIGH, _CLOSE, _LOW], [99.5, 102.0, 101.0, 100.0], "low > open"),
+        # Second bar: the first bar may have zero volume
+        (1, [_VOLUME], [0], "Zero/negative volume"),
+        (1, [_VOLUME], [-1000], "Zero/negative volume"),
+    ],
+    ids=[
+        "nan_values",
+        "high_below_close",
+        "low_above_close",
+        "high_below_open",
+        "low_above_open",
+        "zero_volume",
+        "negative_volume",
+    ],
+)
+def test_validate_bars_invalid(
+    valid_bars: pd.DataFrame, row: int, cols: list[int], values: list[float], pattern: str
+) -> None:
+    """Test validation fails when one bar breaks a data quality rule."""
+    df = valid_bars.copy()
+    df.iloc[row, cols] = values
+    with pytest.raises(DataValidationError, match=pattern):
         validate_bars(df, "TEST")
 
 
-def test_validate_bars_zero_volume_first_bar_ok() -> None:
+def test_validate_bars_zero_volume_first_bar_ok(valid_bars: pd.DataFrame) -> None:
     """Test validation allows zero volume on first bar."""
-    df = create_valid_bars()
-    df.loc[df.index[0], "volume"] = 0
+    df = valid_bars.copy()
+    df.iat[0, _VOLUME] = 0
     assert validate_bars(df, "TEST") is True
 
 
-def test_validate_bars_negative_volume() -> None:
-    """Test validation fails for negative volume."""
-    df = create_valid_bars()
-    df.loc[df.index[1], "volume"] = -1000  # Second bar (first bar can be zero)
-    with pytest.raises(DataValidationError, match="Zero/negative volume"):
-        validate_bars(df, "TEST")
-
-
 def test_validate_bars_stale_data() -> None:
     """Test validation fails for stale data."""
-    # Create bars from 10 days ago
-    dates = pd.date_range(
-        end=pd.Timestamp.now() - pd.Timedelta(days=10),
-        periods=5,
-        freq="1D"
-    )
-    df = pd.DataFrame({
-        "open": [100.0] * 5,
-        "high": [102.0] * 5,
-        "low": [99.0] * 5,
-        "close": [101.0] * 5,
-        "volume": [1000000] * 5,
-    }, index=dates)
-
     with pytest.raises(DataValidationError, match="Stale data"):
-        validate_bars(df, "TEST", max_staleness_days=2)
+        validate_bars(_STALE_10D, "TEST", max_staleness_days=2, now=_NOW)
 
 
-def test_validate_bars_large_price_jump_warning(caplog: pytest.LogCaptureFixture) -> None:
+def test_validate_bars_large_price_jump_warning(
+    caplog: pytest.LogCaptureFixture, valid_bars: pd.DataFrame
+) -> None:
     """Test validation warns but doesn't fail for large price jumps."""
-    df = create_valid_bars()
-    # Create 60% price jump (suspicious but could be legitimate)
-    df.loc[df.index[1], "close"] = df.loc[df.index[0], "close"] * 1.6
-    df.loc[df.index[1], "high"] = df.loc[df.index[1], "close"] + 1
+    df = valid_bars.copy()
+    # Create 60% price jump over the first close of 101 (suspicious but could be legitimate)
+    jump_close = 101.0 * 1.6
+    df.iloc[1, [_CLOSE, _HIGH]] = [jump_close, jump_close + 1]
 
     # Should pass but log warning
     assert validate_bars(df, "TEST") is True
     assert "Large price jumps" in caplog.text
 
 
-def test_validate_bars_safe_valid() -> None:
+def test_validate_bars_safe_valid(valid_bars: pd.DataFrame) -> None:
     """Test safe wrapper returns True for valid data."""
-    df = create_valid_bars()
-    is_valid, error = validate_bars_safe(df, "TEST")
+    is_valid, error = validate_bars_safe(valid_bars, "TEST")
     assert is_valid is True
     assert error == ""
 
@@ -174,24 +158,20 @@ def test_validate_bars_safe_unexpected_error() -> None:
     assert "Unexpected validation error" in error
 
 
-def test_check_data_quality_batch_all_valid() -> None:
+def test_check_data_quality_batch_all_valid(valid_bars: pd.DataFrame) -> None:
     """Test batch validation with all valid symbols."""
-    data = {
-        "SPY": create_valid_bars(),
-        "QQQ": create_valid_bars(),
-        "IWM": create_valid_bars(),
-    }
+    snapshot = valid_bars.copy()
+    data = dict.fromkeys(("SPY", "QQQ", "IWM"), valid_bars)
     failures = check_data_quality_batch(data)
     assert len(failures) == 0
+    # Validation is read-only, so one frame can back every symbol
+    pd.testing.assert_frame_equal(valid_bars, snapshot)
 
 
-def test_check_data_quality_batch_some_invalid() -> None:
+def test_check_data_quality_batch_some_invalid(valid_bars: pd.DataFrame) -> None:
     """Test batch validation with some invalid symbols."""
-    data = {
-        "SPY": create_valid_bars(),
-        "QQQ": pd.DataFrame(),  # Empty (invalid)
-        "IWM": create_valid_bars(),
-    }
+    data = dict.fromkeys(("SPY", "QQQ", "IWM"), valid_bars)
+    data["QQQ"] = pd.DataFrame()  # Empty (invalid)
     failures = check_data_quality_batch(data)
     assert len(failures) == 1
     assert "QQQ" in failures
@@ -200,14 +180,17 @@ def test_check_data_quality_batch_some_invalid() -> None:
 
 def test_check_data_quality_batch_all_invalid() -> None:
     """Test batch validation with all invalid symbols."""
-    data = {
-        "SPY": pd.DataFrame(),
-        "QQQ": pd.DataFrame(),
-        "IWM": pd.DataFrame(),
-    }
+    data = dict.fromkeys(("SPY", "QQQ", "IWM"), pd.DataFrame())
     failures = check_data_quality_batch(data)
-    assert len(failures) == 3
-    assert all(sym in failures for sym in ["SPY", "QQQ", "IWM"])
+    assert failures.keys() == data.keys()
+
+
+def test_check_data_quality_batch_reference_time() -> None:
+    """Test batch validation checks staleness against the given reference time."""
+    data = {"SPY": _STALE_5D, "QQQ": _STALE_10D}
+    failures = check_data_quality_batch(data, max_staleness_days=7, now=_NOW)
+    assert list(failures) == ["QQQ"]
+    assert "Stale data" in failures["QQQ"]
 
 
 def test_validate_bars_non_datetime_index() -> None:
@@ -225,24 +208,10 @@ def test_validate_bars_non_datetime_index() -> None:
 
 def test_validate_bars_custom_staleness() -> None:
     """Test validation with custom staleness threshold."""
-    # Create bars from 5 days ago
-    dates = pd.date_range(
-        end=pd.Timestamp.now() - pd.Timedelta(days=5),
-        periods=5,
-        freq="1D"
-    )
-    df = pd.DataFrame({
-        "open": [100.0] * 5,
-        "high": [102.0] * 5,
-        "low": [99.0] * 5,
-        "close": [101.0] * 5,
-        "volume": [1000000] * 5,
-    }, index=dates)
-
     # Should fail with 2-day threshold
     with pytest.raises(DataValidationError, match="Stale data"):
-        validate_bars(df, "TEST", max_staleness_days=2)
+        validate_bars(_STALE_5D, "TEST", max_staleness_days=2, now=_NOW)
 
     # Should pass with 10-day threshold
-    assert validate_bars(df, "TEST", max_staleness_days=10) is True
+    assert validate_bars(_STALE_5D, "TEST", max_staleness_days=10, now=_NOW) is True
 
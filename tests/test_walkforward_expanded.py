@@ -0,0 +1,235 @@
+"""Expanded tests for walk-forward module."""
+import copy
+from collections.abc import Callable
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.config import AppConfig
+from src.strategy.backtest import build_backtest_arrays
+from src.strategy.walkforward import (
+    _sample_candidates,
+    _score_params,
+    _score_params_halving,
+    clear_score_cache,
+    grid_search,
+    run_walkforward,
+)
+
+TRAIN_START = datetime(2020, 1, 1)
+TRAIN_END = datetime(2020, 3, 1)
+SINGLE_GRID = {"ema_fast": [5, 10], "ema_slow": [20], "top_n": [1], "corr_cap": [0.7]}
+
+SpyTrend = tuple[dict[str, pd.DataFrame], pd.DataFrame]
+
+
+def _random_walk_ohlcv(seed: int, periods: int) -> dict[str, pd.DataFrame]:
+    """SPY and QQQ business-day bars following seeded geometric random walks."""
+    dates = pd.bdate_range("2020-01-01", periods=periods)
+    rng = np.random.default_rng(seed)
+    data = {}
+    for symbol in ["SPY", "QQQ"]:
+        close = 100 * np.exp(np.cumsum(rng.normal(0.001, 0.01, len(dates))))
+        data[symbol] = pd.DataFrame(
+            {
+                "open": close,
+                "high": close * 1.01,
+                "low": close * 0.99,
+                "close": close,
+                "volume": 1000,
+            },
+            index=dates,
+        )
+    return data
+
+
+def _close_returns(data: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Daily close-to-close returns per symbol, first row zero-filled."""
+    returns = pd.DataFrame({symbol: df["close"].pct_change() for symbol, df in data.items()})
+    return returns.fillna(0.0)
+
+
+def _one_candidate_config(base_config: AppConfig) -> AppConfig:
+    """Copy of the config with one-year/one-month windows and a single grid point."""
+    config = copy.deepcopy(base_config)
+    config.walkforward.train_years = 1
+    config.walkforward.oos_months = 1
+    config.walkforward.reoptimize.ema_fast = [10]
+    config.walkforward.reoptimize.ema_slow = [40]
+    config.walkforward.reoptimize.top_n = [1]
+    config.walkforward.reoptimize.corr_cap = [0.7]
+    return config
+
+
+@pytest.fixture
+def spy_trend(ohlcv_factory: Callable[..., pd.DataFrame]) -> SpyTrend:
+    """80 days of steadily rising SPY bars and their returns."""
+    data = {"SPY": ohlcv_factory(80)}
+    return data, _close_returns(data)
+
+
+def test_grid_search_process_pool_matches_serial(
+    base_config: AppConfig, spy_trend: SpyTrend
+) -> None:
+    """Test parallel grid search picks the same parameters as the serial path."""
+    data, returns = spy_trend
+    config = copy.deepcopy(base_config)
+
+    config.walkforward.n_jobs = 1
+    serial = grid_search(data, returns, config, TRAIN_START, TRAIN_END, param_grid=SINGLE_GRID)
+
+    config.walkforward.n_jobs = 2
+    parallel = grid_search(data, returns, config, TRAIN_START, TRAIN_END, param_grid=SINGLE_GRID)
+
+    assert serial["params"] is not None
+    assert parallel == serial
+
+
+def test_grid_search_reuses_cached_scores(base_config: AppConfig, spy_trend: SpyTrend) -> None:
+    """Test repeating a grid search on the same data skips the backtests."""
+    data, returns = spy_trend
+    config = base_config
+
+    clear_score_cache()
+    first = grid_search(data, returns, config, TRAIN_START, TRAIN_END, param_grid=SINGLE_GRID)
+
+    with patch("src.strategy.walkforward.run_backtest_arrays") as mock_backtest:
+        second = grid_search(data, returns, config, TRAIN_START, TRAIN_END, param_grid=SINGLE_GRID)
+        mock_backtest.assert_not_called()
+
+    assert second == first
+
+
+def test_grid_search_cache_ignores_execution_settings(
+    base_config: AppConfig, spy_trend: SpyTrend
+) -> None:
+    """Test worker counts and permutation backend don't split the score cache."""
+    data, returns = spy_trend
+    config = copy.deepcopy(base_config)
+
+    clear_score_cache()
+    first = grid_search(data, returns, config, TRAIN_START, TRAIN_END, param_grid=SINGLE_GRID)
+
+    config.walkforward.n_jobs = 2
+    config.permutation.n_jobs = 4
+    config.permutation.backend = "process"
+    with patch("src.strategy.walkforward.run_backtest_arrays") as mock_backtest:
+        second = grid_search(data, returns, config, TRAIN_START, TRAIN_END, param_grid=SINGLE_GRID)
+        mock_backtest.assert_not_called()
+
+    assert second == first
+
+
+def test_score_cache_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch, base_config: AppConfig, spy_trend: SpyTrend
+) -> None:
+    """Test a cache hit refreshes the entry so eviction drops the least recently used."""
+    data, returns = spy_trend
+
+    def search(ema_fast: int) -> dict:
+        grid = {"ema_fast": [ema_fast], "ema_slow": [20], "top_n": [1], "corr_cap": [0.7]}
+        return grid_search(data, returns, base_config, TRAIN_START, TRAIN_END, param_grid=grid)
+
+    monkeypatch.setattr("src.strategy.walkforward.SCORE_CACHE_SIZE", 2)
+    clear_score_cache()
+    search(5)
+    search(10)
+    search(5)  # Hit: 10 becomes the least recently used entry
+    search(15)  # Evicts 10, keeps 5
+
+    with patch("src.strategy.walkforward.run_backtest_arrays") as mock_backtest:
+        search(5)
+        mock_backtest.assert_not_called()
+    clear_score_cache()
+
+
+def test_sample_candidates_random() -> None:
+    """Test random search draws distinct valid candidates within the budget."""
+    param_grid = {"ema_fast": [10, 20, 30], "ema_slow": [20, 40, 50], "top_n": [1, 2, 3], "corr_cap": [0.6, 0.7, 0.8]}
+
+    candidates = _sample_candidates(param_grid, "random", n_trials=16, seed=42)
+
+    assert 0 < len(candidates) <= 16
+    assert len(set(candidates)) == len(candidates)
+    assert all(ema_fast < ema_slow for ema_fast, ema_slow, _, _ in candidates)
+    assert candidates == _sample_candidates(param_grid, "random", n_trials=16, seed=42)
+
+
+def test_sample_candidates_sobol() -> None:
+    """Test Sobol search (or its random fallback) stays on the grid."""
+    param_grid = {"ema_fast": [10, 20], "ema_slow": [40, 50], "top_n": [1, 2], "corr_cap": [0.6, 0.7]}
+
+    candidates = _sample_candidates(param_grid, "sobol", n_trials=8, seed=0)
+
+    assert 0 < len(candidates) <= 8
+    for ema_fast, ema_slow, top_n, corr_cap in candidates:
+        assert ema_fast in param_grid["ema_fast"]
+        assert ema_slow in param_grid["ema_slow"]
+        assert top_n in param_grid["top_n"]
+        assert corr_cap in param_grid["corr_cap"]
+
+
+def test_sample_candidates_unknown_mode() -> None:
+    """Test unknown search mode raises."""
+    param_grid = {"ema_fast": [10], "ema_slow": [40], "top_n": [1], "corr_cap": [0.6]}
+
+    with pytest.raises(ValueError):
+        _sample_candidates(param_grid, "bayes", n_trials=4, seed=0)
+
+
+def test_run_walkforward_parallel_windows_match_serial(base_config: AppConfig) -> None:
+    """Test running windows in worker processes gives the serial results."""
+    data = _random_walk_ohlcv(seed=0, periods=540)
+    returns = _close_returns(data)
+    config = _one_candidate_config(base_config)
+
+    config.walkforward.window_jobs = 1
+    serial = run_walkforward(data, returns, config, datetime(2020, 1, 1), datetime(2022, 2, 1))
+
+    config.walkforward.window_jobs = 2
+    parallel = run_walkforward(data, returns, config, datetime(2020, 1, 1), datetime(2022, 2, 1))
+
+    assert len(serial["oos_results"]) == 2
+    assert parallel["chosen_params"] == serial["chosen_params"]
+    pd.testing.assert_series_equal(parallel["oos_equity"], serial["oos_equity"])
+
+
+def test_successive_halving_keeps_exact_scores_for_survivors(base_config: AppConfig) -> None:
+    """Test halving prunes half the grid and survivors keep their full-period score."""
+    data = _random_walk_ohlcv(seed=3, periods=200)
+    dates = data["SPY"].index
+    arrays = build_backtest_arrays(data)
+    train_start, train_end = dates[0], dates[-1]
+    candidates = [(5, 20, 1, 0.7), (10, 20, 1, 0.7), (5, 40, 2, 0.7), (10, 40, 2, 0.7)]
+
+    halving = _score_params_halving(arrays, base_config, train_start, train_end, candidates)
+    full = [_score_params(arrays, base_config, train_start, train_end, p) for p in candidates]
+
+    survivors = [i for i, score in enumerate(halving) if score is not None]
+    assert 0 < len(survivors) <= 2
+    for i in survivors:
+        assert halving[i] == full[i]
+
+
+def test_run_walkforward_streams_windows_to_output_dir(base_config: AppConfig, tmp_path) -> None:
+    """Test streaming window results to disk gives the in-memory results."""
+    data = _random_walk_ohlcv(seed=1, periods=540)
+    returns = _close_returns(data)
+    config = _one_candidate_config(base_config)
+
+    in_memory = run_walkforward(data, returns, config, datetime(2020, 1, 1), datetime(2022, 2, 1))
+    streamed = run_walkforward(
+        data, returns, config, datetime(2020, 1, 1), datetime(2022, 2, 1), output_dir=tmp_path / "wf"
+    )
+
+    assert sorted(path.name for path in (tmp_path / "wf").iterdir()) == [
+        "m_0000.json",
+        "m_0001.json",
+        "oos_0000.parquet",
+        "oos_0001.parquet",
+    ]
+    assert streamed["oos_results"] == in_memory["oos_results"]
+    pd.testing.assert_series_equal(streamed["oos_equity"], in_memory["oos_equity"], check_freq=False)
@@ -3,7 +3,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from src.core.config import load_config
+from src.core.config import AppConfig
 from src.strategy.weighting import (
     apply_cash_buffer,
     apply_weight_caps,
@@ -11,17 +11,15 @@ from src.strategy.weighting import (
     calculate_weights,
 )
 
+# Shared across tests: a fixed seed keeps failures reproducible
+_DATES_50 = pd.date_range("2024-01-01", periods=50, freq="D")
+_RANDN_50X2 = np.random.default_rng(42).standard_normal((50, 2))
+
 
 def test_inverse_vol_weights() -> None:
     """Test inverse-volatility weight calculation."""
-    dates = pd.date_range("2024-01-01", periods=50, freq="D")
-    returns = pd.DataFrame(
-        {
-            "LOW_VOL": np.random.randn(50) * 0.01,  # Low volatility
-            "HIGH_VOL": np.random.randn(50) * 0.05,  # High volatility
-        },
-        index=dates,
-    )
+    # LOW_VOL at 1% daily volatility, HIGH_VOL at 5%
+    returns = pd.DataFrame(_RANDN_50X2 * np.array([0.01, 0.05]), index=_DATES_50, columns=["LOW_VOL", "HIGH_VOL"])
 
     weights = calculate_inverse_vol_weights(["LOW_VOL", "HIGH_VOL"], returns, vol_window=20)
     assert len(weights) == 2
@@ -45,20 +43,12 @@ def test_apply_cash_buffer() -> None:
     assert total == pytest.approx(0.95, abs=0.01)
 
 
-def test_calculate_weights_integration() -> None:
+def test_calculate_weights_integration(base_config: AppConfig) -> None:
     """Test full weight calculation."""
-    dates = pd.date_range("2024-01-01", periods=50, freq="D")
-    returns = pd.DataFrame(
-        {
-            "SPY": np.random.randn(50) * 0.02,
-            "QQQ": np.random.randn(50) * 0.02,
-        },
-        index=dates,
-    )
+    returns = pd.DataFrame(_RANDN_50X2 * 0.02, index=_DATES_50, columns=["SPY", "QQQ"])
 
-    config = load_config()
-    weights = calculate_weights(["SPY", "QQQ"], returns, config)
+    weights = calculate_weights(["SPY", "QQQ"], returns, base_config)
     assert len(weights) == 2
     total = sum(weights.values())
-    expected_total = 1.0 - config.weights.cash_buffer
+    expected_total = 1.0 - base_config.weights.cash_buffer
     assert total == pytest.approx(expected_total, abs=0.01)
@@ -1,7 +1,10 @@
 """Expanded tests for weighting module."""
+import copy
+
+import numpy as np
 import pandas as pd
 
-from src.core.config import load_config
+from src.core.config import AppConfig
 from src.strategy.weighting import (
     apply_cash_buffer,
     apply_weight_caps,
@@ -12,28 +15,28 @@ from src.strategy.weighting import (
 
 def test_calculate_inverse_vol_weights_empty_symbols() -> None:
     """Test inverse vol weights with empty symbol list."""
-    returns = pd.DataFrame({"SPY": [0.001] * 100})
+    returns = pd.DataFrame({"SPY": np.full(100, 0.001)})
     weights = calculate_inverse_vol_weights([], returns)
     assert weights == {}
 
 
 def test_calculate_inverse_vol_weights_missing_symbol() -> None:
     """Test inverse vol weights with symbol not in returns."""
-    returns = pd.DataFrame({"SPY": [0.001] * 100})
+    returns = pd.DataFrame({"SPY": np.full(100, 0.001)})
     weights = calculate_inverse_vol_weights(["QQQ"], returns)
     assert weights == {}
 
 
 def test_calculate_inverse_vol_weights_insufficient_data() -> None:
     """Test inverse vol weights with insufficient data."""
-    returns = pd.DataFrame({"SPY": [0.001] * 5})  # Less than vol_window
+    returns = pd.DataFrame({"SPY": np.full(5, 0.001)})  # Less than vol_window
     weights = calculate_inverse_vol_weights(["SPY"], returns, vol_window=20)
     assert weights == {}
 
 
 def test_calculate_inverse_vol_weights_invalid_volatility() -> None:
     """Test inverse vol weights with invalid volatility."""
-    returns = pd.DataFrame({"SPY": [0.0] * 100})  # Zero volatility
+    returns = pd.DataFrame({"SPY": np.full(100, 0.0)})  # Zero volatility
     weights = calculate_inverse_vol_weights(["SPY"], returns, vol_window=20)
     # Should skip invalid volatility
     assert isinstance(weights, dict)
@@ -52,20 +55,6 @@ def test_apply_weight_caps_no_excess() -> None:
     assert sum(capped.values()) > 0
 
 
-def test_apply_weight_caps_with_excess() -> None:
-    """Test weight caps when weights exceed cap."""
-    weights = {"SPY": 0.7, "QQQ": 0.2}  # SPY exceeds 0.5
-    capped = apply_weight_caps(weights, max_weight_per_asset=0.5)
-    # After redistribution and renormalization, SPY may exceed cap again
-    # This is acceptable behavior - the function caps, redistributes, then renormalizes
-    assert "SPY" in capped
-    assert "QQQ" in capped
-    total = sum(capped.values())
-    assert total > 0
-    # Function renormalizes at the end, so sum should be 1.0
-    assert abs(total - 1.0) < 0.01
-
-
 def test_apply_weight_caps_all_capped() -> None:
     """Test weight caps when all weights exceed cap."""
     weights = {"SPY": 0.6, "QQQ": 0.6}  # Both exceed 0.5
@@ -80,41 +69,27 @@ def test_apply_cash_buffer_empty() -> None:
     assert weights == {}
 
 
-def test_apply_cash_buffer_normal() -> None:
-    """Test cash buffer application."""
-    weights = {"SPY": 0.5, "QQQ": 0.5}
-    buffered = apply_cash_buffer(weights, cash_buffer=0.05)
-    assert sum(buffered.values()) == 0.95
-
-
-def test_calculate_weights_empty_symbols() -> None:
+def test_calculate_weights_empty_symbols(base_config: AppConfig) -> None:
     """Test calculate_weights with empty symbol list."""
-    returns = pd.DataFrame({"SPY": [0.001] * 100})
-    config = load_config()
+    returns = pd.DataFrame({"SPY": np.full(100, 0.001)})
 
-    weights = calculate_weights([], returns, config)
+    weights = calculate_weights([], returns, base_config)
     assert weights == {}
 
 
-def test_calculate_weights_no_valid_weights() -> None:
+def test_calculate_weights_no_valid_weights(base_config: AppConfig) -> None:
     """Test calculate_weights when no valid weights can be calculated."""
-    returns = pd.DataFrame({"SPY": [0.0] * 10})  # Insufficient/invalid data
-    config = load_config()
+    returns = pd.DataFrame({"SPY": np.full(10, 0.0)})  # Insufficient/invalid data
 
-    weights = calculate_weights(["SPY"], returns, config)
+    weights = calculate_weights(["SPY"], returns, base_config)
     assert isinstance(weights, dict)
 
 
-def test_calculate_weights_weight_sum_mismatch() -> None:
+def test_calculate_weights_weight_sum_mismatch(base_config: AppConfig) -> None:
     """Test calculate_weights when weight sum doesn't match expected."""
     dates = pd.date_range("2020-01-01", periods=100, freq="D")
-    returns = pd.DataFrame(
-        {
-            "SPY": pd.Series(0.001, index=dates),
-            "QQQ": pd.Series(0.001, index=dates),
-        }
-    )
-    config = load_config()
+    returns = pd.DataFrame(np.full((100, 2), 0.001), index=dates, columns=["SPY", "QQQ"])
+    config = copy.deepcopy(base_config)
     config.weights.cash_buffer = 0.05
 
     weights = calculate_weights(["SPY", "QQQ"], returns, config)
@@ -124,3 +99,59 @@ def test_calculate_weights_weight_sum_mismatch() -> None:
         total = sum(weights.values())
         expected = 1.0 - config.weights.cash_buffer
         assert abs(total - expected) < 0.02  # Allow small tolerance
+
+
+def test_apply_weight_caps_preserves_order_and_redistributes() -> None:
+    """Test weight caps redistribute excess proportionally and keep symbol order."""
+    weights = {"A": 0.7, "B": 0.2, "C": 0.1}
+    capped = apply_weight_caps(weights, max_weight_per_asset=0.5)
+    assert list(capped) == ["A", "B", "C"]
+    assert abs(capped["A"] - 0.5) < 1e-9
+    assert abs(capped["B"] - (0.2 + 0.2 * 2 / 3)) < 1e-9
+    assert abs(sum(capped.values()) - 1.0) < 1e-9
+
+
+def test_apply_weight_caps_nan_weight_still_redistributes() -> None:
+    """Test a NaN weight doesn't stop the excess from being redistributed."""
+    capped = apply_weight_caps({"A": np.nan, "B": 0.7, "C": 0.3}, max_weight_per_asset=0.5)
+    assert np.isnan(capped["A"])
+    assert abs(capped["B"] - 0.5) < 1e-9
+    assert abs(capped["C"] - 0.5) < 1e-9
+
+
+def test_calculate_weights_matches_staged_pipeline(base_config: AppConfig) -> None:
+    """Test fused weighting equals inverse-vol, caps and cash buffer applied in stages."""
+    dates = pd.date_range("2020-01-01", periods=60, freq="D")
+    returns = pd.DataFrame(
+        {
+            "LOW": [0.001, -0.001] * 30,
+            "MID": [0.01, -0.01] * 30,
+            "HIGH": [0.03, -0.03] * 30,
+        },
+        index=dates,
+    )
+    config = copy.deepcopy(base_config)
+    config.weights.max_weight_per_asset = 0.5
+
+    weights = calculate_weights(["LOW", "MID", "HIGH"], returns, config)
+
+    staged = calculate_inverse_vol_weights(["LOW", "MID", "HIGH"], returns, vol_window=config.weights.vol_window)
+    staged = apply_weight_caps(staged, config.weights.max_weight_per_asset)
+    staged = apply_cash_buffer(staged, config.weights.cash_buffer)
+
+    assert list(weights) == list(staged)
+    for symbol in staged:
+        assert abs(weights[symbol] - staged[symbol]) < 1e-12
+
+
+def test_calculate_inverse_vol_weights_gappy_column() -> None:
+    """Test a missing bar keeps the symbol, using its last vol_window non-NaN returns."""
+    returns = pd.DataFrame({"A": [0.01, -0.01] * 15, "B": [0.02, -0.02] * 15})
+    returns.iloc[25, 1] = np.nan
+
+    weights = calculate_inverse_vol_weights(["A", "B"], returns, vol_window=20)
+
+    expected_b_vol = returns["B"].dropna().tail(20).std()
+    expected_inv = np.array([1.0 / returns["A"].tail(20).std(), 1.0 / expected_b_vol])
+    assert list(weights) == ["A", "B"]
+    assert np.allclose([weights["A"], weights["B"]], expected_inv / expected_inv.sum())
@@ -0,0 +1,42 @@
+"""Tests for YOLO trader scheduling."""
+from datetime import datetime
+from unittest.mock import Mock
+
+from src.core.clock import ET
+from src.core.config import load_config
+from src.sentiment.aggregator import SentimentAggregator
+from src.strategy.yolo_trader import YOLOTrader
+
+
+def test_is_market_open_hours() -> None:
+    """Test market-hours check uses ET regular trading hours."""
+    trader = YOLOTrader(load_config(), Mock(), Mock(), Mock())
+
+    assert trader._is_market_open(ET.localize(datetime(2024, 1, 3, 10, 0))) is True
+    assert trader._is_market_open(ET.localize(datetime(2024, 1, 3, 16, 30))) is False
+    assert trader._is_market_open(ET.localize(datetime(2024, 1, 6, 12, 0))) is False  # Saturday
+
+
+def test_seconds_until_open_skips_weekend() -> None:
+    """Test next-open calculation rolls Friday evening to Monday morning."""
+    trader = YOLOTrader(load_config(), Mock(), Mock(), Mock())
+
+    friday_evening = ET.localize(datetime(2024, 1, 5, 17, 0))
+    assert trader._seconds_until_open(friday_evening) == 64.5 * 3600
+
+    early_morning = ET.localize(datetime(2024, 1, 3, 8, 0))
+    assert trader._seconds_until_open(early_morning) == 1.5 * 3600
+
+
+def test_top_yolo_picks_scores_held_ticker_in_batch() -> None:
+    """Test the held ticker is scored once alongside the universe but not ranked."""
+    aggregator = SentimentAggregator.__new__(SentimentAggregator)
+    aggregator.last_scores = {}
+    scores = {"AAA": 5.0, "BBB": 9.0, "HELD": 20.0}
+    aggregator.calculate_yolo_score = Mock(side_effect=lambda t: (scores[t], {"total": scores[t]}))
+
+    picks = aggregator.get_top_yolo_picks(["AAA", "BBB"], top_n=2, always_include=["HELD"])
+
+    assert [ticker for ticker, _, _ in picks] == ["BBB", "AAA"]
+    assert aggregator.last_scores["HELD"][0] == 20.0
+    assert aggregator.calculate_yolo_score.call_count == 3